@@ -0,0 +1,201 @@
+"""
+Answer Bank for Interview Whisperer
+
+Answers to common interview questions, generated in a batch after the
+documents are processed. At runtime a detected question is matched to
+its nearest bank question, and the stored answer is shown immediately
+while a fresh answer is generated only if the match is loose or the
+stored answer is weak.
+
+The bank is a SemanticAnswerCache that also keeps each question's
+retrieval context, and is invalidated the same way: answers generated
+for an older index are dropped once documents or models change.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    from .answer_cache import SemanticAnswerCache
+except ImportError:
+    # Fallback for direct execution
+    from answer_cache import SemanticAnswerCache
+
+logger = logging.getLogger(__name__)
+
+
+# Built-in questions: the examples from the interview guide, the practice
+# questions, and the usual behavioral openers
+DEFAULT_QUESTIONS = [
+    "Tell me about yourself.",
+    "Walk me through your resume.",
+    "Why do you want to work here?",
+    "Why are you leaving your current role?",
+    "What are your greatest strengths?",
+    "What is your biggest weakness?",
+    "What's your biggest achievement?",
+    "Where do you see yourself in five years?",
+    "Tell me about a time you had to prioritize features.",
+    "How do you prioritize features?",
+    "How do you handle stakeholder disagreements?",
+    "Describe a time you handled a difficult stakeholder.",
+    "Tell me about a time you disagreed with engineering.",
+    "Tell me about a time you failed.",
+    "Tell me about a time you led a team.",
+    "Explain your approach to user research.",
+    "How do you measure product success?",
+    "What metrics would you track for a new product?",
+    "What's your experience with agile development?",
+    "Tell me about your experience with product management.",
+    "What technical skills do you have?",
+    "Design a product for busy parents to plan meals.",
+    "How many gas stations are in the United States?",
+    "Should Facebook enter the dating market?",
+    "What questions do you have for us?",
+]
+
+# answer_fn(question) -> result dict with 'answer', 'confidence', 'sources',
+# 'context_used' and 'context'
+AnswerFn = Callable[[str], Dict[str, Any]]
+EmbedFn = Callable[[str], Sequence[float]]
+
+
+def load_questions(path: Union[str, Path, None] = None,
+                   extra: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Build the question list: built-in questions plus user-supplied ones.
+
+    Args:
+        path: Optional text file with one question per line ('#' comments)
+        extra: Optional additional questions
+
+    Returns:
+        Questions in order, without case-insensitive duplicates
+    """
+    questions = list(DEFAULT_QUESTIONS)
+    if path is not None and Path(path).exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            questions.extend(line.strip() for line in f if line.strip() and not line.lstrip().startswith('#'))
+    if extra:
+        questions.extend(q.strip() for q in extra if q.strip())
+
+    seen = set()
+    unique = []
+    for question in questions:
+        key = question.lower().rstrip('?.! ')
+        if key not in seen:
+            seen.add(key)
+            unique.append(question)
+    return unique
+
+
+class AnswerBank(SemanticAnswerCache):
+    """
+    Pre-generated answers with their retrieval contexts.
+
+    Usage:
+        bank = AnswerBank(DATA_DIR / "answer_bank")
+        bank.build(questions, answer_fn, embed_fn, fingerprint, workers=4)
+        hit = bank.lookup(embedding, fingerprint)    # (entry, similarity) or None
+    """
+
+    RESULT_FIELDS = SemanticAnswerCache.RESULT_FIELDS + ('context',)
+
+    # Related bank questions ("How do you prioritize features?" / "Tell me
+    # about a time you had to prioritize features") are both kept
+    DUPLICATE_SIMILARITY = 0.98
+
+    def __init__(self, path: Union[str, Path], threshold: float = 0.85, max_entries: int = 1000):
+        """
+        Initialize the bank and load any persisted answers.
+
+        Args:
+            path: File path without extension for the bank files
+            threshold: Minimum cosine similarity to the nearest bank question
+            max_entries: Maximum stored answers
+        """
+        super().__init__(path, threshold=threshold, max_entries=max_entries)
+        self.last_build: Optional[Dict[str, Any]] = None
+
+    def build(
+        self,
+        questions: Sequence[str],
+        answer_fn: AnswerFn,
+        embed_fn: EmbedFn,
+        fingerprint: str,
+        workers: int = 4,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate and store answers for every question, replacing the bank.
+
+        Questions are answered concurrently; Ollama queues (or, with
+        OLLAMA_NUM_PARALLEL, batches) the requests.
+
+        Args:
+            questions: Questions to answer
+            answer_fn: Returns a result dictionary (with 'context') for a question
+            embed_fn: Returns the embedding for a question
+            fingerprint: Index fingerprint the answers are generated under
+            workers: Concurrent generation requests
+            progress_callback: Optional callback function(current, total, message)
+
+        Returns:
+            Statistics dictionary with question, stored and failed counts,
+            errors and elapsed seconds
+        """
+        stats = {'questions': len(questions), 'stored': 0, 'failed': 0, 'errors': [], 'elapsed': 0.0}
+        start = time.time()
+        self.clear()
+
+        def answer(question: str):
+            result = answer_fn(question)
+            if 'error' in result or not result.get('answer'):
+                raise RuntimeError(result.get('error', 'empty answer'))
+            return result, embed_fn(question)
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="AnswerBank") as executor:
+            futures = {executor.submit(answer, q): q for q in questions}
+            for future in as_completed(futures):
+                question = futures[future]
+                try:
+                    result, embedding = future.result()
+                    self.store(question, embedding, result, fingerprint)
+                    stats['stored'] += 1
+                except Exception as e:
+                    stats['failed'] += 1
+                    stats['errors'].append(f"{question}: {e}")
+                    logger.warning(f"Answer bank: failed to answer '{question}': {e}")
+
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(questions), f"Pre-answering: {question[:50]}")
+
+        stats['elapsed'] = round(time.time() - start, 2)
+        self.last_build = {k: v for k, v in stats.items() if k != 'errors'}
+        self.last_build['built_at'] = time.time()
+        logger.info(
+            f"Answer bank built: {stats['stored']}/{stats['questions']} questions "
+            f"in {stats['elapsed']:.1f}s"
+        )
+        return stats
+
+    def is_current(self, fingerprint: str) -> bool:
+        """Whether the bank holds answers generated under this fingerprint."""
+        with self._lock:
+            return bool(self._entries) and self._fingerprint == fingerprint
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get bank statistics.
+
+        Returns:
+            Answer cache statistics plus the last build's counts
+        """
+        stats = super().get_stats()
+        stats['last_build'] = self.last_build
+        return stats
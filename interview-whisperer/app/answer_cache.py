@@ -0,0 +1,279 @@
+"""
+Answer Cache for Interview Whisperer
+
+Persistent semantic cache of generated answers. Entries are keyed by the
+question's embedding and matched by cosine similarity, so a rephrased
+repeat of an earlier question ("tell me about yourself" / "can you tell
+me a bit about yourself") is answered instantly without retrieval or
+generation.
+
+Every entry belongs to an index fingerprint (LLM model, embedding model,
+collection identity and contents). When the fingerprint changes - new
+documents were indexed, the database was cleared, or a model changed -
+the cached answers are stale and are dropped on the next lookup.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticAnswerCache:
+    """
+    Answers keyed by normalized question embeddings.
+
+    Usage:
+        cache = SemanticAnswerCache(DATA_DIR / "answer_cache")
+        hit = cache.lookup(embedding, fingerprint)     # (entry, similarity) or None
+        cache.store(question, embedding, result, fingerprint)
+
+    Stored as two files next to each other: ``<path>.npy`` holds the
+    embedding matrix (one normalized row per entry) and ``<path>.json``
+    the answers and the fingerprint they were generated under.
+    """
+
+    # Result fields kept for each cached answer
+    RESULT_FIELDS = ('answer', 'confidence', 'sources', 'context_used')
+
+    # Similarity at which a new entry replaces an existing one (None: threshold)
+    DUPLICATE_SIMILARITY: Optional[float] = None
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        threshold: float = 0.92,
+        max_entries: int = 500,
+        max_age: Optional[float] = None
+    ):
+        """
+        Initialize the cache and load any persisted entries.
+
+        Args:
+            path: File path without extension for the cache files
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum cached answers (least recently used evicted)
+            max_age: Seconds after which an entry is stale (None keeps entries
+                until the index fingerprint changes)
+        """
+        self.path = Path(path)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[str] = None
+        self._entries: List[Dict[str, Any]] = []
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.stale_dropped = 0
+
+        self._load()
+
+    @property
+    def _json_path(self) -> Path:
+        return self.path.with_suffix('.json')
+
+    @property
+    def _npy_path(self) -> Path:
+        return self.path.with_suffix('.npy')
+
+    def lookup(
+        self,
+        embedding: Sequence[float],
+        fingerprint: str
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Find a cached answer for a question.
+
+        Args:
+            embedding: Question embedding
+            fingerprint: Current index fingerprint; entries from another
+                fingerprint are stale and dropped
+
+        Returns:
+            Tuple of (entry, similarity) for the best match at or above the
+            threshold, or None
+        """
+        query = _normalize(embedding)
+
+        with self._lock:
+            self._invalidate_if_stale(fingerprint)
+            self._expire()
+
+            if not self._entries or self._vectors.shape[1] != query.shape[0]:
+                self.misses += 1
+                return None
+
+            similarities = self._vectors @ query
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            if similarity < self.threshold:
+                self.misses += 1
+                return None
+
+            entry = self._entries[best]
+            entry['hits'] = entry.get('hits', 0) + 1
+            entry['last_used'] = time.time()
+            self.hits += 1
+            return dict(entry), similarity
+
+    def store(
+        self,
+        question: str,
+        embedding: Sequence[float],
+        result: Dict[str, Any],
+        fingerprint: str
+    ) -> None:
+        """
+        Cache a generated answer and persist the cache.
+
+        Args:
+            question: Question the answer was generated for
+            embedding: Question embedding
+            result: Result dictionary from the LLM engine
+            fingerprint: Index fingerprint the answer was generated under
+        """
+        vector = _normalize(embedding)
+        entry = {field: result.get(field) for field in self.RESULT_FIELDS}
+        entry.update({'question': question, 'created_at': time.time(), 'last_used': time.time(), 'hits': 0})
+
+        with self._lock:
+            self._invalidate_if_stale(fingerprint)
+            if self._entries and self._vectors.shape[1] != vector.shape[0]:
+                # Same fingerprint but a different dimension: start over
+                self._drop_all()
+
+            # A near-duplicate question replaces the older answer
+            if self._entries:
+                similarities = self._vectors @ vector
+                best = int(np.argmax(similarities))
+                if similarities[best] >= (self.DUPLICATE_SIMILARITY or self.threshold):
+                    self._remove(best)
+
+            self._entries.append(entry)
+            self._vectors = vector[None, :] if not len(self._vectors) else np.vstack([self._vectors, vector])
+
+            while len(self._entries) > self.max_entries:
+                self._remove(min(range(len(self._entries)), key=lambda i: self._entries[i]['last_used']))
+
+            self._save()
+
+    def clear(self) -> None:
+        """Drop every cached answer (the files are rewritten empty)."""
+        with self._lock:
+            self._drop_all()
+            self._save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, hit rate, invalidations, stale
+            entries dropped and the age of the oldest entry
+        """
+        with self._lock:
+            now = time.time()
+            oldest = min((e['created_at'] for e in self._entries), default=None)
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'threshold': self.threshold,
+                'invalidations': self.invalidations,
+                'stale_dropped': self.stale_dropped,
+                'oldest_entry_age': round(now - oldest, 1) if oldest is not None else None
+            }
+
+    # -------------------------------------------------------------------------
+    # Internals (lock held)
+    # -------------------------------------------------------------------------
+
+    def _invalidate_if_stale(self, fingerprint: str) -> None:
+        """Drop every entry generated under a different fingerprint."""
+        if fingerprint == self._fingerprint:
+            return
+        stale = len(self._entries)
+        self._fingerprint = fingerprint
+        if stale:
+            logger.info(f"Answer cache invalidated: index changed ({stale} stale answers dropped)")
+            self.invalidations += 1
+            self.stale_dropped += stale
+            self._drop_all()
+            self._save()
+
+    def _expire(self) -> None:
+        """Drop entries older than max_age."""
+        if self.max_age is None:
+            return
+        cutoff = time.time() - self.max_age
+        expired = [i for i, e in enumerate(self._entries) if e['created_at'] < cutoff]
+        for index in reversed(expired):
+            self._remove(index)
+        if expired:
+            self.stale_dropped += len(expired)
+            self._save()
+
+    def _remove(self, index: int) -> None:
+        del self._entries[index]
+        self._vectors = np.delete(self._vectors, index, axis=0)
+
+    def _drop_all(self) -> None:
+        self._entries = []
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def _load(self) -> None:
+        """Load persisted entries (a missing or corrupt cache starts empty)."""
+        if not self._json_path.exists() or not self._npy_path.exists():
+            return
+        try:
+            with open(self._json_path, 'r') as f:
+                data = json.load(f)
+            vectors = np.load(self._npy_path)
+            entries = data.get('entries', [])
+            if len(entries) != len(vectors):
+                raise ValueError("entry and embedding counts differ")
+
+            self._fingerprint = data.get('fingerprint')
+            self._entries = entries
+            self._vectors = vectors.astype(np.float32, copy=False)
+            logger.info(f"Loaded {len(entries)} cached answers from {self._json_path}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable answer cache: {e}")
+            self._drop_all()
+
+    def _save(self) -> None:
+        """Write both files atomically (temp file + rename)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            npy_tmp = self._npy_path.with_suffix('.npy.tmp')
+            with open(npy_tmp, 'wb') as f:
+                np.save(f, self._vectors)
+            json_tmp = self._json_path.with_suffix('.json.tmp')
+            with open(json_tmp, 'w') as f:
+                json.dump({'fingerprint': self._fingerprint, 'entries': self._entries}, f)
+            os.replace(npy_tmp, self._npy_path)
+            os.replace(json_tmp, self._json_path)
+        except Exception as e:
+            logger.warning(f"Failed to persist answer cache: {e}")
+
+
+def _normalize(embedding: Sequence[float]) -> np.ndarray:
+    """Unit-length float32 vector, so a dot product is the cosine similarity."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
@@ -0,0 +1,363 @@
+"""
+Audio Buffers for Interview Whisperer
+
+Preallocated float32 ring buffer shared between the sounddevice callback
+(single producer) and the capture thread (single consumer), the chunk
+type handed from the capture thread to transcription, and the bounded
+queue between them.
+
+The callback only copies each incoming block into the ring; it never
+allocates, boxes samples into Python objects, or builds arrays.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    Fixed-size float32 ring buffer with zero-copy read views.
+
+    Features:
+    - One preallocated array, no allocation on the audio thread
+    - Single-producer / single-consumer, lock-free on the write path
+    - Zero-copy read views for reads that do not cross the wrap point
+    - Overflow and underrun counters
+
+    Reads are zero-copy when the capacity is a multiple of the read size
+    and the consumer always reads in that size (the capture loop reads
+    whole chunks), because no read then straddles the end of the array.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the ring buffer.
+
+        Args:
+            capacity: Number of float32 samples the ring can hold
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"Ring buffer capacity must be positive, got {capacity}")
+
+        self.capacity = int(capacity)
+        self._buffer = np.zeros(self.capacity, dtype=np.float32)
+
+        # Monotonic sample counters (positions are counter % capacity)
+        self._written = 0
+        self._read = 0
+
+        # Health counters
+        self.overflow_count = 0
+        self.dropped_samples = 0
+        self.underrun_count = 0
+
+        # Signalled by the producer after each write
+        self._data_ready = threading.Event()
+
+    @property
+    def available(self) -> int:
+        """Number of samples written but not yet consumed."""
+        return self._written - self._read
+
+    @property
+    def free(self) -> int:
+        """Number of samples that can be written without overflowing."""
+        return self.capacity - self.available
+
+    def write(self, block: np.ndarray) -> int:
+        """
+        Copy a block of samples into the ring (producer side).
+
+        Samples that do not fit are dropped and counted as an overflow;
+        unread data is never overwritten.
+
+        Args:
+            block: 1-D array of samples (any float dtype, may be strided)
+
+        Returns:
+            Number of samples written
+        """
+        n = len(block)
+        free = self.free
+        if n > free:
+            self.overflow_count += 1
+            self.dropped_samples += n - free
+            block = block[:free]
+            n = free
+
+        if n == 0:
+            return 0
+
+        start = self._written % self.capacity
+        first = min(n, self.capacity - start)
+        np.copyto(self._buffer[start:start + first], block[:first], casting='same_kind')
+        if first < n:
+            # Wrap around: remainder goes to the front of the array
+            np.copyto(self._buffer[:n - first], block[first:], casting='same_kind')
+
+        self._written += n
+        self._data_ready.set()
+        return n
+
+    def read_view(self, n: int) -> np.ndarray:
+        """
+        Return the next ``n`` unread samples without consuming them.
+
+        The result is a view into the ring when the range is contiguous and
+        a copy only if it straddles the wrap point. Views stay valid until
+        ``consume`` is called; copy them if they must outlive that.
+
+        Args:
+            n: Number of samples to read
+
+        Returns:
+            float32 array of length ``n``
+
+        Raises:
+            ValueError: If fewer than ``n`` samples are available
+        """
+        if n > self.available:
+            self.underrun_count += 1
+            raise ValueError(f"Ring buffer underrun: requested {n}, available {self.available}")
+
+        start = self._read % self.capacity
+        end = start + n
+        if end <= self.capacity:
+            return self._buffer[start:end]
+
+        return np.concatenate((self._buffer[start:], self._buffer[:end - self.capacity]))
+
+    def consume(self, n: int) -> None:
+        """
+        Mark ``n`` samples as read, freeing space for the producer.
+
+        Args:
+            n: Number of samples to release
+        """
+        self._read += min(n, self.available)
+
+    def wait_for_data(self, timeout: float) -> bool:
+        """
+        Block until the producer writes, or until timeout.
+
+        The signal is reset on return, so callers should drain everything
+        they can before waiting again.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if data was written since the previous wait
+        """
+        ready = self._data_ready.wait(timeout)
+        self._data_ready.clear()
+        return ready
+
+    def clear(self) -> None:
+        """Discard unread samples (counters are kept for status reporting)."""
+        self._read = self._written
+        self._data_ready.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get buffer statistics.
+
+        Returns:
+            Dictionary with capacity, fill level and health counters
+        """
+        return {
+            'capacity': self.capacity,
+            'available': self.available,
+            'overflows': self.overflow_count,
+            'dropped_samples': self.dropped_samples,
+            'underruns': self.underrun_count
+        }
+
+
+@dataclass
+class AudioChunk:
+    """A block of audio queued for transcription."""
+    audio: np.ndarray
+    captured_at: float  # time.time() when the last sample was captured
+    endpointed: bool = False  # True if the chunk ends at a detected pause
+    enqueued_at: float = 0.0  # time.time() when the chunk entered the queue
+
+
+class AudioChunkQueue:
+    """
+    Bounded chunk queue between capture and transcription.
+
+    When transcription falls behind and the queue is full, ``policy``
+    decides what happens to the backlog:
+
+    - "drop_oldest": discard the oldest queued chunk (stay close to live)
+    - "drop_newest": discard the incoming chunk (keep what is queued)
+    - "coalesce": merge the backlog and the incoming chunk into one longer
+      chunk, so one decode catches up on everything (the merged audio is
+      capped at ``max_coalesce_samples``, keeping the most recent part)
+
+    ``put(chunk, block=True)`` instead waits for space, for producers that
+    can be paused (offline replay) and should never lose audio.
+
+    ``get`` records each chunk's age at dequeue (now - captured_at), which
+    tells the consumer how far behind real time it is running.
+    """
+
+    POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+    def __init__(self, maxsize: int = 8, policy: str = "drop_oldest",
+                 max_coalesce_samples: Optional[int] = None):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued chunks
+            policy: Overflow policy ("drop_oldest", "drop_newest" or "coalesce")
+            max_coalesce_samples: Upper bound on a coalesced chunk's length
+                (None for no bound)
+
+        Raises:
+            ValueError: If maxsize < 1 or the policy is unknown
+        """
+        if maxsize < 1:
+            raise ValueError("Queue size must be at least 1")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.max_coalesce_samples = max_coalesce_samples
+        self._chunks: Deque[AudioChunk] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+        # Backpressure counters
+        self.dropped_chunks = 0
+        self.coalesced_chunks = 0
+        self.trimmed_samples = 0
+
+        # Age at dequeue (seconds)
+        self.last_age = 0.0
+        self.max_age = 0.0
+        self._age_total = 0.0
+        self._dequeued = 0
+
+    def qsize(self) -> int:
+        """Number of queued chunks."""
+        return len(self._chunks)
+
+    def put(self, chunk: AudioChunk, block: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a chunk, applying the overflow policy if the queue is full.
+
+        Args:
+            chunk: Chunk to queue
+            block: Wait for space instead of applying the policy
+            timeout: Maximum seconds to wait when blocking (None waits indefinitely)
+
+        Returns:
+            False if the chunk was not queued (dropped by drop_newest, or
+            no space within the timeout), else True
+        """
+        with self._lock:
+            if block:
+                if not self._not_full.wait_for(lambda: len(self._chunks) < self.maxsize, timeout=timeout):
+                    return False
+            elif len(self._chunks) >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped_chunks += 1
+                    return False
+                if self.policy == "drop_oldest":
+                    self._chunks.popleft()
+                    self.dropped_chunks += 1
+                else:
+                    chunk = self._coalesce(chunk)
+
+            chunk.enqueued_at = time.time()
+            self._chunks.append(chunk)
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> AudioChunk:
+        """
+        Dequeue the oldest chunk and record its age.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The dequeued chunk
+
+        Raises:
+            queue.Empty: If no chunk arrived within the timeout
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._chunks, timeout=timeout):
+                raise queue.Empty
+            chunk = self._chunks.popleft()
+            self._not_full.notify()
+
+            age = max(0.0, time.time() - chunk.captured_at)
+            self.last_age = age
+            self.max_age = max(self.max_age, age)
+            self._age_total += age
+            self._dequeued += 1
+            return chunk
+
+    def clear(self) -> None:
+        """Discard queued chunks (counters are kept for status reporting)."""
+        with self._lock:
+            self._chunks.clear()
+            self._not_full.notify_all()
+
+    def _coalesce(self, chunk: AudioChunk) -> AudioChunk:
+        """Merge every queued chunk and ``chunk`` into one (lock held)."""
+        backlog = list(self._chunks) + [chunk]
+        self._chunks.clear()
+        self.coalesced_chunks += len(backlog) - 1
+
+        audio = np.concatenate([c.audio for c in backlog])
+        if self.max_coalesce_samples is not None and len(audio) > self.max_coalesce_samples:
+            self.trimmed_samples += len(audio) - self.max_coalesce_samples
+            audio = audio[-self.max_coalesce_samples:]
+
+            # Drop the chunks whose audio was trimmed away entirely
+            kept = 0
+            for first in range(len(backlog) - 1, -1, -1):
+                kept += len(backlog[first].audio)
+                if kept >= len(audio):
+                    break
+            backlog = backlog[first:]
+
+        # Age is measured from the oldest audio in the merged chunk
+        return AudioChunk(audio, backlog[0].captured_at, endpointed=chunk.endpointed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with depth, policy, drop/coalesce counters and
+            age-at-dequeue (last, max, average) in seconds
+        """
+        return {
+            'depth': self.qsize(),
+            'maxsize': self.maxsize,
+            'policy': self.policy,
+            'dropped_chunks': self.dropped_chunks,
+            'coalesced_chunks': self.coalesced_chunks,
+            'trimmed_samples': self.trimmed_samples,
+            'last_age': round(self.last_age, 3),
+            'max_age': round(self.max_age, 3),
+            'avg_age': round(self._age_total / self._dequeued, 3) if self._dequeued else 0.0
+        }
@@ -6,16 +6,34 @@ Real-time audio capture and transcription using Whisper
 Optimized for M3 Mac with fast, efficient processing.
 """
 
+import math
 import threading
 import queue
 import time
 import numpy as np
-import sounddevice as sd
-import whisper
-from typing import Callable, Dict, Optional, Tuple
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+try:
+    from .audio_buffer import AudioChunk, AudioChunkQueue, AudioRingBuffer
+    from .audio_sources import AudioSource, MicrophoneSource
+    from .latency_trace import LatencyTrace
+    from .model_registry import model_registry
+    from .streaming_transcriber import StreamingTranscriber
+    from .transcription_pool import TranscriptionPool
+    from .vad import VADSegmenter
+except ImportError:
+    # Fallback for direct execution
+    from audio_buffer import AudioChunk, AudioChunkQueue, AudioRingBuffer
+    from audio_sources import AudioSource, MicrophoneSource
+    from latency_trace import LatencyTrace
+    from model_registry import model_registry
+    from streaming_transcriber import StreamingTranscriber
+    from transcription_pool import TranscriptionPool
+    from vad import VADSegmenter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,10 +44,18 @@ class AudioConfig:
     """Audio configuration parameters."""
     sample_rate: int = 16000  # Whisper standard
     channels: int = 1  # Mono
-    chunk_duration: float = 5.0  # Seconds per transcription chunk
+    chunk_duration: float = 5.0  # Seconds per transcription chunk (fixed segmentation)
+    segmentation: str = "vad"  # "vad" (one chunk per utterance) or "fixed"
     silence_threshold: float = 0.01  # Amplitude threshold for silence
     silence_duration: float = 1.5  # Seconds of silence after question
     context_duration: float = 30.0  # Seconds of context to keep
+    streaming: bool = False  # Re-decode a sliding window instead of fixed chunks
+    stream_step: float = 1.0  # Seconds of new audio between streaming decodes
+    stream_window: float = 10.0  # Max seconds re-decoded per streaming step
+    transcription_workers: int = 1  # >1 decodes chunks in parallel worker processes
+    queue_size: int = 8  # Max chunks waiting for transcription
+    queue_policy: str = "coalesce"  # "drop_oldest", "drop_newest" or "coalesce" when full
+    max_chunk_age: float = 10.0  # Seconds of queueing delay counted as behind real time
 
 
 class AudioEngine:
@@ -38,59 +64,136 @@ class AudioEngine:
 
     Features:
     - Non-blocking audio capture
-    - Chunked transcription (5-second intervals)
+    - Pluggable audio source (microphone, or recorded audio for replay)
+    - Utterance segmentation by voice activity detection
+      (or fixed 5-second chunks)
+    - Optional streaming mode (sliding window, partial + final text)
     - Question detection (ends with "?")
     - Context accumulation (30 seconds)
     - Thread-safe operations
+    - Preallocated ring buffer (no allocation in the audio callback)
+    - Background model loading through the shared model registry
+    - Optional worker-process pool for parallel, in-order transcription
+    - Bounded transcription queue with drop/coalesce backpressure
     """
 
-    def __init__(self, model: str = "base", language: str = "en", config: Optional[AudioConfig] = None):
+    # Ring buffer holds at least this many blocks and this many seconds
+    RING_BUFFER_CHUNKS = 4
+    RING_BUFFER_SECONDS = 20.0
+
+    # Seconds of audio handed to the VAD per read (a whole number of frames)
+    VAD_READ_DURATION = 0.1
+
+    # Longest chunk Whisper decodes in one pass (caps coalesced backlog)
+    MAX_DECODE_SECONDS = 30.0
+
+    def __init__(self, model: str = "base", language: str = "en", config: Optional[AudioConfig] = None,
+                 device: Optional[str] = None, precision: str = "fp32",
+                 source: Optional[AudioSource] = None):
         """
         Initialize the audio engine.
 
+        The Whisper model is loaded in the background by the shared model
+        registry; construction returns immediately. Audio captured before
+        the model is ready is queued and transcribed once it loads.
+
         Args:
             model: Whisper model size ("tiny", "base", "small", "medium", "large")
                   "base" is recommended for M3 Mac (fast + accurate enough)
             language: Language code for transcription ("en" for English)
             config: Optional custom AudioConfig. If None, uses defaults.
+            device: Torch device for the model (None lets Whisper choose)
+            precision: "fp32" (recommended for M-series Macs) or "fp16"
+            source: Audio input (None uses the default microphone). Finite
+                    sources such as FileSource end the session when exhausted.
         """
         self.config = config if config is not None else AudioConfig()
         self.language = language
         self.model_name = model
+        self.device = device
+        self.precision = precision
+        self.source = source if source is not None else MicrophoneSource()
 
         # State
         self._is_listening = False
         self._audio_thread: Optional[threading.Thread] = None
         self._transcription_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._capture_finished = threading.Event()
 
         # Audio buffers
-        self._audio_queue: queue.Queue = queue.Queue()
-        self._audio_buffer = []
+        self._audio_queue: AudioChunkQueue = self._create_queue()
+        self._ring: AudioRingBuffer = self._create_ring_buffer()
+        self._vad: VADSegmenter = self._create_vad()
+        self._input_overflows = 0
+        self._input_underflows = 0
 
         # Transcription state
         self._callback: Optional[Callable[[str, bool], None]] = None
+        self._partial_callback: Optional[Callable[[str], None]] = None
+        self._chunk_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._trace_local = threading.local()  # Trace of the transcript being delivered
         self._transcript_history = []  # Last 30 seconds
         self._chunks_processed = 0
         self._current_audio_level = 0.0
         self._last_speech_time = 0.0
+        self._pool: Optional[TranscriptionPool] = None
+        self._pool_error: Optional[str] = None  # Why the pool was abandoned this session
+
+        # Load Whisper model (shared, in the background); a worker pool loads its own
+        self.model_future: Optional[Future] = None
+        if not self._uses_worker_pool():
+            self._load_model()
+
+    @property
+    def model(self):
+        """
+        The loaded Whisper model (blocks until loading finishes).
 
-        # Load Whisper model
-        logger.info(f"Loading Whisper model '{model}'...")
+        Raises:
+            RuntimeError: If the model failed to load
+        """
+        return model_registry.get(self.model_name, self.device, self.precision)
+
+    def is_ready(self) -> bool:
+        """True once the Whisper model (or every pool worker's) has loaded successfully."""
+        return self._model_status() == "ready"
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the Whisper model to load (in the pool workers when
+        transcription_workers > 1).
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the model is ready, False on timeout or load failure
+        """
+        if self._uses_worker_pool():
+            return self._ensure_pool().wait_until_ready(timeout)
         try:
-            self.model = whisper.load_model(model)
-            logger.info(f"✓ Whisper model '{model}' loaded successfully")
-        except Exception as e:
-            logger.error(f"✗ Failed to load Whisper model: {e}")
-            raise RuntimeError(f"Failed to load Whisper model '{model}': {e}")
+            self._load_model().result(timeout=timeout)
+            return True
+        except Exception:
+            return False
 
-    def start_listening(self, callback: Callable[[str, bool], None]) -> None:
+    def start_listening(
+        self,
+        callback: Callable[[str, bool], None],
+        partial_callback: Optional[Callable[[str], None]] = None,
+        chunk_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> None:
         """
         Start capturing and transcribing audio.
 
         Args:
             callback: Function called with (text: str, is_question: bool)
-                     when new transcription is available
+                     when new transcription is available (final text)
+            partial_callback: Optional function called with the current
+                     uncommitted sentence in streaming mode (partial text)
+            chunk_callback: Optional function called with a metrics dict
+                     after each chunk is processed (see _report_chunk)
 
         Raises:
             RuntimeError: If already listening or microphone unavailable
@@ -99,10 +202,26 @@ class AudioEngine:
             raise RuntimeError("Already listening. Stop before starting again.")
 
         self._callback = callback
+        self._partial_callback = partial_callback
+        self._chunk_callback = chunk_callback
         self._stop_event.clear()
+        self._capture_finished.clear()
         self._is_listening = True
         self._chunks_processed = 0
         self._transcript_history = []
+        self._audio_queue = self._create_queue()
+        self._ring = self._create_ring_buffer()
+        self._vad = self._create_vad()
+        self._input_overflows = 0
+        self._input_underflows = 0
+
+        self._pool_error = None
+        if self._uses_worker_pool():
+            self._ensure_pool()
+        else:
+            self._load_model()
+            if self.config.transcription_workers > 1:
+                logger.warning("Streaming mode re-decodes one window at a time; ignoring transcription_workers")
 
         # Start audio capture thread
         self._audio_thread = threading.Thread(
@@ -114,7 +233,7 @@ class AudioEngine:
 
         # Start transcription thread
         self._transcription_thread = threading.Thread(
-            target=self._transcription_loop,
+            target=self._streaming_loop if self.config.streaming else self._transcription_loop,
             daemon=True,
             name="Transcription"
         )
@@ -138,15 +257,50 @@ class AudioEngine:
             self._transcription_thread.join(timeout=2.0)
 
         # Clear queues
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        self._audio_buffer = []
+        self._audio_queue.clear()
+        self._ring.clear()
+        self._vad.reset()
         logger.info("🛑 Audio engine stopped")
 
+    def close(self) -> None:
+        """Stop listening and shut down the transcription worker pool."""
+        self.stop_listening()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def current_trace(self) -> Optional[LatencyTrace]:
+        """
+        Latency trace of the transcript being delivered.
+
+        Only meaningful inside the transcript callback (it runs on the
+        thread that emitted the text). The trace carries the capture,
+        queue and Whisper timestamps; the caller adds the later stages.
+
+        Returns:
+            LatencyTrace, or None outside a callback
+        """
+        return getattr(self._trace_local, 'trace', None)
+
+    def wait_until_finished(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a finite source to be fully captured and transcribed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if every chunk has been processed, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._capture_finished.wait(timeout):
+            return False
+        if self._transcription_thread is not None:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            self._transcription_thread.join(remaining)
+            return not self._transcription_thread.is_alive()
+        return True
+
     def update_config(self, config: AudioConfig) -> None:
         """
         Update audio configuration.
@@ -163,6 +317,10 @@ class AudioEngine:
         if self._is_listening:
             raise RuntimeError("Cannot update config while listening. Call stop_listening() first.")
 
+        if self._pool is not None and config.transcription_workers != self._pool.workers:
+            self._pool.shutdown()
+            self._pool = None
+
         self.config = config
         logger.info(f"Audio config updated: sensitivity={config.silence_threshold}, chunk={config.chunk_duration}s")
 
@@ -176,98 +334,471 @@ class AudioEngine:
             - audio_level: float (0.0 to 1.0)
             - chunks_processed: int
             - model: str
+            - model_status: str ("loading", "ready" or "failed")
+            - buffer_overflows: int (blocks truncated because the ring was full)
+            - buffer_underruns: int (reads attempted with too little data)
+            - input_overflows: int (PortAudio input overflow flags)
+            - input_underflows: int (PortAudio input underflow flags)
+            - transcription_workers: int (worker processes, 1 = in-thread)
+            - worker_stats: dict (per-worker throughput, empty without a pool)
+            - pool_error: str or None (why the worker pool was abandoned for
+              in-process decoding this session)
+            - queue_depth: int (chunks waiting for transcription)
+            - queue_dropped: int (chunks dropped by the queue policy)
+            - queue_coalesced: int (chunks merged into longer ones)
+            - chunk_age: float (seconds the last chunk waited before decoding)
+            - max_chunk_age: float (worst wait this session)
+            - behind_realtime: bool (chunk_age above config.max_chunk_age)
         """
         return {
             'is_listening': self._is_listening,
             'audio_level': self._current_audio_level,
             'chunks_processed': self._chunks_processed,
             'model': self.model_name,
-            'language': self.language
+            'model_status': self._model_status(),
+            'language': self.language,
+            'streaming': self.config.streaming,
+            'segmentation': self.config.segmentation,
+            'utterances_detected': self._vad.utterances_emitted,
+            'buffer_overflows': self._ring.overflow_count,
+            'buffer_underruns': self._ring.underrun_count,
+            'input_overflows': self._input_overflows,
+            'input_underflows': self._input_underflows,
+            'transcription_workers': self._pool.workers if self._pool else 1,
+            'worker_stats': self._pool.get_stats() if self._pool else {},
+            'pool_error': self._pool_error,
+            'queue_depth': self._audio_queue.qsize(),
+            'queue_dropped': self._audio_queue.dropped_chunks,
+            'queue_coalesced': self._audio_queue.coalesced_chunks,
+            'chunk_age': round(self._audio_queue.last_age, 3),
+            'max_chunk_age': round(self._audio_queue.max_age, 3),
+            'behind_realtime': self.is_behind_realtime()
         }
 
+    def is_behind_realtime(self) -> bool:
+        """
+        Check whether transcription is lagging behind capture.
+
+        Returns:
+            True if the last dequeued chunk waited longer than
+            ``config.max_chunk_age`` seconds
+        """
+        return self._audio_queue.last_age > self.config.max_chunk_age
+
+    def _uses_vad_segmentation(self) -> bool:
+        """True if the capture loop cuts utterances with the VAD."""
+        return not self.config.streaming and self.config.segmentation == "vad"
+
+    def _uses_worker_pool(self) -> bool:
+        """True if chunks are decoded by the worker-process pool."""
+        return not self.config.streaming and self.config.transcription_workers > 1
+
+    def _load_model(self) -> Future:
+        """Start (or join) loading the in-process model in the shared registry."""
+        self.model_future = model_registry.load_async(self.model_name, self.device, self.precision)
+        return self.model_future
+
+    def _model_status(self) -> str:
+        """Status of the model that decodes: the pool workers', or the registry's."""
+        if self._uses_worker_pool() and self._pool is not None:
+            return self._pool.status()
+        return model_registry.status(self.model_name, self.device, self.precision)
+
+    def _abandon_pool(self, error: Exception) -> None:
+        """
+        Shut down a failed worker pool and decode in the transcription
+        thread for the rest of the session (the next session tries a new pool).
+        """
+        logger.error(f"✗ Transcription pool failed ({error!r}); transcribing in-process")
+        self._pool_error = repr(error)
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._load_model()
+
+    def _ensure_pool(self) -> TranscriptionPool:
+        """Create the worker pool on first use and start loading its models."""
+        if self._pool is None:
+            self._pool = TranscriptionPool(
+                self.model_name,
+                on_result=self._on_pool_result,
+                workers=self.config.transcription_workers,
+                language=self.language,
+                device=self.device,
+                precision=self.precision,
+                sample_rate=self.config.sample_rate
+            )
+            self._pool.warm_up()
+            logger.info(f"✓ Transcription pool started ({self._pool.workers} workers)")
+        return self._pool
+
+    def _block_samples(self) -> int:
+        """Samples per ring read (a streaming step, a VAD read or a full chunk)."""
+        if self.config.streaming:
+            duration = self.config.stream_step
+        elif self._uses_vad_segmentation():
+            duration = self.VAD_READ_DURATION
+        else:
+            duration = self.config.chunk_duration
+        return int(self.config.sample_rate * duration)
+
+    def _create_ring_buffer(self) -> AudioRingBuffer:
+        """Allocate a ring buffer sized to a whole number of blocks."""
+        block = self._block_samples()
+        min_blocks = math.ceil(self.RING_BUFFER_SECONDS * self.config.sample_rate / block)
+        return AudioRingBuffer(block * max(self.RING_BUFFER_CHUNKS, min_blocks))
+
+    def _create_queue(self) -> AudioChunkQueue:
+        """Create the bounded transcription queue from the current config."""
+        max_seconds = self.config.stream_window if self.config.streaming else self.MAX_DECODE_SECONDS
+        return AudioChunkQueue(
+            maxsize=self.config.queue_size,
+            policy=self.config.queue_policy,
+            max_coalesce_samples=int(max_seconds * self.config.sample_rate)
+        )
+
+    def _create_vad(self) -> VADSegmenter:
+        """Create a VAD segmenter from the current config."""
+        return VADSegmenter(
+            sample_rate=self.config.sample_rate,
+            silence_threshold=self.config.silence_threshold,
+            silence_duration=self.config.silence_duration
+        )
+
     def _audio_capture_loop(self) -> None:
         """
         Audio capture loop (runs in background thread).
-        Captures microphone input and queues chunks for transcription.
+        Captures source audio into the ring buffer and queues chunks for
+        transcription.
+
+        The source callback only copies each block into the ring and
+        computes the RMS level on the same view. Chunks are sliced out of
+        the ring here, off the real-time audio thread. With VAD
+        segmentation the ring views go straight to the segmenter, and one
+        chunk is queued per detected utterance.
+
+        Live sources never wait. Non-realtime sources (offline replay) are
+        paused instead of losing audio: their callback waits for ring
+        space, and chunks wait for queue space. When a finite source is
+        exhausted, the tail is flushed and the loop ends.
         """
-        chunk_samples = int(self.config.sample_rate * self.config.chunk_duration)
-        buffer = []
+        chunk_samples = self._block_samples()
+        use_vad = self._uses_vad_segmentation()
+        ring = self._ring
+        vad = self._vad
+        chunk_queue = self._audio_queue
+        source = self.source
+        reported_overflows = 0
+        reported_backlog = 0
 
         def audio_callback(indata, frames, time_info, status):
-            """Called by sounddevice for each audio block."""
+            """Called by the audio source for each audio block."""
             if status:
-                logger.warning(f"Audio callback status: {status}")
+                if status.input_overflow:
+                    self._input_overflows += 1
+                if status.input_underflow:
+                    self._input_underflows += 1
 
-            # Calculate audio level (RMS)
-            audio_data = indata[:, 0]  # Get mono channel
-            self._current_audio_level = float(np.sqrt(np.mean(audio_data**2)))
+            # Mono channel view (no copy)
+            block = indata[:, 0]
 
-            # Add to buffer
-            buffer.extend(audio_data)
+            # Calculate audio level (RMS)
+            self._current_audio_level = float(np.sqrt(np.dot(block, block) / max(frames, 1)))
 
-            # If buffer reaches chunk size, queue it for transcription
-            if len(buffer) >= chunk_samples:
-                chunk = np.array(buffer[:chunk_samples], dtype=np.float32)
-                buffer[:] = buffer[chunk_samples:]  # Keep remainder
+            if not source.realtime:
+                # Replay thread, not an audio device: safe to wait for space
+                while ring.free < len(block) and not self._stop_event.is_set():
+                    time.sleep(0.001)
 
-                try:
-                    self._audio_queue.put(chunk, block=False)
-                except queue.Full:
-                    logger.warning("Audio queue full, dropping chunk")
+            ring.write(block)
 
         try:
-            with sd.InputStream(
-                samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                callback=audio_callback,
-                blocksize=1024
-            ):
-                logger.info("✓ Microphone capture started")
+            with source.stream(self.config.sample_rate, self.config.channels, 1024, audio_callback):
+                logger.info("✓ Audio capture started")
                 while not self._stop_event.is_set():
-                    time.sleep(0.1)
+                    # Read before draining: a finished source has written everything
+                    exhausted = source.finished
+                    ring.wait_for_data(timeout=0.1)
+
+                    # Queue every complete chunk for transcription
+                    while ring.available >= chunk_samples:
+                        view = ring.read_view(chunk_samples)
+                        if use_vad:
+                            # The segmenter copies frames into its own buffer
+                            chunks = [
+                                AudioChunk(utterance, time.time(), endpointed=endpointed)
+                                for utterance, endpointed in vad.process(view)
+                            ]
+                        else:
+                            # Copy out of the ring: the queue outlives the view
+                            chunks = [AudioChunk(view.copy(), time.time())]
+                        ring.consume(chunk_samples)
+
+                        for chunk in chunks:
+                            self._queue_chunk(chunk)
+
+                    if ring.overflow_count > reported_overflows:
+                        reported_overflows = ring.overflow_count
+                        logger.warning(f"Audio ring buffer overflow ({ring.dropped_samples} samples dropped)")
+
+                    backlog = chunk_queue.dropped_chunks + chunk_queue.coalesced_chunks
+                    if backlog > reported_backlog:
+                        reported_backlog = backlog
+                        logger.warning(
+                            f"Transcription falling behind ({chunk_queue.policy}: "
+                            f"{chunk_queue.dropped_chunks} dropped, {chunk_queue.coalesced_chunks} coalesced)"
+                        )
+
+                    if exhausted:
+                        self._flush_capture_tail()
+                        logger.info("✓ Audio source finished")
+                        break
         except Exception as e:
             logger.error(f"✗ Audio capture error: {e}")
             self._is_listening = False
+        finally:
+            self._capture_finished.set()
+
+    def _flush_capture_tail(self) -> None:
+        """Queue the audio left over when a finite source ends."""
+        tail = self._ring.read_view(self._ring.available) if self._ring.available else None
+
+        if self._uses_vad_segmentation():
+            utterances = self._vad.process(tail) if tail is not None else []
+            chunks = [
+                AudioChunk(utterance, time.time(), endpointed=endpointed)
+                for utterance, endpointed in utterances + self._vad.flush()
+            ]
+        else:
+            chunks = [AudioChunk(tail.copy(), time.time(), endpointed=True)] if tail is not None else []
+
+        if tail is not None:
+            self._ring.consume(len(tail))
+        for chunk in chunks:
+            self._queue_chunk(chunk)
+
+    def _queue_chunk(self, chunk: AudioChunk) -> None:
+        """Queue a chunk for transcription (waiting for space for replay sources)."""
+        if self.source.realtime:
+            self._audio_queue.put(chunk)
+            return
+
+        while not self._stop_event.is_set():
+            if self._audio_queue.put(chunk, block=True, timeout=0.5):
+                return
+
+    def _capture_drained(self) -> bool:
+        """True once a finite source has ended and every chunk was dequeued."""
+        return self._capture_finished.is_set() and self._audio_queue.qsize() == 0
 
     def _transcription_loop(self) -> None:
         """
         Transcription loop (runs in background thread).
-        Processes queued audio chunks with Whisper.
+        Processes queued audio chunks with Whisper, either in this thread
+        or by dispatching them to the worker pool (results come back in
+        capture order through _on_pool_result).
         """
+        pool = self._pool if self._uses_worker_pool() else None
+
         while not self._stop_event.is_set():
             try:
                 # Get audio chunk (timeout to check stop event)
-                audio_chunk = self._audio_queue.get(timeout=0.5)
+                chunk = self._audio_queue.get(timeout=0.5)
             except queue.Empty:
+                if self._capture_drained():
+                    break
                 continue
 
+            if pool is not None:
+                # Skip silence here rather than shipping it to a worker
+                if not self._vad.contains_speech(chunk.audio):
+                    self._report_chunk(chunk, "", 0.0, False)
+                    continue
+                try:
+                    while not pool.submit(chunk, timeout=0.5):
+                        if self._stop_event.is_set():
+                            return
+                    continue
+                except Exception as e:
+                    # E.g. BrokenProcessPool: a worker died or could not load
+                    # its model. Decode this chunk and the rest here instead.
+                    self._abandon_pool(e)
+                    pool = None
+
             # Transcribe
             try:
-                text = self._transcribe_chunk(audio_chunk)
+                started = time.perf_counter()
+                text = self._transcribe_chunk(chunk.audio)
+                decode_seconds = time.perf_counter() - started
+
+                is_question = False
                 if text:
-                    is_question = self._detect_question(text)
+                    trace = self._chunk_trace(chunk, time.time(), decode_seconds)
+                    is_question = self._emit_transcript(text, endpointed=chunk.endpointed, trace=trace)
+                self._report_chunk(chunk, text, decode_seconds, is_question)
 
-                    # Update history
-                    self._transcript_history.append({
-                        'text': text,
-                        'timestamp': time.time(),
-                        'is_question': is_question
-                    })
-                    self._cleanup_history()
+            except Exception as e:
+                logger.error(f"✗ Transcription error: {e}")
 
-                    # Call callback
-                    if self._callback:
-                        self._callback(text, is_question)
+        if pool is not None and not self._stop_event.is_set():
+            # Finite source: wait for the chunks still in the workers
+            pool.wait_until_drained()
 
-                    self._chunks_processed += 1
+    def _on_pool_result(self, chunk: AudioChunk, text: str, decode_seconds: float) -> None:
+        """Handle an in-order result from the worker pool."""
+        if not self._is_listening:
+            return
+        is_question = False
+        if text:
+            # Decode ended in the worker just before the result arrived
+            trace = self._chunk_trace(chunk, time.time(), decode_seconds)
+            is_question = self._emit_transcript(text, endpointed=chunk.endpointed, trace=trace)
+        self._report_chunk(chunk, text, decode_seconds, is_question)
+
+    @staticmethod
+    def _chunk_trace(chunk: AudioChunk, whisper_end: float, decode_seconds: float) -> LatencyTrace:
+        """Start a latency trace with the capture, queue and Whisper stages of a chunk."""
+        trace = LatencyTrace()
+        trace.mark('audio_captured', chunk.captured_at)
+        if chunk.enqueued_at:
+            trace.mark('chunk_enqueued', chunk.enqueued_at)
+        trace.mark('whisper_start', whisper_end - decode_seconds)
+        trace.mark('whisper_end', whisper_end)
+        return trace
+
+    def _report_chunk(self, chunk: AudioChunk, text: str, decode_seconds: float, is_question: bool) -> None:
+        """
+        Send per-chunk metrics to the chunk callback.
+
+        The metrics dict holds:
+        - audio_seconds: float (length of the chunk)
+        - decode_seconds: float (Whisper time; 0.0 for skipped silence)
+        - latency: float (capture of the chunk's last sample → text ready)
+        - realtime_factor: float (decode_seconds / audio_seconds)
+        - text: str
+        - is_question: bool
+        """
+        if not self._chunk_callback:
+            return
+
+        audio_seconds = len(chunk.audio) / self.config.sample_rate
+        try:
+            self._chunk_callback({
+                'audio_seconds': audio_seconds,
+                'decode_seconds': decode_seconds,
+                'latency': time.time() - chunk.captured_at,
+                'realtime_factor': decode_seconds / audio_seconds if audio_seconds else 0.0,
+                'text': text,
+                'is_question': is_question
+            })
+        except Exception as e:
+            logger.error(f"✗ Chunk callback error: {e}")
+
+    def _streaming_loop(self) -> None:
+        """
+        Streaming transcription loop (runs in background thread).
+
+        Re-decodes a sliding window every ``stream_step`` seconds and commits
+        words once two consecutive hypotheses agree. Committed words are
+        collected into a sentence that is emitted as final text when it ends
+        with punctuation or the speaker pauses; the uncommitted remainder is
+        sent to the partial callback.
+        """
+        streamer = StreamingTranscriber(
+            self._transcribe_words,
+            sample_rate=self.config.sample_rate,
+            window_duration=self.config.stream_window
+        )
+        sentence = []
+
+        while not self._stop_event.is_set():
+            try:
+                chunk = self._audio_queue.get(timeout=0.5)
+            except queue.Empty:
+                if self._capture_drained():
+                    break
+                continue
 
-                    if is_question:
-                        logger.info(f"❓ Detected question: {text}")
-                    else:
-                        logger.debug(f"💬 Transcribed: {text}")
+            try:
+                block = chunk.audio
+                started = time.perf_counter()
+                emitted, is_question = [], False
+
+                if not self._vad.contains_speech(block):
+                    # Pause: whatever is pending is the end of the utterance
+                    sentence.extend(streamer.flush())
+                    streamer.reset()
+                    if sentence:
+                        emitted = sentence
+                        trace = self._chunk_trace(chunk, time.time(), time.perf_counter() - started)
+                        is_question = self._emit_transcript(" ".join(sentence), endpointed=True, trace=trace)
+                        sentence = []
+                    self._report_chunk(chunk, " ".join(emitted), time.perf_counter() - started, is_question)
+                    continue
+
+                committed, tentative = streamer.push(block)
+                whisper_end, decode_seconds = time.time(), time.perf_counter() - started
+
+                # Emit each completed sentence as final text
+                for word in committed:
+                    sentence.append(word)
+                    if word.endswith(('.', '?', '!')):
+                        trace = self._chunk_trace(chunk, whisper_end, decode_seconds)
+                        is_question = self._emit_transcript(" ".join(sentence), trace=trace) or is_question
+                        sentence = []
+
+                if self._partial_callback and (sentence or tentative):
+                    self._partial_callback(" ".join(sentence + tentative))
+
+                self._report_chunk(chunk, " ".join(committed), time.perf_counter() - started, is_question)
 
             except Exception as e:
-                logger.error(f"✗ Transcription error: {e}")
+                logger.error(f"✗ Streaming transcription error: {e}")
+
+        # Emit whatever was still pending when listening stopped
+        sentence.extend(streamer.flush())
+        if sentence:
+            self._emit_transcript(" ".join(sentence), endpointed=True)
+
+    def _emit_transcript(self, text: str, endpointed: bool = False,
+                         trace: Optional[LatencyTrace] = None) -> bool:
+        """
+        Record final text, detect questions and notify the callback.
+
+        Args:
+            text: Final transcribed text
+            endpointed: True if the text ends at a detected pause
+            trace: Latency trace for the text (see current_trace)
+
+        Returns:
+            True if the text was detected as a question
+        """
+        is_question = self._detect_question(text, endpointed=endpointed)
+
+        # Update history
+        self._transcript_history.append({
+            'text': text,
+            'timestamp': time.time(),
+            'is_question': is_question
+        })
+        self._cleanup_history()
+
+        # Call callback
+        if self._callback:
+            self._trace_local.trace = trace
+            try:
+                self._callback(text, is_question)
+            finally:
+                self._trace_local.trace = None
+
+        self._chunks_processed += 1
+
+        if is_question:
+            logger.info(f"❓ Detected question: {text}")
+        else:
+            logger.debug(f"💬 Transcribed: {text}")
+
+        return is_question
 
     def _transcribe_chunk(self, audio_chunk: np.ndarray) -> str:
         """
@@ -285,14 +816,14 @@ class AudioEngine:
                 audio_chunk = audio_chunk.astype(np.float32)
 
             # Check if chunk has meaningful audio
-            if np.max(np.abs(audio_chunk)) < self.config.silence_threshold:
-                return ""  # Silence
+            if not self._vad.contains_speech(audio_chunk):
+                return ""  # Silence or noise
 
             # Transcribe
             result = self.model.transcribe(
                 audio_chunk,
                 language=self.language,
-                fp16=False,  # Use FP32 for M-series Macs
+                fp16=self.precision == "fp16",  # FP32 by default for M-series Macs
                 verbose=False
             )
 
@@ -303,12 +834,41 @@ class AudioEngine:
             logger.error(f"Transcription failed: {e}")
             return ""
 
-    def _detect_question(self, text: str) -> bool:
+    def _transcribe_words(self, audio: np.ndarray, prompt: str) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe audio into timed words (streaming mode).
+
+        Args:
+            audio: Audio window as float32 numpy array
+            prompt: Previously committed text, used as decoder context
+
+        Returns:
+            List of (start, end, word) tuples relative to the window start
+        """
+        result = self.model.transcribe(
+            audio,
+            language=self.language,
+            fp16=self.precision == "fp16",  # FP32 by default for M-series Macs
+            verbose=None,
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=prompt or None
+        )
+
+        return [
+            (word['start'], word['end'], word['word'])
+            for segment in result.get('segments', [])
+            for word in segment.get('words', [])
+        ]
+
+    def _detect_question(self, text: str, endpointed: bool = False) -> bool:
         """
         Detect if text is a question.
 
         Args:
             text: Transcribed text
+            endpointed: True if the speaker paused after the text (VAD);
+                       otherwise the time since the last speech is used
 
         Returns:
             True if text appears to be a question
@@ -329,6 +889,8 @@ class AudioEngine:
 
         if first_word in question_words:
             # Check for silence after (indicates end of question)
+            if endpointed:
+                return True
             current_time = time.time()
             if current_time - self._last_speech_time > self.config.silence_duration:
                 return True
@@ -367,12 +929,12 @@ class AudioEngine:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.stop_listening()
+        self.close()
 
     def __del__(self):
         """Cleanup on deletion."""
-        if self._is_listening:
-            self.stop_listening()
+        if self._is_listening or self._pool is not None:
+            self.close()
 
 
 # ============================================================================
@@ -404,6 +966,8 @@ if __name__ == "__main__":
         # Initialize engine
         print("Loading Whisper model (this may take a moment)...")
         engine = AudioEngine(model="base", language="en")
+        if not engine.wait_until_ready():
+            raise RuntimeError("Whisper model failed to load")
 
         # Start listening
         print("✓ Model loaded. Starting audio capture...")
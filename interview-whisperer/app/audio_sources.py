@@ -0,0 +1,231 @@
+"""
+Audio Sources for Interview Whisperer
+
+Pluggable inputs for AudioEngine. Every source delivers float32 blocks to
+a sounddevice-style callback ``callback(indata, frames, time_info, status)``
+from its own thread, so recorded audio goes through exactly the same
+capture → chunking → transcription → question detection path as the
+microphone.
+
+- MicrophoneSource: live capture through sounddevice (the default)
+- ArraySource: a NumPy array, paced at real time or as fast as possible
+- FileSource: a WAV file (or FLAC/OGG with soundfile installed)
+"""
+
+import threading
+import time
+import wave
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Union
+
+import numpy as np
+
+# callback(indata, frames, time_info, status), as used by sounddevice
+AudioCallback = Callable[[np.ndarray, int, object, object], None]
+
+
+class AudioSource:
+    """
+    Base class for audio sources.
+
+    Subclasses implement ``stream``, a context manager that delivers
+    blocks to the callback while it is open.
+    """
+
+    # Live sources cannot wait: the engine must never block their callback
+    realtime = True
+
+    @property
+    def finished(self) -> bool:
+        """True once a finite source has delivered all of its audio."""
+        return False
+
+    def stream(self, sample_rate: int, channels: int, blocksize: int,
+               callback: AudioCallback):
+        """
+        Open the source.
+
+        Args:
+            sample_rate: Sample rate expected by the engine
+            channels: Number of channels expected by the engine
+            blocksize: Samples per callback
+            callback: Receives each (blocksize, channels) float32 block
+
+        Returns:
+            Context manager; audio flows while it is open
+        """
+        raise NotImplementedError
+
+
+class MicrophoneSource(AudioSource):
+    """Live microphone input through sounddevice."""
+
+    def stream(self, sample_rate: int, channels: int, blocksize: int,
+               callback: AudioCallback):
+        """Open a sounddevice input stream."""
+        # Imported here so file replay works on machines without PortAudio
+        import sounddevice as sd
+
+        return sd.InputStream(
+            samplerate=sample_rate,
+            channels=channels,
+            dtype='float32',
+            callback=callback,
+            blocksize=blocksize
+        )
+
+
+class _CallbackFlags:
+    """Stand-in for sounddevice.CallbackFlags (recorded audio never over/underflows)."""
+    input_overflow = False
+    input_underflow = False
+
+    def __bool__(self) -> bool:
+        return False
+
+
+class ArraySource(AudioSource):
+    """
+    Recorded audio from a NumPy array.
+
+    With ``realtime=True`` blocks are delivered at the pace they were
+    recorded (a faithful live simulation). With ``realtime=False`` they
+    are delivered as fast as the engine accepts them; the engine then
+    applies backpressure instead of dropping audio.
+    """
+
+    def __init__(self, audio: np.ndarray, sample_rate: int = 16000, realtime: bool = False):
+        """
+        Initialize the source.
+
+        Args:
+            audio: Samples, shape (n,) or (n, channels); converted to mono float32
+            sample_rate: Sample rate of ``audio`` (resampled to the engine rate)
+            realtime: Pace delivery at real time instead of as fast as possible
+        """
+        audio = np.asarray(audio)
+        if audio.ndim == 2:
+            audio = audio.mean(axis=1)
+        if np.issubdtype(audio.dtype, np.integer):
+            audio = audio / float(np.iinfo(audio.dtype).max)
+
+        self.audio = audio.astype(np.float32, copy=False)
+        self.sample_rate = sample_rate
+        self.realtime = realtime
+        self._done = threading.Event()
+
+    @property
+    def duration(self) -> float:
+        """Length of the recording in seconds."""
+        return len(self.audio) / self.sample_rate
+
+    @property
+    def finished(self) -> bool:
+        """True once every block has been delivered."""
+        return self._done.is_set()
+
+    @contextmanager
+    def stream(self, sample_rate: int, channels: int, blocksize: int,
+               callback: AudioCallback) -> Iterator["ArraySource"]:
+        """Deliver the array in blocks from a feeder thread."""
+        audio = _resample(self.audio, self.sample_rate, sample_rate)
+        stop = threading.Event()
+        self._done.clear()
+
+        def feed():
+            flags = _CallbackFlags()
+            block = np.zeros((blocksize, channels), dtype=np.float32)
+            block_duration = blocksize / sample_rate
+            started = time.perf_counter()
+
+            for index, start in enumerate(range(0, len(audio), blocksize)):
+                if stop.is_set():
+                    break
+                samples = audio[start:start + blocksize]
+                # The last block is zero-padded, as a microphone would deliver silence
+                block[:len(samples)] = samples[:, None]
+                block[len(samples):] = 0.0
+                callback(block, blocksize, None, flags)
+
+                if self.realtime:
+                    # Absolute schedule, so sleep jitter does not accumulate
+                    delay = started + (index + 1) * block_duration - time.perf_counter()
+                    if delay > 0:
+                        stop.wait(delay)
+            self._done.set()
+
+        feeder = threading.Thread(target=feed, daemon=True, name="ArraySource")
+        feeder.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            feeder.join(timeout=2.0)
+
+
+class FileSource(ArraySource):
+    """
+    Recorded audio from a file.
+
+    WAV is read with the standard library; other formats (FLAC, OGG)
+    need the optional ``soundfile`` package.
+    """
+
+    def __init__(self, path: Union[str, Path], realtime: bool = False):
+        """
+        Load an audio file.
+
+        Args:
+            path: Audio file path
+            realtime: Pace delivery at real time instead of as fast as possible
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ImportError: If the format needs soundfile and it is not installed
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Audio file not found: {self.path}")
+
+        if self.path.suffix.lower() == ".wav":
+            audio, sample_rate = _read_wav(self.path)
+        else:
+            try:
+                import soundfile
+            except ImportError:
+                raise ImportError(
+                    f"Reading {self.path.suffix} files requires soundfile: pip install soundfile"
+                )
+            audio, sample_rate = soundfile.read(str(self.path), dtype='float32')
+
+        super().__init__(audio, sample_rate=sample_rate, realtime=realtime)
+
+
+def _read_wav(path: Path):
+    """Read a PCM WAV file into float32 samples in [-1, 1]."""
+    with wave.open(str(path), "rb") as wav:
+        sample_rate = wav.getframerate()
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        raw = wav.readframes(wav.getnframes())
+
+    if width == 1:
+        audio = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        audio = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768.0
+    elif width == 4:
+        audio = np.frombuffer(raw, dtype='<i4').astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width * 8} bits")
+
+    return audio.reshape(-1, channels), sample_rate
+
+
+def _resample(audio: np.ndarray, source_rate: int, target_rate: int) -> np.ndarray:
+    """Linearly resample mono audio (no-op when the rates match)."""
+    if source_rate == target_rate or len(audio) == 0:
+        return audio
+    n_out = int(round(len(audio) * target_rate / source_rate))
+    positions = np.arange(n_out) * (source_rate / target_rate)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
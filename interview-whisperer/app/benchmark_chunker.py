@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Chunker Benchmark for Interview Whisperer
+
+Compares sentence chunking on a synthetic corpus: the previous chunk_text
+loop (re-joins and re-splits the whole chunk to find each overlap) against
+TextChunker's single pass, and TextChunker sized in tokens when the
+embedding model's tokenizer is available.
+
+No Ollama or ChromaDB needed:
+
+    python benchmark_chunker.py --words 1000000
+"""
+
+import json
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+try:
+    from .config import CHUNK_OVERLAP, CHUNK_SIZE, OLLAMA_EMBED_MODEL
+    from .text_chunker import TextChunker, shared_token_counter
+except ImportError:
+    # Fallback for direct execution
+    from config import CHUNK_OVERLAP, CHUNK_SIZE, OLLAMA_EMBED_MODEL
+    from text_chunker import TextChunker, shared_token_counter
+
+VOCABULARY = (
+    "led migrated designed shipped the a platform team kubernetes latency service "
+    "customers revenue pipeline reduced improved by percent across three regions "
+    "on-call postgres python roadmap stakeholders quarterly launch onboarding"
+).split()
+
+
+def make_sentences(words: int, seed: int = 0) -> List[str]:
+    """Sentences of 5-40 words totalling about `words` words."""
+    rng = random.Random(seed)
+    sentences = []
+    count = 0
+    while count < words:
+        length = rng.randint(5, 40)
+        sentence = " ".join(rng.choice(VOCABULARY) for _ in range(length))
+        sentences.append(sentence.capitalize() + ".")
+        count += length
+    return sentences
+
+
+def legacy_chunk_sentences(sentences: Iterable[str], chunk_size: int, overlap: int) -> Iterator[str]:
+    """DocumentProcessor's chunking loop before TextChunker (for comparison)."""
+    current_chunk = []
+    current_word_count = 0
+
+    for sentence in sentences:
+        sentence_words = len(sentence.split())
+
+        if current_word_count + sentence_words > chunk_size and current_chunk:
+            yield ' '.join(current_chunk)
+
+            overlap_words = ' '.join(current_chunk).split()[-overlap:]
+            current_chunk = [' '.join(overlap_words)]
+            current_word_count = len(overlap_words)
+
+        current_chunk.append(sentence)
+        current_word_count += sentence_words
+
+    if current_chunk:
+        yield ' '.join(current_chunk)
+
+
+def _time(chunk: Callable[[], List[str]], repeats: int):
+    """Best of `repeats` runs: (seconds, chunks)."""
+    best, chunks = float('inf'), []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        chunks = chunk()
+        best = min(best, time.perf_counter() - start)
+    return best, chunks
+
+
+def run_benchmark(
+    sentences: List[str],
+    chunk_size: int = CHUNK_SIZE,
+    overlap: int = CHUNK_OVERLAP,
+    model: str = OLLAMA_EMBED_MODEL,
+    repeats: int = 3
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Chunk the sentences with each implementation.
+
+    Args:
+        sentences: Corpus, one sentence per item
+        chunk_size: Target chunk size (words, or tokens for the token chunker)
+        overlap: Overlap in the same unit
+        model: Embedding model whose tokenizer sizes the token chunker
+        repeats: Runs per implementation (the fastest is reported)
+
+    Returns:
+        Seconds, words/s, chunk count and speedup over legacy per implementation;
+        the word chunker also reports whether its chunks match legacy exactly
+    """
+    words = sum(len(sentence.split()) for sentence in sentences)
+    results = {}
+
+    legacy_seconds, legacy_chunks = _time(
+        lambda: list(legacy_chunk_sentences(sentences, chunk_size, overlap)), repeats
+    )
+    results['legacy'] = {
+        'seconds': legacy_seconds,
+        'words_per_second': words / legacy_seconds,
+        'chunks': len(legacy_chunks),
+        'speedup': 1.0
+    }
+
+    chunker = TextChunker(chunk_size, overlap)
+    seconds, chunks = _time(lambda: list(chunker.chunk_sentences(sentences)), repeats)
+    results['words'] = {
+        'seconds': seconds,
+        'words_per_second': words / seconds,
+        'chunks': len(chunks),
+        'speedup': legacy_seconds / seconds,
+        'matches_legacy': chunks == legacy_chunks
+    }
+
+    if shared_token_counter(model) is not None:
+        chunker = TextChunker.for_model(model, chunk_size, overlap)
+        seconds, chunks = _time(lambda: list(chunker.chunk_sentences(sentences)), repeats)
+        results['tokens'] = {
+            'seconds': seconds,
+            'words_per_second': words / seconds,
+            'chunks': len(chunks),
+            'speedup': legacy_seconds / seconds,
+            'max_chunk_tokens': max(chunker.size(chunk) for chunk in chunks)
+        }
+    return results
+
+
+def _print_report(results: Dict[str, Dict[str, Any]], words: int) -> None:
+    """Print a human-readable comparison."""
+    print("=" * 60)
+    print(f"Sentence Chunking ({words:,} words)")
+    print("=" * 60)
+    for name, result in results.items():
+        print(f"{name:<8} {result['seconds']:7.3f}s  {result['words_per_second'] / 1e6:6.2f}M words/s  "
+              f"{result['chunks']:6d} chunks  {result['speedup']:5.1f}x")
+    if 'matches_legacy' in results.get('words', {}):
+        status = "✓" if results['words']['matches_legacy'] else "✗"
+        print(f"\n{status} Word chunks identical to legacy: {results['words']['matches_legacy']}")
+    if 'tokens' in results:
+        print(f"Largest token chunk: {results['tokens']['max_chunk_tokens']} tokens")
+    else:
+        print("Token chunker skipped (tokenizer unavailable)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Measure sentence chunking speed - Interview Whisperer"
+    )
+    parser.add_argument("--words", type=int, default=1_000_000, help="Corpus size in words")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Target chunk size")
+    parser.add_argument("--overlap", type=int, default=CHUNK_OVERLAP, help="Chunk overlap")
+    parser.add_argument("--model", type=str, default=OLLAMA_EMBED_MODEL, help="Embedding model (tokenizer)")
+    parser.add_argument("--json", type=str, default=None, help="Write the results to this file")
+
+    args = parser.parse_args()
+
+    sentences = make_sentences(args.words)
+    total_words = sum(len(sentence.split()) for sentence in sentences)
+    results = run_benchmark(sentences, args.chunk_size, args.overlap, args.model)
+
+    _print_report(results, total_words)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Results written to {args.json}")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Embedding Throughput Benchmark for Interview Whisperer
+
+Compares chunk embedding during ingestion: one blocking ollama.embeddings
+request per chunk (the old create_embeddings) against DocumentProcessor's
+batched, concurrent requests, for a few batch sizes and concurrency levels.
+
+Needs Ollama running with the embedding model pulled:
+
+    python benchmark_embeddings.py --chunks 500
+"""
+
+import json
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+import ollama
+
+try:
+    from .config import OLLAMA_EMBED_MODEL
+    from .document_processor import DocumentProcessor
+except ImportError:
+    # Fallback for direct execution
+    from config import OLLAMA_EMBED_MODEL
+    from document_processor import DocumentProcessor
+
+
+def make_chunks(count: int, words: int = 120) -> List[str]:
+    """Distinct synthetic chunks of roughly chunk-sized text."""
+    return [
+        " ".join(f"Project {i} milestone {j}: shipped feature {i * j % 97}." for j in range(words // 6))
+        for i in range(count)
+    ]
+
+
+def run_benchmark(
+    processor: DocumentProcessor,
+    chunks: List[str],
+    configs: Sequence[Tuple[int, int]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Embed the chunks one by one, then with each (batch size, concurrency).
+
+    Args:
+        processor: DocumentProcessor (its batch settings are overwritten)
+        chunks: Texts to embed
+        configs: (embed_batch_size, embed_concurrency) pairs to measure
+
+    Returns:
+        Seconds and chunks/s per configuration, plus speedup over sequential
+    """
+    results = {}
+
+    start = time.perf_counter()
+    for chunk in chunks:
+        ollama.embeddings(model=processor.embedding_model, prompt=chunk)
+    sequential = time.perf_counter() - start
+    results['sequential'] = {'seconds': sequential, 'chunks_per_second': len(chunks) / sequential, 'speedup': 1.0}
+
+    for batch_size, concurrency in configs:
+        processor.embed_batch_size = batch_size
+        processor.embed_concurrency = concurrency
+        start = time.perf_counter()
+        if processor.create_embeddings(chunks) is None:
+            raise RuntimeError(f"Embedding failed (batch {batch_size}, concurrency {concurrency})")
+        seconds = time.perf_counter() - start
+        results[f"batch{batch_size}_x{concurrency}"] = {
+            'seconds': seconds,
+            'chunks_per_second': len(chunks) / seconds,
+            'speedup': sequential / seconds
+        }
+    return results
+
+
+def _print_report(results: Dict[str, Dict[str, Any]], chunks: int) -> None:
+    """Print a human-readable comparison."""
+    print("=" * 60)
+    print(f"Chunk Embedding Throughput ({chunks} chunks)")
+    print("=" * 60)
+    for name, result in results.items():
+        print(f"{name:<14} {result['seconds']:7.2f}s  {result['chunks_per_second']:7.1f} chunks/s  "
+              f"{result['speedup']:5.1f}x")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Measure chunk embedding throughput - Interview Whisperer"
+    )
+    parser.add_argument("--chunks", type=int, default=500, help="Synthetic chunks to embed")
+    parser.add_argument("--model", type=str, default=OLLAMA_EMBED_MODEL, help="Ollama embedding model")
+    parser.add_argument("--json", type=str, default=None, help="Write the results to this file")
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            processor = DocumentProcessor(f"{tmp}/docs", f"{tmp}/chroma_db", embedding_model=args.model)
+        except Exception as e:
+            print(f"✗ Could not start document processor: {e}")
+            sys.exit(1)
+
+        chunks = make_chunks(args.chunks)
+        results = run_benchmark(processor, chunks, [(16, 1), (32, 2), (64, 2), (32, 4)])
+
+    _print_report(results, len(chunks))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Results written to {args.json}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Prompt Cache Benchmark for Interview Whisperer
+
+Measures Ollama's prompt evaluation per question with and without
+LLMEngine's prompt_cache: the same questions are answered once sending
+the full PROMPT_TEMPLATE to generate, and once as chat messages behind a
+fixed system prompt whose KV cache Ollama reuses.
+
+Needs Ollama running and indexed documents:
+
+    python benchmark_prompt_cache.py --questions 8
+"""
+
+import json
+from typing import Any, Dict, List
+
+import numpy as np
+
+try:
+    from .config import CHROMA_DB_DIR
+    from .answer_bank import DEFAULT_QUESTIONS
+    from .llm_engine import LLMEngine
+except ImportError:
+    # Fallback for direct execution
+    from config import CHROMA_DB_DIR
+    from answer_bank import DEFAULT_QUESTIONS
+    from llm_engine import LLMEngine
+
+
+def run_benchmark(engine: LLMEngine, questions: List[str], max_tokens: int = 32) -> Dict[str, Dict[str, Any]]:
+    """
+    Answer every question in both modes.
+
+    Context is retrieved once per question and reused, so both modes
+    evaluate the same retrieved text.
+
+    Args:
+        engine: LLMEngine (its answer cache should be off)
+        questions: Questions to answer
+        max_tokens: Tokens generated per answer (kept short; only prefill is measured)
+
+    Returns:
+        Per-mode results: the first question's prompt eval (cold) and the
+        mean/p50 of the remaining questions (warm), in tokens and ms
+    """
+    contexts = [engine.retrieve_context(question, n_results=3) for question in questions]
+    results = {}
+    for mode, prompt_cache in (('full_prompt', False), ('prompt_cache', True)):
+        engine.prompt_cache = prompt_cache
+        evals = []
+        for question, context in zip(questions, contexts):
+            result = engine.generate_answer(question, context=context, max_tokens=max_tokens)
+            evals.append(result.get('prompt_eval') or {'tokens': 0, 'ms': 0.0})
+
+        warm = evals[1:] or evals
+        results[mode] = {
+            'first_tokens': evals[0]['tokens'],
+            'first_ms': evals[0]['ms'],
+            'mean_tokens': float(np.mean([e['tokens'] for e in warm])),
+            'mean_ms': float(np.mean([e['ms'] for e in warm])),
+            'p50_ms': float(np.percentile([e['ms'] for e in warm], 50))
+        }
+    return results
+
+
+def _print_report(results: Dict[str, Dict[str, Any]], questions: int) -> None:
+    """Print a human-readable comparison."""
+    print("=" * 60)
+    print(f"Prompt Evaluation per Question ({questions} questions)")
+    print("=" * 60)
+    for mode, result in results.items():
+        print(f"{mode:<13} first {result['first_tokens']} tok / {result['first_ms']:.0f}ms | "
+              f"then mean {result['mean_tokens']:.0f} tok / {result['mean_ms']:.0f}ms "
+              f"(p50 {result['p50_ms']:.0f}ms)")
+
+    before, after = results['full_prompt']['mean_ms'], results['prompt_cache']['mean_ms']
+    if before:
+        print(f"\nPrompt eval time: {100 * (1 - after / before):.0f}% lower with the prompt cache")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Measure prompt evaluation with and without the prompt cache - Interview Whisperer"
+    )
+    parser.add_argument("--db", type=str, default=str(CHROMA_DB_DIR), help="ChromaDB directory")
+    parser.add_argument("--model", type=str, default=None, help="Ollama model (default from config)")
+    parser.add_argument("--questions", type=int, default=8, help="Questions from the answer bank list")
+    parser.add_argument("--json", type=str, default=None, help="Write the results to this file")
+
+    args = parser.parse_args()
+
+    try:
+        kwargs = {'model': args.model} if args.model else {}
+        engine = LLMEngine(db_path=args.db, answer_cache=False, **kwargs)
+    except Exception as e:
+        print(f"✗ Could not start LLM engine: {e}")
+        sys.exit(1)
+
+    questions = DEFAULT_QUESTIONS[:max(2, args.questions)]
+    results = run_benchmark(engine, questions)
+    _print_report(results, len(questions))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Results written to {args.json}")
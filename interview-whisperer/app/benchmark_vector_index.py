@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Vector Index Benchmark for Interview Whisperer
+
+Compares query latency and resident memory of the vector backends
+LLMEngine can retrieve from: ChromaDB and the memory-mapped NumPy index
+(float32 and float16). Uses random unit vectors so no Ollama is needed.
+
+Each backend is built in one subprocess and queried in a fresh one, so
+the numbers reflect opening an existing store after a restart and one
+backend's memory does not leak into another's:
+
+    python benchmark_vector_index.py --chunks 2000 --dim 768 --queries 200
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+try:
+    from .vector_index import NumpyVectorIndex
+except ImportError:
+    # Fallback for direct execution
+    from vector_index import NumpyVectorIndex
+
+BACKENDS = ('chroma', 'numpy', 'numpy-float16')
+
+# Chroma caps the size of a single add call
+_CHROMA_BATCH = 1000
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _vectors(count: int, dim: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _build(backend: str, path: str, chunks: int, dim: int) -> None:
+    """Create the store on disk (runs in a subprocess)."""
+    vectors = _vectors(chunks, dim, seed=0)
+    ids = [f"chunk_{i}" for i in range(chunks)]
+    documents = [f"Chunk {i} of a benchmark document" for i in range(chunks)]
+    metadatas = [{'file_name': 'benchmark.txt', 'chunk_index': i} for i in range(chunks)]
+
+    if backend == 'chroma':
+        import chromadb
+        client = chromadb.PersistentClient(path=path)
+        collection = client.get_or_create_collection(name="benchmark", metadata={"hnsw:space": "cosine"})
+        for start in range(0, chunks, _CHROMA_BATCH):
+            end = start + _CHROMA_BATCH
+            collection.add(ids=ids[start:end], embeddings=vectors[start:end].tolist(),
+                           documents=documents[start:end], metadatas=metadatas[start:end])
+    else:
+        dtype = 'float16' if backend == 'numpy-float16' else 'float32'
+        NumpyVectorIndex(path, dtype=dtype).add(ids, vectors, documents, metadatas)
+
+
+def _query(backend: str, path: str, dim: int, queries: int, n_results: int) -> Dict[str, Any]:
+    """Open the store and time queries (runs in a fresh subprocess)."""
+    query_vectors = _vectors(queries, dim, seed=1)
+    rss_before = _rss_bytes()
+
+    start = time.perf_counter()
+    if backend == 'chroma':
+        import chromadb
+        collection = chromadb.PersistentClient(path=path).get_collection(name="benchmark")
+
+        def search(vector):
+            return collection.query(query_embeddings=[vector.tolist()], n_results=n_results)
+    else:
+        index = NumpyVectorIndex(path, dtype='float16' if backend == 'numpy-float16' else 'float32')
+
+        def search(vector):
+            return index.query(vector, n_results=n_results)
+    open_seconds = time.perf_counter() - start
+
+    latencies = []
+    for vector in query_vectors:
+        start = time.perf_counter()
+        search(vector)
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        'open_ms': open_seconds * 1000,
+        'p50_ms': float(np.percentile(latencies, 50)) * 1000,
+        'p95_ms': float(np.percentile(latencies, 95)) * 1000,
+        'max_ms': float(max(latencies)) * 1000,
+        'rss_mb': _rss_bytes() / 1e6,
+        'rss_delta_mb': (_rss_bytes() - rss_before) / 1e6
+    }
+
+
+def _run(pool_fn, *args):
+    """Run a function in a fresh spawned process and return its result."""
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1) as pool:
+        return pool.apply(pool_fn, args)
+
+
+def run_benchmark(
+    backends: List[str],
+    chunks: int = 2000,
+    dim: int = 768,
+    queries: int = 200,
+    n_results: int = 5
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build and query each backend.
+
+    Args:
+        backends: Backends to compare (see BACKENDS)
+        chunks: Indexed vectors
+        dim: Embedding dimension (768 matches nomic-embed-text)
+        queries: Timed queries per backend
+        n_results: Results per query
+
+    Returns:
+        Per-backend results (open time, latency percentiles in ms, RSS in MB),
+        or {'error': message} for a backend that could not run
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in backends:
+            path = str(Path(tmp) / backend)
+            try:
+                _run(_build, backend, path, chunks, dim)
+                results[backend] = _run(_query, backend, path, dim, queries, n_results)
+            except Exception as e:
+                results[backend] = {'error': str(e)}
+    return results
+
+
+def _print_report(results: Dict[str, Dict[str, Any]], chunks: int, dim: int) -> None:
+    """Print a human-readable comparison."""
+    print("=" * 60)
+    print(f"Vector Index Benchmark ({chunks} chunks x {dim} dims)")
+    print("=" * 60)
+    for backend, result in results.items():
+        if 'error' in result:
+            print(f"{backend:<14} ✗ {result['error']}")
+            continue
+        print(f"{backend:<14} p50 {result['p50_ms']:.2f}ms | p95 {result['p95_ms']:.2f}ms | "
+              f"open {result['open_ms']:.0f}ms | RSS {result['rss_mb']:.0f}MB "
+              f"(+{result['rss_delta_mb']:.0f}MB)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compare vector backends - Interview Whisperer"
+    )
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS),
+                        help="Backends to compare")
+    parser.add_argument("--chunks", type=int, default=2000, help="Indexed vectors")
+    parser.add_argument("--dim", type=int, default=768, help="Embedding dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Timed queries per backend")
+    parser.add_argument("--n-results", type=int, default=5, help="Results per query")
+    parser.add_argument("--json", type=str, default=None, help="Write the results to this file")
+
+    args = parser.parse_args()
+
+    results = run_benchmark(args.backends, chunks=args.chunks, dim=args.dim,
+                            queries=args.queries, n_results=args.n_results)
+    _print_report(results, args.chunks, args.dim)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Results written to {args.json}")
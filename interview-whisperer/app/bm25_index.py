@@ -0,0 +1,308 @@
+"""
+BM25 Index for Interview Whisperer
+
+In-process inverted index over the same chunks stored in ChromaDB. Dense
+embeddings miss exact keyword matches that matter in interviews
+(technology, company and product names); BM25 catches them, and runs in
+well under a millisecond when embeddings are slow or unavailable.
+
+The index is updated incrementally as chunks are stored and persisted as
+JSON next to the Chroma database. The inverted lists are rebuilt on load.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Words carrying no retrieval signal in interview questions
+STOPWORDS = frozenset("""
+a about an and are as at be been but by can could did do does for from had has have how i
+if in into is it its me my of on or our so that the their them then there these they this
+to was we were what when where which who why will with would you your yourself tell time
+""".split())
+
+# Keeps "c++", "c#", "node.js", "ci/cd"-style tokens together
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase terms without stopwords or trailing punctuation."""
+    terms = (t.rstrip("./-") for t in _TOKEN_RE.findall(text.lower()))
+    return [t for t in terms if t and t not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Okapi BM25 over chunk texts.
+
+    Usage:
+        index = shared_bm25_index(DATA_DIR / "bm25_index.json")
+        index.add(ids, chunks, metadatas)      # at ingest time
+        index.search("experience with kubernetes", n_results=5)
+
+    Thread-safe. Every change is written to disk (or, for add(save=False),
+    on the next flush()); another process's changes are picked up on the
+    next search (file modification time).
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize the index and load it from disk if present.
+
+        Args:
+            path: JSON file for persistence (None keeps the index in memory)
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.path = Path(path) if path is not None else None
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        self._mtime = 0.0
+        self._dirty = False  # Added with save=False and not yet written
+
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, ids: Sequence[str], texts: Sequence[str],
+            metadatas: Optional[Sequence[Dict[str, Any]]] = None, save: bool = True) -> None:
+        """
+        Add or replace chunks.
+
+        Args:
+            ids: Chunk IDs (the same IDs stored in ChromaDB)
+            texts: Chunk texts
+            metadatas: Optional metadata per chunk
+            save: Write the file now; False leaves it to flush(), so a
+                document added in batches is written once (the chunks
+                are searchable either way)
+        """
+        metadatas = metadatas or [{} for _ in ids]
+        with self._lock:
+            for doc_id, text, metadata in zip(ids, texts, metadatas):
+                self._remove(doc_id)
+                self._insert(doc_id, text, dict(metadata or {}))
+            if save:
+                self._save()
+            else:
+                self._dirty = True
+
+    def flush(self) -> None:
+        """Write chunks added with save=False."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def remove(self, ids: Sequence[str]) -> None:
+        """
+        Remove chunks (unknown IDs are ignored).
+
+        Args:
+            ids: Chunk IDs
+        """
+        with self._lock:
+            for doc_id in ids:
+                self._remove(doc_id)
+            self._save()
+
+    def clear(self) -> None:
+        """Remove every chunk."""
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._total_length = 0
+            self._save()
+
+    def search(self, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
+        """
+        Rank chunks for a query.
+
+        Args:
+            query: Question or keywords
+            n_results: Maximum results
+
+        Returns:
+            List of dictionaries, best first, with keys:
+                - id, text, metadata
+                - bm25: Raw BM25 score
+                - coverage: IDF-weighted share of the query's terms found in
+                  the chunk (0-1), comparable across queries
+        """
+        self.reload_if_changed()
+        terms = tokenize(query)
+
+        with self._lock:
+            n_docs = len(self._docs)
+            if not terms or not n_docs:
+                return []
+
+            avg_length = self._total_length / n_docs
+            scores: Dict[str, float] = {}
+            matched_idf: Dict[str, float] = {}
+            total_idf = 0.0
+
+            for term in set(terms):
+                postings = self._postings.get(term, {})
+                # BM25+ style IDF that never goes negative
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                total_idf += idf
+                for doc_id, tf in postings.items():
+                    length = self._docs[doc_id]['length']
+                    norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+                    matched_idf[doc_id] = matched_idf.get(doc_id, 0.0) + idf
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:n_results]
+            return [
+                {
+                    'id': doc_id,
+                    'text': self._docs[doc_id]['text'],
+                    'metadata': self._docs[doc_id]['metadata'],
+                    'bm25': score,
+                    'coverage': matched_idf[doc_id] / total_idf if total_idf else 0.0
+                }
+                for doc_id, score in ranked
+            ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with chunk count, vocabulary size and average length
+        """
+        with self._lock:
+            return {
+                'chunks': len(self._docs),
+                'terms': len(self._postings),
+                'avg_chunk_terms': round(self._total_length / len(self._docs), 1) if self._docs else 0.0
+            }
+
+    def reload_if_changed(self) -> None:
+        """Reload from disk if another process (or instance) rewrote the file."""
+        if self.path is None or self._dirty:
+            # Unwritten additions would be lost; flush() writes them first
+            return
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return
+        if mtime != self._mtime:
+            with self._lock:
+                self._load()
+
+    # -------------------------------------------------------------------------
+    # Internals (lock held)
+    # -------------------------------------------------------------------------
+
+    def _insert(self, doc_id: str, text: str, metadata: Dict[str, Any]) -> None:
+        terms = Counter(tokenize(text))
+        length = sum(terms.values())
+        self._docs[doc_id] = {'text': text, 'metadata': metadata, 'length': length}
+        self._total_length += length
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+
+    def _remove(self, doc_id: str) -> None:
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        self._total_length -= doc['length']
+        for term in set(tokenize(doc['text'])):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def _load(self) -> None:
+        """Load chunks from disk and rebuild the inverted lists."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            mtime = os.stat(self.path).st_mtime
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable BM25 index {self.path}: {e}")
+            return
+
+        self._docs.clear()
+        self._postings.clear()
+        self._total_length = 0
+        for doc in data.get('chunks', []):
+            self._insert(doc['id'], doc['text'], doc.get('metadata', {}))
+        self._mtime = mtime
+
+    def _save(self) -> None:
+        """Write the chunks atomically (temp file + rename)."""
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+            chunks = [{'id': doc_id, 'text': doc['text'], 'metadata': doc['metadata']}
+                      for doc_id, doc in self._docs.items()]
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'chunks': chunks}, f)
+            os.replace(tmp, self.path)
+            self._mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            logger.warning(f"Failed to persist BM25 index: {e}")
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """
+    Merge ranked ID lists with reciprocal rank fusion.
+
+    Args:
+        rankings: Ranked lists of IDs, best first
+        k: Rank offset damping the weight of top positions
+
+    Returns:
+        (id, fused score) pairs, best first
+    """
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, 1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+# Process-wide indexes, one per file
+_shared: Dict[str, BM25Index] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_bm25_index(path: Union[str, Path]) -> BM25Index:
+    """
+    Get the process-wide index for a file, loading it on first use.
+
+    Args:
+        path: JSON file
+
+    Returns:
+        The shared BM25Index
+    """
+    key = str(Path(path).resolve())
+    with _shared_lock:
+        index = _shared.get(key)
+        if index is None:
+            index = BM25Index(path)
+            _shared[key] = index
+        return index
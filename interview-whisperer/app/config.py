@@ -78,6 +78,9 @@ CHUNK_OVERLAP = 50  # Overlap in words
 # Supported document formats
 SUPPORTED_EXTENSIONS = ['.pdf', '.docx', '.txt', '.md']
 
+# User-supplied questions pre-answered after processing (one per line)
+QUESTION_BANK_FILE = DATA_DIR / "question_bank.txt"
+
 
 # =============================================================================
 # UI SETTINGS
@@ -2,15 +2,24 @@
 Document Processor for Interview Whisperer
 
 Extracts text from PDF, DOCX, TXT, and MD files, chunks them intelligently,
-creates embeddings using Ollama, and stores them in ChromaDB.
+creates embeddings using Ollama, and stores them in ChromaDB. Re-runs only
+process new or changed files (see index_manifest.py).
 """
 
 import os
 import re
+import json
+import time
 import logging
+import itertools
+import tempfile
+import multiprocessing
 from pathlib import Path
-from typing import List, Dict, Optional, Callable, Tuple
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Callable, Sequence, Tuple
 from datetime import datetime
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 import hashlib
 
 # Document parsing libraries
@@ -29,6 +38,21 @@ except ImportError:
     OLLAMA_AVAILABLE = False
     print("Warning: ollama package not installed. Install with: pip install ollama")
 
+# Local imports
+try:
+    from .embedding_cache import shared_embedding_cache
+    from .bm25_index import shared_bm25_index
+    from .vector_index import shared_vector_index
+    from .index_manifest import IndexManifest, file_sha256
+    from .text_chunker import TextChunker
+except ImportError:
+    # Fallback for direct execution
+    from embedding_cache import shared_embedding_cache
+    from bm25_index import shared_bm25_index
+    from vector_index import shared_vector_index
+    from index_manifest import IndexManifest, file_sha256
+    from text_chunker import TextChunker
+
 
 class DocumentProcessor:
     """
@@ -36,37 +60,77 @@ class DocumentProcessor:
 
     Supports: PDF, DOCX, TXT, MD files
     Uses: Ollama (nomic-embed-text) for embeddings
-    Stores: ChromaDB for vector storage
+    Stores: ChromaDB for vector storage, plus a BM25 keyword index and a
+            memory-mapped NumPy copy of the embeddings
     """
 
     SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.txt', '.md'}
     EMBEDDING_MODEL = 'nomic-embed-text'
     COLLECTION_NAME = 'interview_context'
 
+    # Characters read per block of a TXT/MD file
+    TEXT_BLOCK_CHARS = 64 * 1024
+
+    # Chunks embedded and stored per batch while ingesting a document
+    STORE_BATCH_CHUNKS = 256
+
+    # Formats whose extraction is CPU-bound enough to be worth a process pool
+    POOL_EXTENSIONS = {'.pdf', '.docx'}
+
+    # Attempts per embedding batch, and the first retry delay (doubles each time)
+    EMBED_ATTEMPTS = 4
+    EMBED_RETRY_DELAY = 0.5
+
     def __init__(self, documents_dir: str, db_path: str, chunk_size: int = 500,
                  chunk_overlap: int = 50, supported_extensions: Optional[set] = None,
-                 embedding_model: Optional[str] = None):
+                 embedding_model: Optional[str] = None, vector_dtype: str = "float32",
+                 embed_batch_size: int = 32, embed_concurrency: int = 2,
+                 extract_workers: int = 0, chunk_unit: str = "words"):
         """
         Initialize the DocumentProcessor.
 
         Args:
             documents_dir: Path to directory containing documents
             db_path: Path to ChromaDB storage location
-            chunk_size: Size of text chunks in words (default: 500)
-            chunk_overlap: Overlap between chunks in words (default: 50)
+            chunk_size: Size of text chunks in chunk_unit (default: 500)
+            chunk_overlap: Overlap between chunks in chunk_unit (default: 50)
             supported_extensions: Set of supported file extensions (default: {'.pdf', '.docx', '.txt', '.md'})
             embedding_model: Ollama embedding model to use (default: 'nomic-embed-text')
+            vector_dtype: Storage type of the NumPy vector index (default: 'float32')
+            embed_batch_size: Chunks per Ollama embed request (default: 32)
+            embed_concurrency: Embed requests in flight at once (default: 2)
+            extract_workers: Processes extracting and chunking documents
+                (default: 0, one per CPU; 1 extracts in this process)
+            chunk_unit: Size chunks in 'words' (default) or in 'tokens' of the
+                embedding model's tokenizer, capped at its context window
+                (needs the tokenizers package; falls back to words)
         """
         self.documents_dir = Path(documents_dir)
         self.db_path = Path(db_path)
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.chunk_unit = chunk_unit
         self.supported_extensions = supported_extensions if supported_extensions else self.SUPPORTED_EXTENSIONS
         self.embedding_model = embedding_model if embedding_model else self.EMBEDDING_MODEL
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.embed_concurrency = max(1, embed_concurrency)
+        self.extract_workers = extract_workers if extract_workers > 0 else (os.cpu_count() or 1)
 
         # Setup logging
         self._setup_logging()
 
+        # Query embeddings, shared with LLMEngine (same file next to the database)
+        self.embedding_cache = shared_embedding_cache(self.db_path.parent / "embedding_cache.sqlite3")
+
+        # Keyword index over the stored chunks (hybrid retrieval in LLMEngine)
+        self.bm25_index = shared_bm25_index(self.db_path.parent / "bm25_index.json")
+
+        # Memory-mapped embedding matrix (LLMEngine's "numpy" vector backend)
+        self.vector_index = shared_vector_index(self.db_path.parent / "vector_index", dtype=vector_dtype)
+
+        # What was indexed from each document, so re-runs skip unchanged files
+        self.manifest = IndexManifest(self.db_path.parent / "index_manifest.json")
+
         # Ensure directories exist
         self.documents_dir.mkdir(parents=True, exist_ok=True)
         self.db_path.mkdir(parents=True, exist_ok=True)
@@ -111,64 +175,81 @@ class DocumentProcessor:
             List of dictionaries with file metadata:
             [{
                 'path': str,
+                'relative_path': str,
                 'name': str,
                 'extension': str,
                 'size': int,
+                'mtime': float,
                 'modified': datetime
             }]
         """
-        documents = []
-
         try:
-            for file_path in self.documents_dir.rglob('*'):
-                if file_path.is_file() and file_path.suffix.lower() in self.supported_extensions:
-                    documents.append({
-                        'path': str(file_path),
-                        'name': file_path.name,
-                        'extension': file_path.suffix.lower(),
-                        'size': file_path.stat().st_size,
-                        'modified': datetime.fromtimestamp(file_path.stat().st_mtime)
-                    })
-
-            self.logger.info(f"Found {len(documents)} documents to process")
-            return documents
-
+            return self._scan_documents()
         except Exception as e:
             self.logger.error(f"Error scanning documents: {e}")
             return []
 
+    def _scan_documents(self) -> List[Dict[str, Any]]:
+        """scan_documents, raising on errors (a failed scan must not look like an empty folder)."""
+        documents = []
+        for file_path in sorted(self.documents_dir.rglob('*')):
+            if file_path.is_file() and file_path.suffix.lower() in self.supported_extensions:
+                stat = file_path.stat()
+                documents.append({
+                    'path': str(file_path),
+                    'relative_path': file_path.relative_to(self.documents_dir).as_posix(),
+                    'name': file_path.name,
+                    'extension': file_path.suffix.lower(),
+                    'size': stat.st_size,
+                    'mtime': stat.st_mtime,
+                    'modified': datetime.fromtimestamp(stat.st_mtime)
+                })
+
+        self.logger.info(f"Found {len(documents)} documents to process")
+        return documents
+
     def extract_text(self, file_path: str) -> Optional[str]:
         """
         Extract text from a file based on its type.
 
+        Holds the whole document in memory; ingestion uses iter_pages instead.
+
         Args:
             file_path: Path to the file
 
         Returns:
             Extracted text or None if extraction failed
         """
-        path = Path(file_path)
-        extension = path.suffix.lower()
-
         try:
-            if extension == '.pdf':
-                return self._extract_from_pdf(path)
-            elif extension == '.docx':
-                return self._extract_from_docx(path)
-            elif extension in {'.txt', '.md'}:
-                return self._extract_from_text(path)
-            else:
-                self.logger.warning(f"Unsupported file type: {extension}")
-                return None
-
+            return '\n'.join(self.iter_pages(file_path))
         except Exception as e:
             self.logger.error(f"Failed to extract text from {file_path}: {e}")
             return None
 
-    def _extract_from_pdf(self, file_path: Path) -> str:
-        """Extract text from PDF file."""
-        text = []
+    def iter_pages(self, file_path: str) -> Iterator[str]:
+        """
+        Yield a file's text piece by piece: a page (PDF), a paragraph or
+        table row (DOCX), or a block of lines (TXT, MD).
 
+        Args:
+            file_path: Path to the file
+
+        Raises:
+            ValueError: If the file type is not supported
+        """
+        path = Path(file_path)
+        extension = path.suffix.lower()
+
+        if extension == '.pdf':
+            return self._iter_pdf_pages(path)
+        elif extension == '.docx':
+            return self._iter_docx_paragraphs(path)
+        elif extension in {'.txt', '.md'}:
+            return self._iter_text_blocks(path)
+        raise ValueError(f"Unsupported file type: {extension}")
+
+    def _iter_pdf_pages(self, file_path: Path) -> Iterator[str]:
+        """Yield the text of each PDF page."""
         with open(file_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
 
@@ -176,43 +257,95 @@ class DocumentProcessor:
                 try:
                     page_text = page.extract_text()
                     if page_text:
-                        text.append(page_text)
+                        yield page_text
                 except Exception as e:
                     self.logger.warning(f"Failed to extract page {page_num} from {file_path.name}: {e}")
 
-        return '\n'.join(text)
-
-    def _extract_from_docx(self, file_path: Path) -> str:
-        """Extract text from DOCX file."""
+    def _iter_docx_paragraphs(self, file_path: Path) -> Iterator[str]:
+        """Yield DOCX paragraphs, then table rows."""
         doc = Document(file_path)
-        text = []
 
         for paragraph in doc.paragraphs:
             if paragraph.text.strip():
-                text.append(paragraph.text)
+                yield paragraph.text
 
         # Also extract text from tables
         for table in doc.tables:
             for row in table.rows:
                 row_text = ' | '.join(cell.text.strip() for cell in row.cells)
                 if row_text.strip():
-                    text.append(row_text)
-
-        return '\n'.join(text)
-
-    def _extract_from_text(self, file_path: Path) -> str:
-        """Extract text from TXT or MD file."""
-        encodings = ['utf-8', 'latin-1', 'cp1252']
-
-        for encoding in encodings:
+                    yield row_text
+
+    def _iter_text_blocks(self, file_path: Path) -> Iterator[str]:
+        """Yield a TXT or MD file in blocks of whole lines."""
+        encoding = self._detect_encoding(file_path)
+        if encoding is None:
+            self.logger.error(f"Failed to decode {file_path.name} with any encoding")
+            return
+
+        with open(file_path, 'r', encoding=encoding) as file:
+            while True:
+                block = file.read(self.TEXT_BLOCK_CHARS)
+                if not block:
+                    return
+                # Finish the line so a block never ends mid-word
+                yield block + file.readline()
+
+    def _detect_encoding(self, file_path: Path) -> Optional[str]:
+        """First encoding that decodes the whole file (checked in blocks)."""
+        for encoding in ['utf-8', 'latin-1', 'cp1252']:
             try:
                 with open(file_path, 'r', encoding=encoding) as file:
-                    return file.read()
+                    while file.read(self.TEXT_BLOCK_CHARS):
+                        pass
+                return encoding
             except UnicodeDecodeError:
                 continue
+        return None
 
-        self.logger.error(f"Failed to decode {file_path.name} with any encoding")
-        return ""
+    def iter_chunks(self, pages: Iterable[str], chunk_size: int = 500, overlap: int = 50) -> Iterator[str]:
+        """
+        Streaming chunk_text: chunk text arriving piece by piece.
+
+        Sentences may continue across pieces. Only the current chunk and
+        the last unfinished sentence are held; an unfinished sentence that
+        grows past chunk_size - overlap (in chunk_unit, e.g. text without
+        punctuation) is cut into pieces of that size, so a chunk made of
+        them still fits chunk_size with its overlap.
+
+        Args:
+            pages: Text pieces, e.g. from iter_pages
+            chunk_size: Target size in chunk_unit
+            overlap: Amount of chunk_unit to overlap between chunks
+
+        Yields:
+            Text chunks (the same chunks chunk_text makes from the joined
+            text, unless a sentence was cut)
+        """
+        chunker = self._chunker(chunk_size, overlap)
+        max_size = max(1, chunker.chunk_size - chunker.overlap)
+        return chunker.chunk_sentences(self._iter_sentences(pages, chunker, max_size))
+
+    def _iter_sentences(self, pages: Iterable[str], chunker: TextChunker, max_size: int) -> Iterator[str]:
+        """
+        Split text pieces into sentences, carrying the last fragment into
+        the next piece; a fragment larger than max_size (measured by
+        chunker) is cut into pieces of at most max_size.
+        """
+        carry = ''
+        for page in pages:
+            text = self._clean_text(page)
+            if not text:
+                continue
+            sentences = self._split_into_sentences(f"{carry} {text}" if carry else text)
+            # The last piece has no whitespace after it yet, so the next page may continue it
+            carry = sentences.pop() if sentences else ''
+            yield from sentences
+            if chunker.size(carry) > max_size:
+                *pieces, carry = chunker.split(carry, max_size)
+                yield from pieces
+        if carry:
+            yield carry
 
     def chunk_text(self, text: str, chunk_size: int = 500, overlap: int = 50) -> List[str]:
         """
@@ -220,8 +353,8 @@ class DocumentProcessor:
 
         Args:
             text: Text to chunk
-            chunk_size: Target size in words
-            overlap: Number of words to overlap between chunks
+            chunk_size: Target size in chunk_unit
+            overlap: Amount of chunk_unit to overlap between chunks
 
         Returns:
             List of text chunks
@@ -235,32 +368,15 @@ class DocumentProcessor:
         # Split into sentences
         sentences = self._split_into_sentences(text)
 
-        chunks = []
-        current_chunk = []
-        current_word_count = 0
-
-        for sentence in sentences:
-            sentence_words = len(sentence.split())
-
-            # If adding this sentence exceeds chunk_size, save current chunk
-            if current_word_count + sentence_words > chunk_size and current_chunk:
-                chunks.append(' '.join(current_chunk))
-
-                # Calculate overlap: keep last 'overlap' words
-                overlap_words = ' '.join(current_chunk).split()[-overlap:]
-                current_chunk = [' '.join(overlap_words)]
-                current_word_count = len(overlap_words)
-
-            current_chunk.append(sentence)
-            current_word_count += sentence_words
-
-        # Add remaining chunk
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        chunks = list(self._chunker(chunk_size, overlap).chunk_sentences(sentences))
 
         self.logger.info(f"Created {len(chunks)} chunks from text")
         return chunks
 
+    def _chunker(self, chunk_size: int, overlap: int) -> TextChunker:
+        """Chunker grouping sentences into chunks of about chunk_size (in chunk_unit) with overlap."""
+        return TextChunker.for_model(self.embedding_model, chunk_size, overlap, unit=self.chunk_unit)
+
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         # Remove excessive whitespace
@@ -288,38 +404,56 @@ class DocumentProcessor:
 
         return result
 
-    def create_embeddings(self, chunks: List[str]) -> Optional[List[List[float]]]:
+    def create_embeddings(self, chunks: List[str],
+                          progress_callback: Optional[Callable[[int, int, str], None]] = None
+                          ) -> Optional[List[List[float]]]:
         """
         Generate embeddings for text chunks using Ollama.
 
+        Chunks are sent in batches of embed_batch_size, embed_concurrency
+        requests at a time. A failed batch is retried with exponential
+        backoff before the whole call fails.
+
         Args:
             chunks: List of text chunks
+            progress_callback: Optional callback(embedded, total, message),
+                called as each batch completes (message includes chunks/s)
 
         Returns:
-            List of embeddings or None if generation failed
+            List of embeddings (in chunk order) or None if generation failed
         """
         if not OLLAMA_AVAILABLE:
             self.logger.error("Ollama package not available")
             return None
+        if not chunks:
+            return []
 
-        embeddings = []
+        batches = [
+            (start, chunks[start:start + self.embed_batch_size])
+            for start in range(0, len(chunks), self.embed_batch_size)
+        ]
+        embeddings: List[Optional[List[float]]] = [None] * len(chunks)
+        embedded = 0
+        start_time = time.perf_counter()
 
         try:
-            for i, chunk in enumerate(chunks):
+            with ThreadPoolExecutor(max_workers=min(self.embed_concurrency, len(batches)),
+                                    thread_name_prefix="ChunkEmbedding") as executor:
+                futures = [(start, executor.submit(self._embed_batch, batch)) for start, batch in batches]
                 try:
-                    response = ollama.embeddings(
-                        model=self.embedding_model,
-                        prompt=chunk
-                    )
-                    embeddings.append(response['embedding'])
-
-                except Exception as e:
-                    self.logger.error(f"Failed to create embedding for chunk {i}: {e}")
-                    # Return None to indicate failure
-                    return None
-
-            self.logger.info(f"Created {len(embeddings)} embeddings")
-            return embeddings
+                    for start, future in futures:
+                        vectors = future.result()
+                        embeddings[start:start + len(vectors)] = vectors
+                        embedded += len(vectors)
+                        if progress_callback:
+                            rate = embedded / max(time.perf_counter() - start_time, 1e-6)
+                            progress_callback(embedded, len(chunks),
+                                              f"Embedded {embedded}/{len(chunks)} chunks ({rate:.0f} chunks/s)")
+                except Exception:
+                    # The file fails as a whole; don't send the remaining batches
+                    for _, pending in futures:
+                        pending.cancel()
+                    raise
 
         except Exception as e:
             self.logger.error(f"Ollama embedding generation failed: {e}")
@@ -327,15 +461,59 @@ class DocumentProcessor:
             self.logger.error(f"  ollama pull {self.embedding_model}")
             return None
 
+        elapsed = time.perf_counter() - start_time
+        self.logger.info(
+            f"Created {len(embeddings)} embeddings in {elapsed:.2f}s "
+            f"({len(embeddings) / max(elapsed, 1e-6):.0f} chunks/s)"
+        )
+        return embeddings
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """
+        Embed one batch, retrying with exponential backoff.
+
+        Raises:
+            RuntimeError: If every attempt failed
+        """
+        delay = self.EMBED_RETRY_DELAY
+        for attempt in range(1, self.EMBED_ATTEMPTS + 1):
+            try:
+                return self._request_embeddings(batch)
+            except Exception as e:
+                if attempt == self.EMBED_ATTEMPTS:
+                    raise RuntimeError(f"embedding batch failed after {attempt} attempts: {e}") from e
+                self.logger.warning(f"Embedding batch failed (attempt {attempt}), retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+                delay *= 2
+
+    def _request_embeddings(self, batch: List[str]) -> List[List[float]]:
+        """One Ollama request for a batch (/api/embed), or per-chunk requests on older clients."""
+        if hasattr(ollama, 'embed'):
+            vectors = ollama.embed(model=self.embedding_model, input=batch)['embeddings']
+            if len(vectors) != len(batch):
+                raise RuntimeError(f"expected {len(batch)} embeddings, got {len(vectors)}")
+            return [list(vector) for vector in vectors]
+        return [ollama.embeddings(model=self.embedding_model, prompt=chunk)['embedding'] for chunk in batch]
+
     def store_chunks(self, chunks: List[str], embeddings: List[List[float]],
-                    metadata: Dict[str, str]) -> bool:
+                    metadata: Dict[str, str], start: int = 0, total: Optional[int] = None,
+                    save_indexes: bool = True) -> bool:
         """
         Store chunks and embeddings in ChromaDB.
 
+        Chunks are upserted under IDs derived from the source path, so
+        storing a document again replaces its chunks.
+
         Args:
             chunks: List of text chunks
             embeddings: List of embeddings
-            metadata: Metadata about the source file
+            metadata: Metadata about the source file (file_name, file_type,
+                and optionally source_path, its path relative to documents_dir)
+            start: Index of the first chunk within the document (when a
+                document is stored in batches)
+            total: Chunks in the whole document (default: len(chunks))
+            save_indexes: Write the BM25 and vector index files now; False
+                leaves it to their flush() (once per batched document)
 
         Returns:
             True if successful, False otherwise
@@ -345,29 +523,31 @@ class DocumentProcessor:
             return False
 
         try:
-            # Generate unique IDs for each chunk
-            file_hash = hashlib.md5(metadata['file_name'].encode()).hexdigest()[:8]
-            ids = [f"{file_hash}_chunk_{i}" for i in range(len(chunks))]
+            source = metadata.get('source_path', metadata['file_name'])
+            ids = self._chunk_ids(source, len(chunks), start)
 
             # Create metadata for each chunk
             metadatas = [
                 {
                     'file_name': metadata['file_name'],
                     'file_type': metadata['file_type'],
-                    'chunk_id': i,
-                    'total_chunks': len(chunks),
+                    'source_path': source,
+                    'chunk_id': start + i,
+                    'total_chunks': total or len(chunks),
                     'processed_at': datetime.now().isoformat()
                 }
                 for i in range(len(chunks))
             ]
 
-            # Add to collection
-            self.collection.add(
+            # Upsert into the collection (replaces a previous version)
+            self.collection.upsert(
                 ids=ids,
                 embeddings=embeddings,
                 documents=chunks,
                 metadatas=metadatas
             )
+            self.bm25_index.add(ids, chunks, metadatas, save=save_indexes)
+            self.vector_index.add(ids, embeddings, chunks, metadatas, save=save_indexes)
 
             self.logger.info(f"Stored {len(chunks)} chunks for {metadata['file_name']}")
             return True
@@ -376,101 +556,404 @@ class DocumentProcessor:
             self.logger.error(f"Failed to store chunks: {e}")
             return False
 
-    def process_all_documents(self, progress_callback: Optional[Callable[[int, int, str], None]] = None) -> Dict[str, any]:
+    @staticmethod
+    def _chunk_ids(source: str, count: int, start: int = 0) -> List[str]:
+        """Stable chunk IDs for a document (same path, same IDs)."""
+        source_hash = hashlib.md5(source.encode()).hexdigest()[:12]
+        return [f"{source_hash}_chunk_{i}" for i in range(start, start + count)]
+
+    def delete_chunks(self, ids: Sequence[str]) -> None:
         """
-        Process all documents in the documents directory.
+        Delete chunks from ChromaDB and the BM25 and vector indexes.
+
+        Args:
+            ids: Chunk IDs (unknown IDs are ignored)
+        """
+        ids = list(ids)
+        if not ids:
+            return
+        self.collection.delete(ids=ids)
+        self.bm25_index.remove(ids)
+        self.vector_index.delete(ids)
+
+    def _index_params(self) -> Dict[str, Any]:
+        """Settings that change stored chunks; a change re-indexes every document."""
+        params = {
+            'embed_model': self.embedding_model,
+            'chunk_size': self.chunk_size,
+            'chunk_overlap': self.chunk_overlap
+        }
+        # Only recorded when not the default, so existing manifests stay valid
+        chunk_unit = self._resolved_chunk_unit()
+        if chunk_unit != 'words':
+            params['chunk_unit'] = chunk_unit
+        return params
+
+    def _resolved_chunk_unit(self) -> str:
+        """
+        The unit chunks are actually sized in: 'words' if chunk_unit is
+        'tokens' but the model's tokenizer cannot be loaded. The tokenizer
+        is looked up once per process, so asking here spares extraction
+        workers a failed load each.
+        """
+        return self._chunker(self.chunk_size, self.chunk_overlap).unit
+
+    def process_all_documents(self, progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                              force: bool = False) -> Dict[str, any]:
+        """
+        Index new and changed documents in the documents directory.
+
+        Unchanged documents (per the index manifest) are skipped, chunks of
+        deleted documents are removed, and a changed document's chunks are
+        replaced. Text extraction and chunking run on extract_workers
+        processes; each file is embedded and stored as soon as it is
+        chunked. Progress counts files completed (1..total, in completion
+        order); errors are listed in scan order.
 
         Args:
             progress_callback: Optional callback function(current, total, message)
+            force: Re-index every document
 
         Returns:
             Statistics dictionary:
             {
                 'total_files': int,
                 'processed_files': int,
+                'unchanged_files': int,
+                'removed_files': int,
                 'failed_files': int,
-                'total_chunks': int,
+                'total_chunks': int,     # chunks stored in this run
+                'embedding_seconds': float,
+                'chunks_per_second': float,  # embedding throughput
                 'errors': List[str]
             }
         """
         stats = {
             'total_files': 0,
             'processed_files': 0,
+            'unchanged_files': 0,
+            'removed_files': 0,
             'failed_files': 0,
             'total_chunks': 0,
+            'embedding_seconds': 0.0,
+            'chunks_per_second': 0.0,
             'errors': []
         }
 
         # Scan for documents
-        documents = self.scan_documents()
+        try:
+            documents = self._scan_documents()
+        except Exception as e:
+            error_msg = f"Error scanning documents: {e}"
+            self.logger.error(error_msg)
+            stats['errors'].append(error_msg)
+            return stats
         stats['total_files'] = len(documents)
 
         if not documents:
             self.logger.warning("No documents found to process")
-            return stats
 
-        # Process each document
-        for idx, doc_info in enumerate(documents, 1):
-            file_name = doc_info['name']
-            file_path = doc_info['path']
+        # Forget documents that no longer exist
+        present = {doc_info['relative_path'] for doc_info in documents}
+        for key in self.manifest.keys():
+            if key not in present:
+                self.delete_chunks(self.manifest.remove(key))
+                stats['removed_files'] += 1
+                self.logger.info(f"Removed chunks of deleted document {key}")
+
+        params = self._index_params()
+        total = len(documents)
+
+        # Decide what needs indexing (in scan order)
+        errors: Dict[str, str] = {}
+        to_process = []
+        for doc_info in documents:
+            key = doc_info['relative_path']
+            try:
+                unchanged, content_hash = self.manifest.check(
+                    key, doc_info['path'], doc_info['size'], doc_info['mtime'], params
+                )
+            except OSError as e:
+                errors[key] = f"Error processing {doc_info['name']}: {str(e)}"
+                self.logger.error(errors[key])
+                continue
+            if unchanged and not force:
+                stats['unchanged_files'] += 1
+                continue
+            to_process.append(dict(doc_info, content_hash=content_hash or file_sha256(doc_info['path'])))
 
-            if progress_callback:
-                progress_callback(idx, len(documents), f"Processing {file_name}...")
+        done = stats['unchanged_files'] + len(errors)
+        if progress_callback and stats['unchanged_files']:
+            progress_callback(done, total, f"Skipped {stats['unchanged_files']} unchanged documents")
 
-            try:
-                # Extract text
-                text = self.extract_text(file_path)
-                if not text:
-                    error_msg = f"No text extracted from {file_name}"
-                    self.logger.warning(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['failed_files'] += 1
-                    continue
-
-                # Chunk text
-                chunks = self.chunk_text(text, chunk_size=self.chunk_size, overlap=self.chunk_overlap)
-                if not chunks:
-                    error_msg = f"No chunks created from {file_name}"
-                    self.logger.warning(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['failed_files'] += 1
-                    continue
-
-                # Create embeddings
-                embeddings = self.create_embeddings(chunks)
-                if not embeddings:
-                    error_msg = f"Failed to create embeddings for {file_name}"
-                    self.logger.error(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['failed_files'] += 1
-                    continue
-
-                # Store in database
-                metadata = {
-                    'file_name': file_name,
-                    'file_type': doc_info['extension']
-                }
+        # Extract and chunk in worker processes; embed and store each file here as it arrives
+        try:
+            for doc_info, spool_path, chunk_count, error in self._extract_chunks(to_process):
+                done += 1
+                file_name = doc_info['name']
+                key = doc_info['relative_path']
 
-                if self.store_chunks(chunks, embeddings, metadata):
-                    stats['processed_files'] += 1
-                    stats['total_chunks'] += len(chunks)
-                    self.logger.info(f"✅ Successfully processed {file_name} ({len(chunks)} chunks)")
-                else:
-                    error_msg = f"Failed to store chunks for {file_name}"
-                    self.logger.error(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['failed_files'] += 1
+                try:
+                    if progress_callback:
+                        progress_callback(done, total, f"Processing {file_name}...")
+
+                    if error:
+                        errors[key] = error
+                        self.logger.warning(error)
+                        continue
+
+                    # Embedding progress is reported within this file's step
+                    def file_progress(embedded, chunk_total, message, done=done, file_name=file_name):
+                        progress_callback(done, total, f"{file_name}: {message}")
+
+                    try:
+                        error = self._index_document(doc_info, spool_path, chunk_count, params, stats,
+                                                     file_progress if progress_callback else None)
+                    except Exception as e:
+                        error = f"Error processing {file_name}: {str(e)}"
+                    if error:
+                        errors[key] = error
+                        self.logger.error(error)
+                finally:
+                    if spool_path:
+                        os.remove(spool_path)
+        except BaseException:
+            # Keep what was indexed before the failure
+            self.manifest.save()
+            raise
 
-            except Exception as e:
-                error_msg = f"Error processing {file_name}: {str(e)}"
-                self.logger.error(error_msg)
-                stats['errors'].append(error_msg)
-                stats['failed_files'] += 1
+        # Same counts and error order however the workers were scheduled
+        stats['failed_files'] = len(errors)
+        stats['errors'] = [errors[doc_info['relative_path']] for doc_info in documents
+                           if doc_info['relative_path'] in errors]
+
+        if stats['embedding_seconds']:
+            stats['chunks_per_second'] = round(stats['total_chunks'] / stats['embedding_seconds'], 1)
+
+        # Only after a clean run: a file that failed to re-index keeps its old chunks
+        orphans = 0 if stats['failed_files'] else self._delete_orphan_chunks()
+        self.manifest.save()
+
+        if stats['processed_files'] or stats['removed_files'] or orphans:
+            self._mark_indexed()
 
         # Final summary
-        self.logger.info(f"Processing complete: {stats['processed_files']}/{stats['total_files']} files")
+        self.logger.info(
+            f"Processing complete: {stats['processed_files']}/{stats['total_files']} files "
+            f"({stats['unchanged_files']} unchanged, {stats['removed_files']} removed, "
+            f"{stats['chunks_per_second']:.0f} chunks/s)"
+        )
         return stats
 
+    def _index_document(self, doc_info: Dict[str, Any], spool_path: str, chunk_count: int,
+                        params: Dict[str, Any], stats: Dict[str, Any],
+                        progress_callback: Optional[Callable[[int, int, str], None]] = None) -> Optional[str]:
+        """
+        Embed and store one document's spooled chunks and record it in the manifest.
+
+        Chunks are read, embedded and stored STORE_BATCH_CHUNKS at a time.
+        Each batch goes into the BM25 and vector indexes without saving;
+        their files are written once, after the last batch. Until then
+        the vector index holds the document's rows as float32, not the
+        chunks' Python embedding lists.
+
+        Args:
+            doc_info: Document from scan_documents, plus its content_hash
+            spool_path: JSON-lines file of chunks (see _spool_chunks)
+            chunk_count: Number of chunks in the spool file
+            params: Indexing parameters for the manifest
+            stats: process_all_documents statistics (updated)
+            progress_callback: Optional callback(embedded, chunk_count, message)
+
+        Returns:
+            Error message, or None on success
+        """
+        file_name = doc_info['name']
+        key = doc_info['relative_path']
+        metadata = {
+            'file_name': file_name,
+            'file_type': doc_info['extension'],
+            'source_path': key
+        }
+        stored = 0
+        start_time = time.perf_counter()
+
+        def batch_progress(embedded, batch_total, message):
+            done = stored + embedded
+            rate = done / max(time.perf_counter() - start_time, 1e-6)
+            progress_callback(done, chunk_count, f"Embedded {done}/{chunk_count} chunks ({rate:.0f} chunks/s)")
+
+        try:
+            with open(spool_path, 'r', encoding='utf-8') as spool:
+                chunk_iter = (json.loads(line) for line in spool)
+                while True:
+                    batch = list(itertools.islice(chunk_iter, self.STORE_BATCH_CHUNKS))
+                    if not batch:
+                        break
+
+                    embed_start = time.perf_counter()
+                    embeddings = self.create_embeddings(batch, batch_progress if progress_callback else None)
+                    stats['embedding_seconds'] += time.perf_counter() - embed_start
+                    if not embeddings:
+                        return f"Failed to create embeddings for {file_name}"
+
+                    if not self.store_chunks(batch, embeddings, metadata, start=stored, total=chunk_count,
+                                             save_indexes=False):
+                        return f"Failed to store chunks for {file_name}"
+                    stored += len(batch)
+        finally:
+            # One write of each index per document (also keeps a failed document's stored batches)
+            self.bm25_index.flush()
+            self.vector_index.flush()
+
+        # A shorter new version leaves chunks past its end behind
+        chunk_ids = self._chunk_ids(key, stored)
+        previous = self.manifest.get(key)
+        if previous:
+            self.delete_chunks(sorted(set(previous['chunk_ids']) - set(chunk_ids)))
+        self.manifest.put(key, doc_info['size'], doc_info['mtime'], doc_info['content_hash'], params, chunk_ids)
+
+        stats['processed_files'] += 1
+        stats['total_chunks'] += stored
+        self.logger.info(f"✅ Successfully processed {file_name} ({stored} chunks)")
+        return None
+
+    def _extract_chunks(self, documents: List[Dict[str, Any]]
+                        ) -> Iterator[Tuple[Dict[str, Any], Optional[str], int, Optional[str]]]:
+        """
+        Extract and chunk documents on a process pool, page by page into
+        spool files (see _spool_chunks).
+
+        Results are yielded as each file finishes, in completion order. At
+        most two files per worker are in flight, so spooled chunks waiting
+        for the (slower) embedding step stay bounded. Without at least two PDF/DOCX
+        files the pool's startup costs more than it saves, so plain text is
+        processed in this process.
+
+        If a worker dies (BrokenProcessPool), the files in flight are
+        reported as failed and the pool is restarted for the rest.
+
+        Args:
+            documents: Documents from scan_documents
+
+        Yields:
+            (doc_info, spool path, chunk count, error message) with either
+            a spool file (the caller deletes it) or an error
+        """
+        heavy = sum(1 for doc_info in documents if doc_info['extension'] in self.POOL_EXTENSIONS)
+        workers = min(self.extract_workers, heavy)
+        # Workers only load the tokenizer if this process could
+        chunk_unit = self._resolved_chunk_unit()
+        if workers <= 1:
+            for doc_info in documents:
+                spool_path = _new_spool_path()
+                try:
+                    chunk_count, error = _spool_chunks(
+                        doc_info['path'], doc_info['name'], spool_path, self.chunk_size, self.chunk_overlap,
+                        chunk_unit, self.embedding_model
+                    )
+                except BaseException:
+                    os.remove(spool_path)
+                    raise
+                if error:
+                    os.remove(spool_path)
+                    spool_path = None
+                yield doc_info, spool_path, chunk_count, error
+            return
+
+        # spawn: forking a process with ChromaDB and Ollama client threads is unsafe
+        context = multiprocessing.get_context('spawn')
+        queue = deque(documents)
+        while queue:
+            pending: Dict[Any, Tuple[Dict[str, Any], str]] = {}
+            broken = False
+            submitted = 0
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            try:
+                def fill():
+                    # Keep two files per worker in flight; unsent files wait for the next pool
+                    nonlocal broken, submitted
+                    while queue and not broken and len(pending) < 2 * workers:
+                        doc_info = queue.popleft()
+                        spool_path = _new_spool_path()
+                        try:
+                            future = pool.submit(_spool_chunks, doc_info['path'], doc_info['name'], spool_path,
+                                                 self.chunk_size, self.chunk_overlap,
+                                                 chunk_unit, self.embedding_model)
+                        except BrokenProcessPool:
+                            os.remove(spool_path)
+                            queue.appendleft(doc_info)
+                            broken = True
+                        else:
+                            pending[future] = (doc_info, spool_path)
+                            submitted += 1
+
+                fill()
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        doc_info, spool_path = pending.pop(future)
+                        try:
+                            chunk_count, error = future.result()
+                        except BrokenProcessPool as e:
+                            # A worker died (e.g. crashed on this or another file in flight);
+                            # every file in flight fails, the rest go to a new pool
+                            broken = True
+                            chunk_count, error = 0, f"Error processing {doc_info['name']}: extraction worker crashed ({e})"
+                        except Exception as e:
+                            chunk_count, error = 0, f"Error processing {doc_info['name']}: {str(e)}"
+                        if error:
+                            os.remove(spool_path)
+                            spool_path = None
+                        yield doc_info, spool_path, chunk_count, error
+                    fill()
+            finally:
+                # Closed early (or failed): don't leave spool files of unclaimed results behind
+                pool.shutdown(wait=True, cancel_futures=True)
+                for _, spool_path in pending.values():
+                    os.remove(spool_path)
+            if broken and not submitted:
+                # A pool that takes no work at all would be restarted forever
+                while queue:
+                    doc_info = queue.popleft()
+                    yield doc_info, None, 0, f"Error processing {doc_info['name']}: extraction pool failed to start"
+            elif broken and queue:
+                self.logger.warning(f"Extraction pool broke; restarting it for {len(queue)} remaining documents")
+
+    def _delete_orphan_chunks(self) -> int:
+        """
+        Delete stored chunks the manifest does not account for (e.g. chunks
+        stored before the manifest existed, under the old file-name IDs).
+
+        Returns:
+            Number of chunks deleted
+        """
+        try:
+            stored = set(self.collection.get(include=[])['ids'])
+        except Exception as e:
+            self.logger.warning(f"Could not list stored chunks: {e}")
+            return 0
+
+        orphans = sorted(stored - self.manifest.chunk_ids())
+        if orphans:
+            self.delete_chunks(orphans)
+            self.logger.info(f"Deleted {len(orphans)} orphaned chunks")
+        return len(orphans)
+
+    def _mark_indexed(self) -> None:
+        """
+        Record when the collection was last (re-)indexed in its metadata.
+
+        LLMEngine includes this in its index fingerprint, so cached answers
+        are invalidated whenever documents change.
+        """
+        try:
+            metadata = dict(self.collection.metadata or {})
+            metadata['indexed_at'] = datetime.now().isoformat()
+            self.collection.modify(metadata=metadata)
+        except Exception as e:
+            self.logger.warning(f"Failed to record index time: {e}")
+
     def get_stats(self) -> Dict[str, any]:
         """
         Get current database statistics.
@@ -528,6 +1011,11 @@ class DocumentProcessor:
                 name=self.COLLECTION_NAME,
                 metadata={"description": "Interview preparation context documents"}
             )
+            self.bm25_index.clear()
+            self.vector_index.clear()
+            self.manifest.clear()
+            self.manifest.save()
+            self._mark_indexed()
 
             self.logger.info("Database cleared successfully")
             return True
@@ -552,12 +1040,12 @@ class DocumentProcessor:
             return []
 
         try:
-            # Create embedding for query
-            response = ollama.embeddings(
-                model=self.EMBEDDING_MODEL,
-                prompt=query_text
+            # Create embedding for query (cached across queries and restarts)
+            query_embedding = self.embedding_cache.get_or_compute(
+                self.embedding_model,
+                query_text,
+                lambda text: ollama.embeddings(model=self.embedding_model, prompt=text)['embedding']
             )
-            query_embedding = response['embedding']
 
             # Query collection
             results = self.collection.query(
@@ -581,6 +1069,60 @@ class DocumentProcessor:
             return []
 
 
+def _spool_chunks(file_path: str, file_name: str, spool_path: str, chunk_size: int, chunk_overlap: int,
+                  chunk_unit: str = "words",
+                  embedding_model: str = DocumentProcessor.EMBEDDING_MODEL
+                  ) -> Tuple[int, Optional[str]]:
+    """
+    Extract and chunk one file page by page into a JSON-lines spool file
+    (process pool worker, or called directly).
+
+    Only one page and the chunk being built are in memory. The extraction
+    and chunking methods only use the logger and the chunking settings, so
+    a bare instance without a ChromaDB client is enough. The caller creates
+    and deletes the spool file, so it is not lost if this worker dies.
+
+    Returns:
+        (chunk count, None), or (0, error message)
+    """
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    processor.logger = logging.getLogger(__name__)
+    processor.chunk_unit = chunk_unit
+    processor.embedding_model = embedding_model
+
+    pages_with_text = 0
+
+    def pages():
+        nonlocal pages_with_text
+        for page in processor.iter_pages(file_path):
+            if page.strip():
+                pages_with_text += 1
+            yield page
+
+    count = 0
+    try:
+        with open(spool_path, 'w', encoding='utf-8') as spool:
+            for chunk in processor.iter_chunks(pages(), chunk_size, chunk_overlap):
+                spool.write(json.dumps(chunk) + '\n')
+                count += 1
+    except Exception as e:
+        processor.logger.error(f"Failed to extract text from {file_path}: {e}")
+        count = 0
+
+    if count:
+        return count, None
+    if not pages_with_text:
+        return 0, f"No text extracted from {file_name}"
+    return 0, f"No chunks created from {file_name}"
+
+
+def _new_spool_path() -> str:
+    """Create an empty temporary spool file for _spool_chunks."""
+    fd, spool_path = tempfile.mkstemp(prefix="chunks_", suffix=".jsonl")
+    os.close(fd)
+    return spool_path
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -0,0 +1,330 @@
+"""
+Embedding Cache for Interview Whisperer
+
+Two-tier cache of text embeddings, keyed by embedding model and text:
+
+- Memory: an LRU bounded by a byte budget (vectors are float32)
+- Disk: a SQLite table of float32 blobs that survives restarts
+
+Lookups fall through memory → disk → the embedding function, and results
+are promoted back up. One cache per file is shared by every component in
+the process (LLMEngine questions, DocumentProcessor queries), and the
+SQLite file is shared between processes. Access times used to prune the
+disk tier are buffered and written in batches, so hits do not commit.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bookkeeping bytes charged per memory entry on top of the vector itself
+_ENTRY_OVERHEAD_BYTES = 200
+
+# Buffered access times written to disk in one batch
+_TOUCH_FLUSH_ENTRIES = 100
+
+
+def cache_key(model: str, text: str) -> str:
+    """Key for an embedding: model name plus whitespace-normalized text."""
+    # Case is kept: embedding models are case-sensitive
+    normalized = " ".join(text.split())
+    return hashlib.md5(f"{model}\0{normalized}".encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Memory LRU in front of a persistent SQLite store.
+
+    Usage:
+        cache = shared_embedding_cache(DATA_DIR / "embedding_cache.sqlite3")
+        vector = cache.get_or_compute(model, text, embed_fn)
+
+    Thread-safe; the SQLite connection is shared between threads under
+    the cache lock.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None],
+        memory_budget_bytes: int = 32 * 1024 * 1024,
+        max_disk_entries: int = 100_000
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file (None keeps the cache in memory only)
+            memory_budget_bytes: Bytes of vectors kept in the memory tier
+            max_disk_entries: Entries kept on disk (least recently used pruned)
+        """
+        self.path = Path(path) if path is not None else None
+        self.memory_budget_bytes = memory_budget_bytes
+        self.max_disk_entries = max_disk_entries
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._writes_since_prune = 0
+        self._touched: Dict[str, float] = {}  # key -> last use not yet written to disk
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.path is not None:
+            self._open_db()
+
+    def _open_db(self) -> None:
+        """Open (or create) the SQLite store; failures fall back to memory only."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5.0)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT NOT NULL,"
+                " dim INTEGER NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache store unavailable ({self.path}): {e}; using memory only")
+            self._db = None
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """
+        Look up an embedding.
+
+        Args:
+            model: Embedding model name
+            text: Embedded text
+
+        Returns:
+            The embedding, or None if neither tier has it
+        """
+        key = cache_key(model, text)
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                self._touch(key)
+                return vector.tolist()
+
+            vector = self._read_disk(key)
+            if vector is not None:
+                self.disk_hits += 1
+                self._touch(key)
+                self._remember(key, vector)
+                return vector.tolist()
+
+            self.misses += 1
+            return None
+
+    def put(self, model: str, text: str, embedding: Sequence[float]) -> None:
+        """
+        Store an embedding in both tiers.
+
+        Args:
+            model: Embedding model name
+            text: Embedded text
+            embedding: The embedding
+        """
+        key = cache_key(model, text)
+        vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._remember(key, vector)
+            self._write_disk(key, model, vector)
+
+    def get_or_compute(self, model: str, text: str,
+                       compute: Callable[[str], Sequence[float]]) -> List[float]:
+        """
+        Return the cached embedding, computing and storing it on a miss.
+
+        Args:
+            model: Embedding model name
+            text: Text to embed
+            compute: compute(text) -> embedding, called on a miss
+
+        Returns:
+            The embedding
+        """
+        embedding = self.get(model, text)
+        if embedding is None:
+            embedding = list(compute(text))
+            self.put(model, text, embedding)
+        return embedding
+
+    def clear(self, model: Optional[str] = None) -> None:
+        """
+        Drop cached embeddings from both tiers.
+
+        Args:
+            model: Only drop this model's embeddings from disk (the memory
+                tier is always emptied)
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._touched.clear()
+            if self._db is not None:
+                try:
+                    if model is None:
+                        self._db.execute("DELETE FROM embeddings")
+                    else:
+                        self._db.execute("DELETE FROM embeddings WHERE model = ?", (model,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to clear embedding cache store: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with per-tier sizes, hit/miss/eviction counters and
+            hit rate
+        """
+        with self._lock:
+            disk_entries = None
+            if self._db is not None:
+                try:
+                    disk_entries = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'memory_budget_bytes': self.memory_budget_bytes,
+                'disk_entries': disk_entries,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0
+            }
+
+    def close(self) -> None:
+        """Write buffered access times and close the SQLite store."""
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._flush_touched()
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Embedding cache access times not written: {e}")
+                self._db.close()
+                self._db = None
+
+    # -------------------------------------------------------------------------
+    # Internals (lock held)
+    # -------------------------------------------------------------------------
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Add to the memory tier, evicting least recently used entries over budget."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes + _ENTRY_OVERHEAD_BYTES
+
+        self._memory[key] = vector
+        self._memory_bytes += vector.nbytes + _ENTRY_OVERHEAD_BYTES
+
+        while self._memory_bytes > self.memory_budget_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes + _ENTRY_OVERHEAD_BYTES
+            self.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[np.ndarray]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute("SELECT vector FROM embeddings WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache read failed: {e}")
+            return None
+        return np.frombuffer(row[0], dtype=np.float32).copy()
+
+    def _write_disk(self, key: str, model: str, vector: np.ndarray) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, dim, vector, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, model, int(vector.shape[0]), vector.tobytes(), time.time())
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 100:
+                self._writes_since_prune = 0
+                # Prune by up-to-date access times
+                self._flush_touched()
+                self._db.execute(
+                    "DELETE FROM embeddings WHERE key IN ("
+                    " SELECT key FROM embeddings ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,)
+                )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache write failed: {e}")
+
+    def _touch(self, key: str) -> None:
+        """Record a use of key for disk pruning, writing a batch when enough are pending."""
+        if self._db is None:
+            return
+        self._touched[key] = time.time()
+        if len(self._touched) >= _TOUCH_FLUSH_ENTRIES:
+            try:
+                self._flush_touched()
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"Embedding cache access times not written: {e}")
+
+    def _flush_touched(self) -> None:
+        """Write buffered access times (the caller commits)."""
+        if self._touched:
+            touched = [(last_used, key) for key, last_used in self._touched.items()]
+            self._touched.clear()
+            self._db.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", touched)
+
+
+# Process-wide caches, one per file
+_shared: Dict[str, EmbeddingCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_embedding_cache(path: Union[str, Path], **kwargs: Any) -> EmbeddingCache:
+    """
+    Get the process-wide cache for a file, creating it on first use.
+
+    Args:
+        path: SQLite file
+        **kwargs: EmbeddingCache options (used only when the cache is created)
+
+    Returns:
+        The shared EmbeddingCache
+    """
+    key = str(Path(path).resolve())
+    with _shared_lock:
+        cache = _shared.get(key)
+        if cache is None:
+            cache = EmbeddingCache(path, **kwargs)
+            _shared[key] = cache
+        return cache
@@ -0,0 +1,203 @@
+"""
+Index Manifest for Interview Whisperer
+
+Records what DocumentProcessor indexed from each document so re-runs only
+process what changed. Per document (keyed by its path relative to the
+documents directory):
+
+- size, mtime and SHA-256 of the file content
+- the indexing parameters (embedding model, chunk size and overlap)
+- the IDs of the chunks stored for it
+
+A file whose size and mtime are unchanged is skipped without reading it;
+otherwise its content hash decides (a touched but unchanged file is not
+re-embedded). Changing any indexing parameter re-indexes everything.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: Union[str, Path], block_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file's content, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IndexManifest:
+    """
+    JSON manifest of indexed documents.
+
+    Usage:
+        manifest = IndexManifest(DATA_DIR / "index_manifest.json")
+        unchanged, content_hash = manifest.check(key, path, size, mtime, params)
+        if not unchanged:
+            ...index the file...
+            manifest.put(key, size, mtime, content_hash, params, chunk_ids)
+        manifest.save()
+
+    Owned by one DocumentProcessor; not thread-safe.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the manifest and load it from disk if present.
+
+        Args:
+            path: JSON file for persistence
+        """
+        self.path = Path(path)
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._files
+
+    def keys(self) -> List[str]:
+        """Keys (relative paths) of every indexed document."""
+        return list(self._files)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Manifest entry for a document, or None."""
+        return self._files.get(key)
+
+    def check(
+        self,
+        key: str,
+        path: Union[str, Path],
+        size: int,
+        mtime: float,
+        params: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Decide whether a document needs (re-)indexing.
+
+        Args:
+            key: Document key
+            path: File to hash if its size or mtime changed
+            size: Current file size
+            mtime: Current modification time
+            params: Current indexing parameters
+
+        Returns:
+            (whether the indexed chunks are current, content hash; None when
+            the file was skipped on size and mtime alone)
+        """
+        entry = self._files.get(key)
+        if entry is None or entry['params'] != params:
+            return False, file_sha256(path)
+        if entry['size'] == size and entry['mtime'] == mtime:
+            return True, None
+
+        content_hash = file_sha256(path)
+        if content_hash != entry['sha256']:
+            return False, content_hash
+
+        # Touched but not modified: remember the new mtime to skip hashing next time
+        entry['size'], entry['mtime'] = size, mtime
+        self._dirty = True
+        return True, content_hash
+
+    def put(
+        self,
+        key: str,
+        size: int,
+        mtime: float,
+        content_hash: str,
+        params: Dict[str, Any],
+        chunk_ids: List[str]
+    ) -> None:
+        """Record a freshly indexed document."""
+        self._files[key] = {
+            'size': size,
+            'mtime': mtime,
+            'sha256': content_hash,
+            'params': dict(params),
+            'chunk_ids': list(chunk_ids),
+            'indexed_at': datetime.now().isoformat()
+        }
+        self._dirty = True
+
+    def remove(self, key: str) -> List[str]:
+        """
+        Forget a document.
+
+        Returns:
+            The chunk IDs that were stored for it
+        """
+        entry = self._files.pop(key, None)
+        if entry is None:
+            return []
+        self._dirty = True
+        return entry['chunk_ids']
+
+    def chunk_ids(self) -> Set[str]:
+        """IDs of every chunk the manifest accounts for."""
+        return {chunk_id for entry in self._files.values() for chunk_id in entry['chunk_ids']}
+
+    def clear(self) -> None:
+        """Forget every document (written on the next save)."""
+        if self._files:
+            self._files.clear()
+            self._dirty = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get manifest statistics.
+
+        Returns:
+            Dictionary with document and chunk counts and the file path
+        """
+        return {
+            'documents': len(self._files),
+            'chunks': sum(len(entry['chunk_ids']) for entry in self._files.values()),
+            'path': str(self.path)
+        }
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename) if it changed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'files': self._files}, f, indent=1)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to persist index manifest: {e}")
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index manifest {self.path}: {e}")
+            return
+        if data.get('version') != self.VERSION:
+            logger.info("Index manifest version changed; re-indexing all documents")
+            return
+        self._files = data.get('files', {})
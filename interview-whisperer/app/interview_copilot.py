@@ -12,6 +12,7 @@ Orchestrates all components of Interview Whisperer:
 import threading
 import time
 import json
+from concurrent.futures import CancelledError
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
 from datetime import datetime
@@ -27,12 +28,19 @@ try:
         DATA_DIR,
         CHROMA_DB_DIR,
         LOGS_DIR,
+        QUESTION_BANK_FILE,
         check_ollama_running,
         logger
     )
     from .document_processor import DocumentProcessor
-    from .audio_engine import AudioEngine
+    from .audio_engine import AudioEngine, AudioConfig
+    from .model_registry import model_registry
+    from .latency_trace import LatencyStats, LatencyTrace
+    from .speculative_retrieval import SpeculativeRetriever
+    from .question_scheduler import QuestionJob, QuestionScheduler
+    from .answer_bank import load_questions
     from .llm_engine import LLMEngine
+    from .ollama_keepalive import OllamaKeepAlive
     from .overlay import OverlayWindow
 except ImportError:
     # Fallback for direct execution
@@ -44,12 +52,19 @@ except ImportError:
         DATA_DIR,
         CHROMA_DB_DIR,
         LOGS_DIR,
+        QUESTION_BANK_FILE,
         check_ollama_running,
         logger
     )
     from document_processor import DocumentProcessor
-    from audio_engine import AudioEngine
+    from audio_engine import AudioEngine, AudioConfig
+    from model_registry import model_registry
+    from latency_trace import LatencyStats, LatencyTrace
+    from speculative_retrieval import SpeculativeRetriever
+    from question_scheduler import QuestionJob, QuestionScheduler
+    from answer_bank import load_questions
     from llm_engine import LLMEngine
+    from ollama_keepalive import OllamaKeepAlive
     from overlay import OverlayWindow
 
 
@@ -71,6 +86,21 @@ class InterviewCopilot:
     5. Session logged for review
     """
 
+    # Answer length, and the shorter length used while transcription lags
+    ANSWER_MAX_TOKENS = 250
+    LAGGING_ANSWER_MAX_TOKENS = 120
+
+    # End-to-end target: question captured → answer on screen
+    LATENCY_SLO_SECONDS = 3.0
+
+    # Longest wait for a speculative retrieval that is still running
+    SPECULATIVE_WAIT_SECONDS = 5.0
+
+    # A pre-generated answer is shown as final only for a close match with
+    # a confident answer; otherwise it is shown while a fresh one is generated
+    BANK_FINAL_SIMILARITY = 0.95
+    BANK_FINAL_CONFIDENCE = 0.6
+
     def __init__(self, settings_manager=None):
         """
         Initialize the Interview Copilot.
@@ -86,18 +116,73 @@ class InterviewCopilot:
         self._session_start_time: Optional[float] = None
         self._session_log: Dict[str, Any] = {}
         self._questions_answered = 0
+        self._lagging_questions = 0
+        self._latency_stats = LatencyStats(slo_seconds=self.LATENCY_SLO_SECONDS)
 
         # Components (initialized on demand)
         self.document_processor: Optional[DocumentProcessor] = None
         self.audio_engine: Optional[AudioEngine] = None
         self.llm_engine: Optional[LLMEngine] = None
         self.overlay: Optional[OverlayWindow] = None
+        self.speculative_retriever: Optional[SpeculativeRetriever] = None
+        self.ollama_keepalive: Optional[OllamaKeepAlive] = None
+        self._first_question_pending = False
+        self._stream_answers = True
+        self._use_answer_bank = True
+        self._bank_answers = 0
+        self._bank_refinements = 0
 
         # Threading
         self._lock = threading.Lock()
 
+        # Questions are answered one at a time; a newer question supersedes
+        # an older one instead of competing with it for the model
+        self.question_scheduler = QuestionScheduler(self._run_question_job)
+
+        # Start loading Whisper now so interview mode starts without waiting
+        self._whisper_model = self._configured_whisper_model()
+        self._preload_whisper()
+
         self.logger.info("InterviewCopilot initialized")
 
+    def _configured_whisper_model(self) -> str:
+        """Whisper model name from settings, or the config.py default."""
+        if self.settings_manager:
+            return self.settings_manager.audio.whisper_model
+        return WHISPER_MODEL
+
+    def _preload_whisper(self) -> None:
+        """Load the Whisper model in this process, unless a worker pool will decode."""
+        if self.settings_manager:
+            audio = self.settings_manager.audio
+            if not audio.streaming and audio.transcription_workers > 1:
+                return
+        model_registry.load_async(self._whisper_model)
+
+    def apply_settings(self) -> None:
+        """
+        React to saved settings.
+
+        If the Whisper model changed, the old model is evicted from the
+        shared registry and the new one starts loading in the background;
+        an existing audio engine is rebuilt around it. During a session the
+        change is deferred until stop_interview_mode, which calls this again.
+        """
+        new_model = self._configured_whisper_model()
+        if new_model == self._whisper_model:
+            return
+
+        if self._is_active:
+            self.logger.info(f"Whisper model change to '{new_model}' applies when interview mode stops")
+            return
+
+        if self.audio_engine is not None:
+            self.audio_engine = self._create_audio_engine(self.settings_manager.get_audio_config())
+        else:
+            model_registry.evict(self._whisper_model)
+            self._whisper_model = new_model
+            self._preload_whisper()
+
     def initialize_components(self) -> bool:
         """
         Initialize all components using settings if available.
@@ -129,35 +214,47 @@ class InterviewCopilot:
                 db_path=str(CHROMA_DB_DIR),
                 chunk_size=doc_config.get('chunk_size', 500),
                 chunk_overlap=doc_config.get('chunk_overlap', 50),
+                chunk_unit=doc_config.get('chunk_unit', 'words'),
+                embed_batch_size=doc_config.get('embed_batch_size', 32),
+                embed_concurrency=doc_config.get('embed_concurrency', 2),
+                extract_workers=doc_config.get('extract_workers', 0),
                 supported_extensions=set(doc_config.get('supported_extensions', ['.pdf', '.docx', '.txt', '.md'])),
-                embedding_model=llm_config.get('embed_model', 'nomic-embed-text')
+                embedding_model=llm_config.get('embed_model', 'nomic-embed-text'),
+                vector_dtype=llm_config.get('vector_dtype', 'float32')
             )
             self.logger.info("✓ Document processor initialized")
 
             # Initialize LLM engine
-            self.llm_engine = LLMEngine(
-                db_path=str(CHROMA_DB_DIR),
-                model=llm_config.get('model', OLLAMA_LLM_MODEL),
-                embed_model=llm_config.get('embed_model', 'nomic-embed-text')
-            )
+            self.llm_engine = self._create_llm_engine(llm_config)
             self.logger.info("✓ LLM engine initialized")
 
-            # Initialize audio engine with AudioConfig
-            from audio_engine import AudioConfig
-            audio_cfg = AudioConfig(
-                sample_rate=audio_config.get('sample_rate', 16000),
-                channels=audio_config.get('channels', 1),
-                chunk_duration=audio_config.get('chunk_duration', 5.0),
-                silence_threshold=audio_config.get('silence_threshold', 0.01),
-                silence_duration=audio_config.get('silence_duration', 1.5),
-                context_duration=audio_config.get('context_duration', 30.0)
-            )
-            self.audio_engine = AudioEngine(
-                model=audio_config.get('model', WHISPER_MODEL),
-                language="en",
-                config=audio_cfg
-            )
-            self.logger.info("✓ Audio engine initialized")
+            self._stream_answers = llm_config.get('stream_answers', True)
+
+            # Keep Ollama models loaded for the length of each session
+            self.ollama_keepalive = None
+            if llm_config.get('keep_models_warm', True):
+                self.ollama_keepalive = OllamaKeepAlive(
+                    self.llm_engine.model,
+                    self.llm_engine.embed_model,
+                    keep_alive=f"{llm_config.get('keep_alive_minutes', 10)}m",
+                    heartbeat_interval=llm_config.get('keep_alive_interval', 60.0),
+                    draft_model=self.llm_engine.draft_model
+                )
+
+            # Retrieve context while questions are still being spoken. Only
+            # streaming mode has partial transcripts: with VAD chunks the
+            # question arrives as one final utterance, and prefetching the
+            # utterances before it rarely matches the question closely
+            # enough to be used
+            if llm_config.get('speculative_retrieval', True) and audio_config.get('streaming', False):
+                n_results = llm_config.get('n_results', 3)
+                self.speculative_retriever = SpeculativeRetriever(
+                    lambda text: self.llm_engine.retrieve_context(text, n_results=n_results)
+                )
+
+            # Initialize audio engine (model shared via the registry)
+            self.audio_engine = self._create_audio_engine(audio_config)
+            self.logger.info(f"✓ Audio engine initialized (Whisper model {self.audio_engine.get_status()['model_status']})")
 
             # Initialize overlay
             self.overlay = OverlayWindow(
@@ -178,6 +275,117 @@ class InterviewCopilot:
             self.logger.error(f"Failed to initialize components: {e}", exc_info=True)
             return False
 
+    def _llm_config(self) -> Dict[str, Any]:
+        """LLM config from settings, or the config.py defaults."""
+        if self.settings_manager:
+            return self.settings_manager.get_llm_config()
+        return {'model': OLLAMA_LLM_MODEL}
+
+    def _create_llm_engine(self, llm_config: Dict[str, Any]) -> LLMEngine:
+        """Build an LLMEngine from an LLM config dict."""
+        self._use_answer_bank = llm_config.get('answer_bank', True)
+        return LLMEngine(
+            db_path=str(CHROMA_DB_DIR),
+            model=llm_config.get('model', OLLAMA_LLM_MODEL),
+            embed_model=llm_config.get('embed_model', 'nomic-embed-text'),
+            answer_cache=llm_config.get('answer_cache', True),
+            answer_cache_threshold=llm_config.get('answer_cache_threshold', 0.92),
+            answer_bank_threshold=llm_config.get('answer_bank_threshold', 0.85),
+            retrieval_mode=llm_config.get('retrieval_mode', 'hybrid'),
+            embedding_timeout=llm_config.get('embedding_timeout', 2.0),
+            vector_backend=llm_config.get('vector_backend', 'chroma'),
+            vector_dtype=llm_config.get('vector_dtype', 'float32'),
+            prompt_cache=llm_config.get('prompt_cache', True),
+            draft_model=llm_config.get('draft_model') or None,
+            refine_threshold=llm_config.get('refine_threshold', 0.8),
+            parallel_refine=llm_config.get('parallel_refine', False)
+        )
+
+    def answer_bank_needs_build(self) -> bool:
+        """
+        Whether the answer bank is enabled but empty or built for another
+        index (different documents or models).
+
+        Creates the LLM engine if interview mode has not started yet.
+        """
+        llm_config = self._llm_config()
+        if not llm_config.get('answer_bank', True):
+            return False
+        if self.llm_engine is None:
+            self.llm_engine = self._create_llm_engine(llm_config)
+        return not self.llm_engine.answer_bank_current()
+
+    def build_answer_bank(self, progress_callback: Optional[Callable[[int, int, str], None]] = None) -> Dict[str, Any]:
+        """
+        Pre-generate answers for the question bank (run after processing documents).
+
+        The bank holds the built-in common questions plus any listed in
+        QUESTION_BANK_FILE (one per line). The LLM engine is created if
+        interview mode has not started yet.
+
+        Args:
+            progress_callback: Optional callback function(current, total, message)
+
+        Returns:
+            Build statistics (questions, stored, failed, errors, elapsed)
+        """
+        llm_config = self._llm_config()
+        if self.llm_engine is None:
+            self.llm_engine = self._create_llm_engine(llm_config)
+
+        workers = llm_config.get('answer_bank_workers', 4)
+
+        questions = load_questions(QUESTION_BANK_FILE)
+        self.logger.info(f"Building answer bank for {len(questions)} questions ({workers} concurrent)...")
+        return self.llm_engine.build_answer_bank(questions, workers=workers, progress_callback=progress_callback)
+
+    def _create_audio_engine(self, audio_config: Dict[str, Any]) -> AudioEngine:
+        """
+        Build an AudioEngine from an audio config dict.
+
+        Construction is cheap: the Whisper model comes from the shared
+        registry and loads in the background if it is not ready yet. A
+        different model than the current one evicts the old model. The
+        engine being replaced is closed (its worker pool shut down).
+
+        Args:
+            audio_config: Audio settings (see SettingsManager.get_audio_config)
+
+        Returns:
+            New AudioEngine instance
+        """
+        audio_cfg = AudioConfig(
+            sample_rate=audio_config.get('sample_rate', 16000),
+            channels=audio_config.get('channels', 1),
+            chunk_duration=audio_config.get('chunk_duration', 5.0),
+            segmentation=audio_config.get('segmentation', 'vad'),
+            silence_threshold=audio_config.get('silence_threshold', 0.01),
+            silence_duration=audio_config.get('silence_duration', 1.5),
+            context_duration=audio_config.get('context_duration', 30.0),
+            streaming=audio_config.get('streaming', False),
+            stream_step=audio_config.get('stream_step', 1.0),
+            stream_window=audio_config.get('stream_window', 10.0),
+            transcription_workers=audio_config.get('transcription_workers', 1),
+            queue_size=audio_config.get('queue_size', 8),
+            queue_policy=audio_config.get('queue_policy', 'coalesce'),
+            max_chunk_age=audio_config.get('max_chunk_age', 10.0)
+        )
+
+        whisper_model = audio_config.get('model', WHISPER_MODEL)
+        if whisper_model != self._whisper_model:
+            self.logger.info(f"Switching Whisper model: {self._whisper_model} → {whisper_model}")
+            model_registry.evict(self._whisper_model)
+            self._whisper_model = whisper_model
+
+        if self.audio_engine is not None:
+            self.audio_engine.close()
+
+        return AudioEngine(
+            model=whisper_model,
+            language="en",
+            config=audio_cfg
+        )
+
     def check_prerequisites(self) -> Dict[str, Any]:
         """
         Check if system is ready to start interview mode.
@@ -257,9 +465,19 @@ class InterviewCopilot:
                     if not self.initialize_components():
                         return False
 
+                # Load the Ollama models before the first question needs them
+                if self.ollama_keepalive:
+                    self.ollama_keepalive.start(self.llm_engine.system_prompt())
+
                 # Start session
                 self._session_start_time = time.time()
+                self._first_question_pending = True
                 self._questions_answered = 0
+                self._lagging_questions = 0
+                self._latency_stats.clear()
+                self.question_scheduler.reset_stats()
+                if self.speculative_retriever:
+                    self.speculative_retriever.clear()
                 self._session_log = {
                     'start_time': datetime.now().isoformat(),
                     'questions': []
@@ -270,7 +488,10 @@ class InterviewCopilot:
                 self.overlay.clear()  # Clear any previous content
 
                 # Start audio engine
-                self.audio_engine.start_listening(callback=self._on_transcript)
+                self.audio_engine.start_listening(
+                    callback=self._on_transcript,
+                    partial_callback=self._on_partial_transcript
+                )
 
                 self._is_active = True
                 self.logger.info("🎯 Interview mode started")
@@ -298,16 +519,28 @@ class InterviewCopilot:
                 if self.audio_engine:
                     self.audio_engine.stop_listening()
 
+                # Abandon any question still being answered
+                self.question_scheduler.cancel_all()
+                self._session_log['question_scheduler'] = self.question_scheduler.get_stats()
+
                 # Hide overlay
                 if self.overlay:
                     self.overlay.hide()
 
+                # Unload the Ollama models
+                if self.ollama_keepalive:
+                    self.ollama_keepalive.stop()
+                    self._session_log['ollama_warm_up'] = self.ollama_keepalive.get_stats()
+
                 # Save session log
                 self._save_session_log()
 
                 self._is_active = False
                 self.logger.info("🛑 Interview mode stopped")
 
+                # Apply settings saved during the session (e.g. a new Whisper model)
+                self.apply_settings()
+
                 return True
 
             except Exception as e:
@@ -328,28 +561,99 @@ class InterviewCopilot:
         self.logger.info(f"Transcript: {text} (question={is_question})")
 
         if is_question:
-            # Generate answer in background thread
-            threading.Thread(
-                target=self._handle_question,
-                args=(text,),
-                daemon=True
-            ).start()
+            # Continue the engine's trace (capture/queue/Whisper stages)
+            trace = (self.audio_engine.current_trace() if self.audio_engine else None) or LatencyTrace()
+            trace.mark('question_detected')
+
+            # Behind real time: answer briefly so the LLM leaves CPU to Whisper
+            max_tokens = self.ANSWER_MAX_TOKENS
+            if self.audio_engine and self.audio_engine.is_behind_realtime():
+                max_tokens = self.LAGGING_ANSWER_MAX_TOKENS
+                self._lagging_questions += 1
+                self.logger.warning(
+                    f"Transcription is {self.audio_engine.get_status()['chunk_age']:.1f}s behind; "
+                    f"shortening answer to {max_tokens} tokens"
+                )
+
+            # Answer on the scheduler's worker (supersedes any older question)
+            self.question_scheduler.submit(text, max_tokens=max_tokens, trace=trace)
         else:
-            # Update context (optional - for now just log)
             self.logger.debug(f"Context update: {text}")
 
-    def _handle_question(self, question: str) -> None:
+    def _on_partial_transcript(self, text: str) -> None:
+        """
+        Callback from audio engine with the current uncommitted sentence
+        (streaming mode). Starts retrieval before the question is final.
+
+        Args:
+            text: Partial transcript
+        """
+        if self._is_active and self.speculative_retriever:
+            self.speculative_retriever.prefetch(text)
+
+    def _run_question_job(self, job: QuestionJob) -> None:
+        """Question scheduler handler."""
+        self._handle_question(job.question, job=job, **job.kwargs)
+
+    def _handle_question(self, question: str, max_tokens: int = ANSWER_MAX_TOKENS,
+                         trace: Optional[LatencyTrace] = None,
+                         job: Optional[QuestionJob] = None) -> None:
         """
         Handle a detected question.
 
         Args:
             question: The interview question
+            max_tokens: Maximum tokens in the answer
+            trace: Latency trace started by the audio engine
+            job: Scheduler job; once it is cancelled (a newer question
+                arrived) nothing more is shown for this question
         """
+        def superseded() -> bool:
+            return job is not None and job.is_cancelled
+
+        def on_token(token: str) -> None:
+            # Tokens of a superseded answer never reach the overlay
+            if not superseded():
+                self.overlay.append_token(token)
+
+        trace = trace or LatencyTrace()
+        streaming = self._stream_answers and self.overlay is not None
+        answer_tips = {
+            'time': '60-90 seconds recommended',
+            'method': 'Use STAR method (Situation, Task, Action, Result)'
+        }
         try:
             start_time = time.time()
 
+            # Pre-generated answer for a common question: shown right away
+            refining = False
+            if self._use_answer_bank and not superseded():
+                bank_match = self._show_bank_answer(question, trace, answer_tips)
+                if bank_match == 'final':
+                    self._questions_answered += 1
+                    return
+                if bank_match == 'refine':
+                    # The bank answer stays visible until the fresh one is complete;
+                    # the question's latency was recorded when it rendered
+                    refining = True
+                    streaming = False
+                    trace = LatencyTrace()
+                    self._bank_refinements += 1
+
+            if superseded():
+                return
+
             # Show loading state
-            if self.overlay:
+            if streaming:
+                self.overlay.start_answer(
+                    question=question,
+                    tips={
+                        'time': 'Please wait...',
+                        'method': 'Searching documents and generating response'
+                    },
+                    on_first_token=lambda: trace.mark('first_token_rendered')
+                )
+            elif self.overlay and not refining:
                 self.overlay.show_suggestion(
                     question=question[:100] + "..." if len(question) > 100 else question,
                     answer="⏳ Generating answer...",
@@ -360,28 +664,86 @@ class InterviewCopilot:
                     }
                 )
 
-            # Generate answer using LLM
+            # Context prefetched from partial transcripts, if any
+            context = None
+            if self.speculative_retriever:
+                context = self.speculative_retriever.get(question, timeout=self.SPECULATIVE_WAIT_SECONDS)
+                if context is not None:
+                    trace.mark('retrieval_done')
+                    self.logger.info("Using speculatively retrieved context")
+
+            if superseded():
+                return
+
+            def on_draft(draft: Dict[str, Any]) -> None:
+                # A low-confidence draft stays visible until the main model's answer replaces it
+                if superseded():
+                    return
+                draft_tips = {
+                    'time': answer_tips['time'],
+                    'method': f"Draft - refining with {self.llm_engine.model}..."
+                }
+                if streaming:
+                    self.overlay.finish_answer(confidence=draft['confidence'], tips=draft_tips,
+                                               answer=draft['answer'])
+                else:
+                    self.overlay.show_suggestion(
+                        question=question,
+                        answer=draft['answer'],
+                        confidence=draft['confidence'],
+                        tips=draft_tips
+                    )
+
+            # Generate answer using LLM (tokens go straight to the overlay when streaming).
+            # A newer question cancels this one, freeing the model immediately.
             self.logger.info(f"Generating answer for: {question}")
-            result = self.llm_engine.generate_answer(
+            handle = self.llm_engine.submit_answer(
                 question=question,
+                callback=on_token if streaming else None,
+                context=context,
                 temperature=0.7,
-                max_tokens=250
+                max_tokens=max_tokens,
+                trace=trace,
+                supersede=False,
+                on_draft=on_draft if self.overlay and not refining else None
             )
-
-            # Display in overlay
-            if self.overlay:
+            if job is not None:
+                job.add_cancel_callback(handle.cancel)
+            try:
+                result = handle.result()
+            except CancelledError:
+                result = None
+            if result is None or superseded():
+                self.logger.info(f"Answer superseded by a newer question: {question}")
+                return
+
+            # Log question/answer (latency is completed once the overlay renders)
+            log_entry = self._log_question_answer(question, result)
+            if refining:
+                log_entry['refined_from_bank'] = True
+
+            def on_rendered():
+                if not refining:
+                    self._finish_trace(trace, log_entry, rendered=True)
+
+            # Display in overlay (a refined answer replaces the streamed draft)
+            if streaming and not result.get('refined'):
+                self.overlay.finish_answer(
+                    confidence=result['confidence'],
+                    tips=answer_tips,
+                    on_rendered=on_rendered,
+                    answer=result['answer']
+                )
+            elif self.overlay:
                 self.overlay.show_suggestion(
                     question=question,
                     answer=result['answer'],
                     confidence=result['confidence'],
-                    tips={
-                        'time': '60-90 seconds recommended',
-                        'method': 'Use STAR method (Situation, Task, Action, Result)'
-                    }
+                    tips=answer_tips,
+                    on_rendered=on_rendered
                 )
-
-            # Log question/answer
-            self._log_question_answer(question, result)
+            elif not refining:
+                self._finish_trace(trace, log_entry, rendered=False)
 
             self._questions_answered += 1
 
@@ -395,7 +757,7 @@ class InterviewCopilot:
             self.logger.error(f"Error handling question: {e}", exc_info=True)
 
             # Show error in overlay
-            if self.overlay:
+            if self.overlay and not superseded():
                 self.overlay.show_suggestion(
                     question=question,
                     answer=(
@@ -409,13 +771,97 @@ class InterviewCopilot:
                     }
                 )
 
-    def _log_question_answer(self, question: str, result: Dict[str, Any]) -> None:
+    def _show_bank_answer(self, question: str, trace: LatencyTrace,
+                          answer_tips: Dict[str, str]) -> Optional[str]:
+        """
+        Show the pre-generated answer for the nearest answer bank question.
+
+        Args:
+            question: The interview question
+            trace: The question's latency trace (completed when the answer renders)
+            answer_tips: Tips shown with a final answer
+
+        Returns:
+            'final' if the bank answer is the answer, 'refine' if it is shown
+            while a fresh answer is generated, None if nothing matched
+        """
+        match = self.llm_engine.match_answer_bank(question, trace)
+        if match is None:
+            return None
+
+        self._bank_answers += 1
+        final = (match['similarity'] >= self.BANK_FINAL_SIMILARITY
+                 and match['confidence'] >= self.BANK_FINAL_CONFIDENCE)
+        self.logger.info(
+            f"Answer bank match ({match['similarity']:.2f}): {match['matched_question']}"
+            f"{'' if final else ' - refining'}"
+        )
+
+        log_entry = self._log_question_answer(question, match)
+        log_entry['answer_bank'] = {
+            'matched_question': match['matched_question'],
+            'similarity': round(match['similarity'], 3),
+            'final': final
+        }
+
+        if self.overlay:
+            self.overlay.show_suggestion(
+                question=question,
+                answer=match['answer'],
+                confidence=match['confidence'],
+                tips=answer_tips if final else {
+                    'time': 'Prepared answer',
+                    'method': 'Refining for this exact question...'
+                },
+                on_rendered=lambda: self._finish_trace(trace, log_entry, rendered=True)
+            )
+        else:
+            self._finish_trace(trace, log_entry, rendered=False)
+
+        return 'final' if final else 'refine'
+
+    def _finish_trace(self, trace: LatencyTrace, log_entry: Dict[str, Any], rendered: bool) -> None:
+        """
+        Complete a question's latency trace and record it.
+
+        Args:
+            trace: The question's trace
+            log_entry: Session log entry to attach the trace to
+            rendered: True if called after the overlay drew the answer
+        """
+        if rendered:
+            trace.mark('overlay_rendered')
+        log_entry['latency'] = trace.to_dict()
+        self._latency_stats.add(trace)
+
+        if self._first_question_pending:
+            # Reported apart from the warm-up so cold starts are visible
+            self._first_question_pending = False
+            self._session_log['first_question_seconds'] = trace.total
+            warm = self.ollama_keepalive.is_warm if self.ollama_keepalive else None
+            self.logger.info(
+                f"First question answered in {trace.total:.2f}s"
+                + ("" if warm is None else f" (models {'warm' if warm else 'still loading'})")
+            )
+
+        if trace.total > self.LATENCY_SLO_SECONDS:
+            slowest = max(trace.durations().items(), key=lambda hop: hop[1], default=None)
+            if slowest:
+                self.logger.warning(
+                    f"Answer took {trace.total:.2f}s (SLO {self.LATENCY_SLO_SECONDS:.1f}s); "
+                    f"slowest stage: {slowest[0]} ({slowest[1]:.2f}s)"
+                )
+
+    def _log_question_answer(self, question: str, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Log a question/answer pair to session log.
 
         Args:
             question: The interview question
             result: LLM generation result
+
+        Returns:
+            The log entry (the latency trace is added to it later)
         """
         log_entry = {
             'timestamp': datetime.now().isoformat(),
@@ -424,10 +870,16 @@ class InterviewCopilot:
             'confidence': result['confidence'],
             'sources': result['sources'],
             'context_used': result.get('context_used', False),
-            'generation_time': result.get('generation_time', 0)
+            'generation_time': result.get('generation_time', 0),
+            'prompt_eval': result.get('prompt_eval', {})
         }
+        if 'refined' in result:
+            log_entry['refined'] = result['refined']
+        if 'draft' in result:
+            log_entry['draft'] = result['draft']
 
         self._session_log['questions'].append(log_entry)
+        return log_entry
 
     def _save_session_log(self) -> None:
         """Save session log to file."""
@@ -444,6 +896,7 @@ class InterviewCopilot:
 
             self._session_log['end_time'] = datetime.now().isoformat()
             self._session_log['total_questions'] = len(self._session_log['questions'])
+            self._session_log['latency_summary'] = self._latency_stats.summary()
 
             # Save to file
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -475,6 +928,26 @@ class InterviewCopilot:
                 time.time() - self._session_start_time
                 if self._session_start_time else 0
             ),
+            'whisper_model_status': model_registry.status(self._whisper_model),
+            'transcription_lag': (
+                self.audio_engine.get_status()['chunk_age']
+                if self.audio_engine else 0.0
+            ),
+            'lagging_questions': self._lagging_questions,
+            'latency': self._latency_stats.summary(),
+            'speculative_retrieval': (
+                self.speculative_retriever.get_stats()
+                if self.speculative_retriever else {}
+            ),
+            'question_scheduler': self.question_scheduler.get_stats(),
+            'ollama_keepalive': (
+                self.ollama_keepalive.get_stats()
+                if self.ollama_keepalive else {}
+            ),
+            'answer_bank': {
+                'answers_shown': self._bank_answers,
+                'refinements': self._bank_refinements
+            },
             'components_initialized': all([
                 self.document_processor is not None,
                 self.audio_engine is not None,
@@ -491,7 +964,15 @@ class InterviewCopilot:
             self.stop_interview_mode()
 
         if self.audio_engine:
-            self.audio_engine.stop_listening()
+            self.audio_engine.close()
+
+        if self.speculative_retriever:
+            self.speculative_retriever.shutdown()
+
+        self.question_scheduler.shutdown()
+
+        if self.llm_engine:
+            self.llm_engine.close()
 
         if self.overlay:
             self.overlay.destroy()
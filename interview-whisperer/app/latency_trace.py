@@ -0,0 +1,173 @@
+"""
+Latency Tracing for Interview Whisperer
+
+Per-question timestamps for every hop of the question-to-answer pipeline,
+and rolling percentiles over recent questions:
+
+    audio_captured → chunk_enqueued → whisper_start → whisper_end →
+    question_detected → embedding_done → retrieval_done → first_token →
+    first_token_rendered → last_token → overlay_rendered
+
+Each component marks the stages it owns on the trace it is handed;
+missing stages (e.g. no retrieval when the answer is cached) are skipped,
+and a hop is measured from the closest earlier stage that was marked.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+# Pipeline stages, in order
+STAGES = (
+    "audio_captured",        # Last sample of the question captured
+    "chunk_enqueued",        # Chunk queued for transcription
+    "whisper_start",         # Whisper decode started
+    "whisper_end",           # Whisper decode finished
+    "question_detected",     # Copilot received the question
+    "embedding_done",        # Question embedded
+    "retrieval_done",        # ChromaDB query returned
+    "first_token",           # First LLM token
+    "first_token_rendered",  # First streamed word visible in the overlay
+    "last_token",            # LLM finished
+    "overlay_rendered",      # Answer drawn in the overlay
+)
+
+
+class LatencyTrace:
+    """Timestamps (time.time()) for one question's trip through the pipeline."""
+
+    def __init__(self):
+        """Initialize an empty trace."""
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, stage: str, timestamp: Optional[float] = None) -> None:
+        """
+        Record when a stage happened.
+
+        Args:
+            stage: One of STAGES
+            timestamp: time.time() of the event (None means now)
+
+        Raises:
+            ValueError: If the stage is unknown
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Unknown latency stage: {stage}")
+        self.marks[stage] = time.time() if timestamp is None else timestamp
+
+    def durations(self) -> Dict[str, float]:
+        """
+        Seconds spent in each hop, keyed by the stage that ends it.
+
+        Returns:
+            Dictionary mapping stage to seconds since the previous marked stage
+        """
+        hops = {}
+        previous = None
+        for stage in STAGES:
+            if stage not in self.marks:
+                continue
+            if previous is not None:
+                hops[stage] = max(0.0, self.marks[stage] - self.marks[previous])
+            previous = stage
+        return hops
+
+    def elapsed_until(self, stage: str) -> Optional[float]:
+        """
+        Seconds from the first marked stage to ``stage``.
+
+        Returns:
+            Elapsed seconds, or None if ``stage`` was not marked
+        """
+        if stage not in self.marks:
+            return None
+        first = next(self.marks[s] for s in STAGES if s in self.marks)
+        return max(0.0, self.marks[stage] - first)
+
+    @property
+    def total(self) -> float:
+        """Seconds from the first to the last marked stage."""
+        if len(self.marks) < 2:
+            return 0.0
+        ordered = [self.marks[s] for s in STAGES if s in self.marks]
+        return max(0.0, ordered[-1] - ordered[0])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form for the session log."""
+        return {
+            'marks': dict(self.marks),
+            'durations': {k: round(v, 4) for k, v in self.durations().items()},
+            'total': round(self.total, 4)
+        }
+
+
+class LatencyStats:
+    """
+    Rolling per-stage latency percentiles over recent traces.
+
+    Thread-safe: traces are added from answer threads and the Tk thread,
+    and read by get_status().
+    """
+
+    def __init__(self, window: int = 200, slo_seconds: float = 3.0):
+        """
+        Initialize the statistics.
+
+        Args:
+            window: Number of most recent traces summarized
+            slo_seconds: End-to-end target; traces slower than this are counted
+        """
+        self.slo_seconds = slo_seconds
+        self._traces: Deque[Dict[str, float]] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.slo_misses = 0
+        self.count = 0
+
+    def add(self, trace: LatencyTrace) -> None:
+        """
+        Add a finished trace.
+
+        Args:
+            trace: Trace to include in the statistics
+        """
+        hops = trace.durations()
+        hops['total'] = trace.total
+        first_word = trace.elapsed_until('first_token_rendered')
+        if first_word is not None:
+            hops['first_word'] = first_word
+        with self._lock:
+            self._traces.append(hops)
+            self.count += 1
+            if trace.total > self.slo_seconds:
+                self.slo_misses += 1
+
+    def clear(self) -> None:
+        """Forget all traces and counters."""
+        with self._lock:
+            self._traces.clear()
+            self.slo_misses = 0
+            self.count = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize recent traces.
+
+        Returns:
+            Dictionary with one {'p50', 'p95', 'p99'} entry per stage, plus
+            'first_word' (start → first streamed word visible), 'total',
+            trace count and SLO misses
+        """
+        with self._lock:
+            traces = list(self._traces)
+            count, misses = self.count, self.slo_misses
+
+        summary: Dict[str, Any] = {'count': count, 'slo_seconds': self.slo_seconds, 'slo_misses': misses}
+        for stage in list(STAGES[1:]) + ['first_word', 'total']:
+            values: List[float] = [t[stage] for t in traces if stage in t]
+            if values:
+                p50, p95, p99 = np.percentile(values, [50, 95, 99])
+                summary[stage] = {'p50': round(float(p50), 3), 'p95': round(float(p95), 3), 'p99': round(float(p99), 3)}
+        return summary
@@ -527,6 +527,16 @@ class InterviewWhispererLauncher:
                     progress_callback=progress_callback
                 )
 
+                # Pre-answer common questions when the index changed or no bank exists yet
+                bank_summary = ""
+                try:
+                    if self.copilot.answer_bank_needs_build():
+                        title.configure(text="💬 Preparing Common Answers...")
+                        bank = self.copilot.build_answer_bank(progress_callback=progress_callback)
+                        bank_summary = f"\nPrepared answers: {bank['stored']}/{bank['questions']}"
+                except Exception as e:
+                    bank_summary = f"\nCommon answers not prepared: {e}"
+
                 progress_window.destroy()
 
                 # Show results
@@ -534,7 +544,9 @@ class InterviewWhispererLauncher:
                     "Processing Complete",
                     f"✅ Successfully processed {results['processed_files']} files!\n\n"
                     f"Total chunks: {results['total_chunks']}\n"
+                    f"Unchanged: {results.get('unchanged_files', 0)}\n"
                     f"Failed: {results['failed_files']}"
+                    f"{bank_summary}"
                 )
 
                 # Refresh status
@@ -660,6 +672,9 @@ class InterviewWhispererLauncher:
 
     def on_settings_saved(self):
         """Callback when settings are saved"""
+        # Swap the Whisper model in the background if it changed
+        self.copilot.apply_settings()
+
         # Refresh status to reflect any changes
         self.refresh_status()
 
@@ -5,12 +5,16 @@ Implements Retrieval-Augmented Generation (RAG) to answer interview questions
 using the user's documents stored in ChromaDB and Ollama for generation.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional, Callable, Tuple, Any
+from typing import List, Dict, Optional, Callable, Tuple, Any, Awaitable
 from pathlib import Path
+import threading
 import time
+import weakref
 from functools import lru_cache
 import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
 
 # Vector database
 import chromadb
@@ -33,6 +37,12 @@ try:
         CHROMA_COLLECTION_NAME,
         logger
     )
+    from .latency_trace import LatencyTrace
+    from .answer_cache import SemanticAnswerCache
+    from .answer_bank import AnswerBank
+    from .embedding_cache import shared_embedding_cache
+    from .bm25_index import reciprocal_rank_fusion, shared_bm25_index
+    from .vector_index import shared_vector_index
 except ImportError:
     # Fallback for direct execution
     from config import (
@@ -42,6 +52,12 @@ except ImportError:
         CHROMA_COLLECTION_NAME,
         logger
     )
+    from latency_trace import LatencyTrace
+    from answer_cache import SemanticAnswerCache
+    from answer_bank import AnswerBank
+    from embedding_cache import shared_embedding_cache
+    from bm25_index import reciprocal_rank_fusion, shared_bm25_index
+    from vector_index import shared_vector_index
 
 
 # =============================================================================
@@ -72,6 +88,97 @@ Provide a brief, professional response acknowledging the gap while demonstrating
 
 Answer:"""
 
+# Chat-mode prompts (prompt_cache=True). The system message is identical
+# for every question in a session, so Ollama keeps its KV cache and only
+# evaluates the user message; per-question text must stay out of it.
+SYSTEM_PROMPT = """You are helping a candidate answer questions during a job interview. Suggest what the candidate could say, in the first person.
+
+Instructions:
+- Use STAR method (Situation, Task, Action, Result) if applicable
+- Keep answer to 2-3 sentences (60-90 seconds when spoken)
+- Be specific and reference actual experience from the context
+- Sound natural and conversational (not robotic)
+- If the context doesn't contain relevant information, say "I don't have specific experience with that, but here's a related example..."
+
+Candidate profile:
+{profile}"""
+
+QUESTION_PROMPT = """Context from candidate's resume and notes:
+{context}
+
+Interview Question: "{question}"
+
+Answer:"""
+
+FALLBACK_QUESTION_PROMPT = """The candidate doesn't have specific documented experience for this question.
+
+Interview Question: "{question}"
+
+Provide a brief, professional response acknowledging the gap while demonstrating willingness to learn. Keep it to 1-2 sentences.
+
+Answer:"""
+
+
+# =============================================================================
+# CANCEL HANDLES
+# =============================================================================
+
+class GenerationHandle:
+    """
+    Cancel handle for a request running on the engine's event loop.
+
+    Returned by LLMEngine.submit() and submit_answer(). Cancelling stops
+    the coroutine at its next await; an Ollama request in flight has its
+    connection closed, which makes Ollama stop generating.
+    """
+
+    def __init__(self, future: Future, question: str = ""):
+        """
+        Args:
+            future: Future from asyncio.run_coroutine_threadsafe
+            question: Question the request answers (for logs)
+        """
+        self.question = question
+        self.created_at = time.time()
+        self._future = future
+
+    def cancel(self) -> bool:
+        """
+        Cancel the request.
+
+        Returns:
+            True if it was still running (or not yet started)
+        """
+        return self._future.cancel()
+
+    def cancelled(self) -> bool:
+        """True if the request was cancelled."""
+        return self._future.cancelled()
+
+    def done(self) -> bool:
+        """True if the request finished, failed or was cancelled."""
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the result.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            concurrent.futures.CancelledError: If the request was cancelled
+            concurrent.futures.TimeoutError: If the timeout expired
+        """
+        return self._future.result(timeout)
+
+    def add_done_callback(self, fn: Callable[['GenerationHandle'], None]) -> None:
+        """Call fn(handle) when the request finishes or is cancelled."""
+        self._future.add_done_callback(lambda _: fn(self))
+
 
 # =============================================================================
 # LLM ENGINE CLASS
@@ -82,19 +189,46 @@ class LLMEngine:
     LLM Engine for generating interview answers using RAG.
 
     Features:
-    - Retrieves relevant context from ChromaDB
+    - Retrieves relevant context from ChromaDB and a BM25 keyword index
     - Generates answers using Ollama
     - Supports streaming for real-time UI updates
     - Caches embeddings for performance
+    - Caches answers to semantically repeated questions
     - Provides confidence scoring
+    - Async API (aretrieve_context, agenerate_answer, astream_answer) with
+      cancel handles for requests run via submit()/submit_answer()
+    - Optional draft-then-refine cascade: a small draft_model answers first
+      and the main model replaces its answer unless the draft is confident
     """
 
+    RETRIEVAL_MODES = ('hybrid', 'vector', 'bm25')
+    VECTOR_BACKENDS = ('chroma', 'numpy')
+
+    # Candidates taken from each ranking before fusion, per requested result
+    FUSION_CANDIDATES_PER_RESULT = 4
+
+    # Length of the candidate profile in the system prompt
+    PROFILE_MAX_CHARS = 1500
+
+    STOP_SEQUENCES = ['\n\n', 'Question:', 'Interview Question:']
+
     def __init__(
         self,
         db_path: str,
         model: str = OLLAMA_LLM_MODEL,
         embed_model: str = OLLAMA_EMBED_MODEL,
-        collection_name: str = CHROMA_COLLECTION_NAME
+        collection_name: str = CHROMA_COLLECTION_NAME,
+        answer_cache: bool = True,
+        answer_cache_threshold: float = 0.92,
+        answer_bank_threshold: float = 0.85,
+        retrieval_mode: str = "hybrid",
+        embedding_timeout: float = 2.0,
+        vector_backend: str = "chroma",
+        vector_dtype: str = "float32",
+        prompt_cache: bool = True,
+        draft_model: Optional[str] = None,
+        refine_threshold: float = 0.8,
+        parallel_refine: bool = False
     ):
         """
         Initialize the LLM Engine.
@@ -104,21 +238,98 @@ class LLMEngine:
             model: Ollama model for text generation
             embed_model: Ollama model for embeddings
             collection_name: ChromaDB collection name
+            answer_cache: Reuse answers to semantically repeated questions
+            answer_cache_threshold: Cosine similarity for an answer cache hit
+            answer_bank_threshold: Cosine similarity to the nearest answer bank question
+            retrieval_mode: "hybrid" (vector + BM25), "vector" or "bm25"
+            embedding_timeout: Seconds to wait for a question embedding before
+                retrieving with BM25 alone
+            vector_backend: "chroma", or "numpy" for brute-force search over a
+                memory-mapped matrix (faster for a few thousand chunks)
+            vector_dtype: Storage type of the NumPy index ("float32" or "float16")
+            prompt_cache: Send a fixed system prompt and the question as chat
+                messages so Ollama reuses the prompt prefix's KV cache (False
+                sends the whole PROMPT_TEMPLATE to generate each time)
+            draft_model: Small Ollama model (1-3B) that drafts each answer
+                before the main model refines it (None disables the cascade)
+            refine_threshold: Draft confidence at which the refine pass is skipped
+            parallel_refine: Start the main model alongside the draft instead
+                of after it (faster refined answers, but both models compete
+                for the same hardware)
 
         Raises:
+            ValueError: If the retrieval mode or vector backend is unknown
             RuntimeError: If Ollama is not running or ChromaDB cannot be accessed
         """
+        if retrieval_mode not in self.RETRIEVAL_MODES:
+            raise ValueError(f"Unknown retrieval mode: {retrieval_mode}")
+        if vector_backend not in self.VECTOR_BACKENDS:
+            raise ValueError(f"Unknown vector backend: {vector_backend}")
+
         self.logger = logging.getLogger('InterviewWhisperer.LLMEngine')
         self.model = model
         self.embed_model = embed_model
         self.db_path = Path(db_path)
         self.collection_name = collection_name
+        self.retrieval_mode = retrieval_mode
+        self.embedding_timeout = embedding_timeout
+        self.vector_backend = vector_backend
+        self.prompt_cache = prompt_cache
+        self.draft_model = draft_model
+        self.refine_threshold = refine_threshold
+        self.parallel_refine = parallel_refine
+
+        # Candidate profile for the system prompt, per index fingerprint
+        self._profile: Optional[Tuple[Optional[str], str]] = None
+
+        # Async API: one event loop thread, started on first submit(), and
+        # an ollama.AsyncClient per event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._in_flight: List[GenerationHandle] = []
+        self._cancelled_requests = 0
+
+        # Prompt evaluation reported by Ollama, summed over generations
+        self._prompt_evals = 0
+        self._prompt_eval_tokens = 0
+        self._prompt_eval_seconds = 0.0
+
+        # Draft-then-refine cascade counters
+        self._drafts = 0
+        self._refined = 0
+        self._refine_skipped = 0
+
+        # Question embeddings run here so a slow Ollama cannot stall retrieval
+        self._embed_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="QuestionEmbedding")
+        self._embedding_timeouts = 0
+        self._bm25_fallbacks = 0
+
+        # Keyword index over the same chunks, shared with DocumentProcessor
+        self.bm25_index = shared_bm25_index(self.db_path.parent / "bm25_index.json")
+
+        # Memory-mapped copy of the Chroma embeddings (vector_backend="numpy")
+        self.vector_index = shared_vector_index(self.db_path.parent / "vector_index", dtype=vector_dtype)
+
+        # Embedding cache (model + text -> embedding), shared with DocumentProcessor
+        self.embedding_cache = shared_embedding_cache(self.db_path.parent / "embedding_cache.sqlite3")
+
+        # Answer cache, stored next to the ChromaDB directory
+        self.answer_cache: Optional[SemanticAnswerCache] = None
+        if answer_cache:
+            self.answer_cache = SemanticAnswerCache(
+                self.db_path.parent / "answer_cache",
+                threshold=answer_cache_threshold
+            )
 
-        # Embedding cache (question hash -> embedding)
-        self._embedding_cache: Dict[str, List[float]] = {}
+        # Answers pre-generated for common questions (see build_answer_bank)
+        self.answer_bank = AnswerBank(self.db_path.parent / "answer_bank", threshold=answer_bank_threshold)
 
         # Initialize ChromaDB
         self._init_chromadb()
+        self._sync_bm25_index()
+        if self.vector_backend == 'numpy':
+            self._sync_vector_index()
 
         # Verify Ollama is running
         self._verify_ollama()
@@ -151,6 +362,28 @@ class LLMEngine:
             self.logger.error(f"Failed to initialize ChromaDB: {e}")
             raise RuntimeError(f"ChromaDB initialization failed: {e}")
 
+    def _sync_bm25_index(self) -> None:
+        """Build the BM25 index from ChromaDB if the collection predates it."""
+        if len(self.bm25_index) or self.collection.count() == 0:
+            return
+        try:
+            data = self.collection.get(include=['documents', 'metadatas'])
+            self.bm25_index.add(data['ids'], data['documents'], data['metadatas'])
+            self.logger.info(f"Built BM25 index from {len(data['ids'])} existing chunks")
+        except Exception as e:
+            self.logger.warning(f"Could not build BM25 index from ChromaDB: {e}")
+
+    def _sync_vector_index(self) -> None:
+        """Build the NumPy vector index from ChromaDB if the collection predates it."""
+        if self.vector_index.count() or self.collection.count() == 0:
+            return
+        try:
+            data = self.collection.get(include=['embeddings', 'documents', 'metadatas'])
+            self.vector_index.add(data['ids'], data['embeddings'], data['documents'], data['metadatas'])
+            self.logger.info(f"Built NumPy vector index from {len(data['ids'])} existing chunks")
+        except Exception as e:
+            self.logger.warning(f"Could not build vector index from ChromaDB: {e}")
+
     def _verify_ollama(self) -> None:
         """Verify Ollama is running and models are available."""
         try:
@@ -169,6 +402,10 @@ class LLMEngine:
                 self.logger.warning(f"Embedding model {self.embed_model} not found. Pulling model...")
                 ollama.pull(self.embed_model)
 
+            if self.draft_model and not any(self.draft_model in m for m in available_models):
+                self.logger.warning(f"Draft model {self.draft_model} not found. Pulling model...")
+                ollama.pull(self.draft_model)
+
         except Exception as e:
             self.logger.error(f"Ollama verification failed: {e}")
             raise RuntimeError(
@@ -177,10 +414,6 @@ class LLMEngine:
                 f"Error: {e}"
             )
 
-    def _get_question_hash(self, question: str) -> str:
-        """Generate a hash for caching question embeddings."""
-        return hashlib.md5(question.lower().strip().encode()).hexdigest()
-
     def _get_embedding(self, text: str) -> List[float]:
         """
         Generate embedding for text using Ollama.
@@ -195,10 +428,10 @@ class LLMEngine:
             RuntimeError: If embedding generation fails
         """
         # Check cache
-        text_hash = self._get_question_hash(text)
-        if text_hash in self._embedding_cache:
+        embedding = self.embedding_cache.get(self.embed_model, text)
+        if embedding is not None:
             self.logger.debug(f"Using cached embedding for: {text[:50]}...")
-            return self._embedding_cache[text_hash]
+            return embedding
 
         try:
             self.logger.debug(f"Generating embedding for: {text[:50]}...")
@@ -209,7 +442,7 @@ class LLMEngine:
             embedding = response['embedding']
 
             # Cache it
-            self._embedding_cache[text_hash] = embedding
+            self.embedding_cache.put(self.embed_model, text, embedding)
 
             return embedding
 
@@ -217,70 +450,214 @@ class LLMEngine:
             self.logger.error(f"Embedding generation failed: {e}")
             raise RuntimeError(f"Failed to generate embedding: {e}")
 
+    def _embed_question(self, text: str) -> Optional[List[float]]:
+        """
+        Embed a question, giving up after ``embedding_timeout`` seconds.
+
+        A timed-out embedding keeps running and is cached when it finishes.
+
+        Returns:
+            The embedding, or None if it failed or timed out
+        """
+        future = self._embed_executor.submit(self._get_embedding, text)
+        try:
+            return future.result(timeout=self.embedding_timeout)
+        except FutureTimeout:
+            self._embedding_timeouts += 1
+            self.logger.warning(f"Question embedding took over {self.embedding_timeout:.1f}s")
+        except RuntimeError:
+            pass
+        return None
+
+    @staticmethod
+    def _chunk_source(metadata: Dict[str, Any]) -> str:
+        """Source file name stored with a chunk."""
+        return metadata.get('source') or metadata.get('file_name', 'Unknown')
+
+    def _vector_search(self, embedding: List[float], n_results: int) -> List[Dict[str, Any]]:
+        """
+        Query the vector backend (ChromaDB or the NumPy index).
+
+        Returns:
+            Chunks (id, text, metadata, score), most similar first
+        """
+        if self.vector_backend == 'numpy':
+            return self.vector_index.query(embedding, n_results)
+
+        count = self.collection.count()
+        if count == 0:
+            return []
+
+        self.logger.debug("Querying ChromaDB")
+        results = self.collection.query(
+            query_embeddings=[embedding],
+            n_results=min(n_results, count)
+        )
+
+        chunks = []
+        if results['documents'] and results['documents'][0]:
+            for i, doc in enumerate(results['documents'][0]):
+                # Distance to similarity score (ChromaDB returns L2 distance)
+                # Lower distance = higher similarity
+                # Convert to 0-1 scale where 1 is most similar
+                distance = results['distances'][0][i] if results['distances'] else 1.0
+                similarity = max(0, 1 - (distance / 2))  # Normalize
+
+                chunks.append({
+                    'id': results['ids'][0][i],
+                    'text': doc,
+                    'metadata': results['metadatas'][0][i] if results['metadatas'] else {},
+                    'score': similarity
+                })
+        return chunks
+
     def retrieve_context(
         self,
         question: str,
-        n_results: int = 3
+        n_results: int = 3,
+        trace: Optional[LatencyTrace] = None
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve relevant context chunks from ChromaDB.
+        Retrieve relevant context chunks.
+
+        In hybrid mode the ChromaDB (vector) and BM25 (keyword) rankings are
+        merged with reciprocal rank fusion. When the question embedding
+        fails or takes longer than ``embedding_timeout``, BM25 results are
+        used alone.
 
         Args:
             question: The interview question
             n_results: Number of top results to retrieve
+            trace: Optional latency trace (marks embedding_done, retrieval_done)
 
         Returns:
             List of dictionaries with keys:
                 - text: The document chunk text
                 - source: Source file name
-                - score: Similarity score (0-1, higher is better)
+                - score: Vector similarity (0-1, higher is better); 0.0 for
+                  chunks found by keyword only
+                - coverage: BM25 query-term coverage (0-1); 0.0 for chunks
+                  not found by keyword
                 - metadata: Additional metadata
         """
-        if self.collection.count() == 0:
-            self.logger.warning("No documents in database to retrieve from")
+        if not self._has_documents():
             return []
 
         try:
-            # Generate embedding for question
-            question_embedding = self._get_embedding(question)
-
-            # Query ChromaDB
-            self.logger.debug(f"Querying ChromaDB for: {question}")
-            results = self.collection.query(
-                query_embeddings=[question_embedding],
-                n_results=min(n_results, self.collection.count())
-            )
-
-            # Format results
-            context_chunks = []
-            if results['documents'] and results['documents'][0]:
-                for i, doc in enumerate(results['documents'][0]):
-                    # Distance to similarity score (ChromaDB returns L2 distance)
-                    # Lower distance = higher similarity
-                    # Convert to 0-1 scale where 1 is most similar
-                    distance = results['distances'][0][i] if results['distances'] else 1.0
-                    similarity = max(0, 1 - (distance / 2))  # Normalize
-
-                    metadata = results['metadatas'][0][i] if results['metadatas'] else {}
-
-                    context_chunks.append({
-                        'text': doc,
-                        'source': metadata.get('source', 'Unknown'),
-                        'score': similarity,
-                        'metadata': metadata
-                    })
-
-            self.logger.info(
-                f"Retrieved {len(context_chunks)} chunks with scores: "
-                f"{[round(c['score'], 2) for c in context_chunks]}"
-            )
-
-            return context_chunks
+            embedding = None
+            if self.retrieval_mode != 'bm25':
+                embedding = self._embed_question(question)
+            return self._retrieve_ranked(question, embedding, n_results, trace)
 
         except Exception as e:
             self.logger.error(f"Context retrieval failed: {e}")
             return []
 
+    def _has_documents(self) -> bool:
+        """True if either index has chunks (logs a warning otherwise)."""
+        if self.collection.count() == 0 and not len(self.bm25_index):
+            self.logger.warning("No documents in database to retrieve from")
+            return False
+        return True
+
+    def _retrieve_ranked(
+        self,
+        question: str,
+        embedding: Optional[List[float]],
+        n_results: int,
+        trace: Optional[LatencyTrace] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank chunks once the question embedding is known (shared by the
+        sync and async retrieval paths).
+
+        Args:
+            question: The interview question
+            embedding: Question embedding, or None if unavailable (ignored in
+                bm25 mode)
+            n_results: Number of chunks to return
+            trace: Optional latency trace
+
+        Returns:
+            Context chunks (see retrieve_context)
+        """
+        candidates = n_results
+        if self.retrieval_mode == 'hybrid':
+            candidates = n_results * self.FUSION_CANDIDATES_PER_RESULT
+
+        # Dense ranking (None when the embedding is unavailable)
+        dense = None
+        if self.retrieval_mode != 'bm25':
+            if embedding is not None:
+                if trace:
+                    trace.mark('embedding_done')
+                dense = self._vector_search(embedding, candidates)
+            else:
+                self._bm25_fallbacks += 1
+                self.logger.warning("Embedding unavailable; retrieving with BM25 only")
+
+        # Keyword ranking
+        keyword = []
+        if self.retrieval_mode != 'vector' or dense is None:
+            keyword = self.bm25_index.search(question, n_results=candidates)
+        if trace:
+            trace.mark('retrieval_done')
+
+        context_chunks = self._fuse_rankings(dense or [], keyword, n_results)
+
+        self.logger.info(
+            f"Retrieved {len(context_chunks)} chunks with scores: "
+            f"{[round(c['score'], 2) for c in context_chunks]}"
+        )
+
+        return context_chunks
+
+    def _fuse_rankings(
+        self,
+        dense: List[Dict[str, Any]],
+        keyword: List[Dict[str, Any]],
+        n_results: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge vector and BM25 results with reciprocal rank fusion.
+
+        Similarity and keyword coverage are on different scales (coverage is
+        1.0 for any one-term query that matches), so they are kept apart:
+        ``score`` is vector similarity only, which is what confidence is
+        estimated from.
+
+        Args:
+            dense: ChromaDB results, best first
+            keyword: BM25 results, best first
+            n_results: Number of chunks to return
+
+        Returns:
+            Context chunks in fused order
+        """
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for hit in keyword:
+            by_id[hit['id']] = {'text': hit['text'], 'metadata': hit['metadata'], 'score': 0.0,
+                                'coverage': hit['coverage'], 'bm25': hit['bm25']}
+        for hit in dense:
+            chunk = by_id.setdefault(hit['id'], {'text': hit['text'], 'metadata': hit['metadata'],
+                                                 'coverage': 0.0})
+            chunk['score'] = hit['score']
+
+        fused = reciprocal_rank_fusion([[h['id'] for h in dense], [h['id'] for h in keyword]])
+
+        context_chunks = []
+        for chunk_id, rrf_score in fused[:n_results]:
+            chunk = by_id[chunk_id]
+            context_chunks.append({
+                'text': chunk['text'],
+                'source': self._chunk_source(chunk['metadata']),
+                'score': chunk['score'],
+                'coverage': chunk['coverage'],
+                'metadata': chunk['metadata'],
+                'rrf_score': rrf_score
+            })
+        return context_chunks
+
     def _format_context(self, chunks: List[Dict[str, Any]]) -> str:
         """
         Format context chunks into a readable string.
@@ -311,12 +688,383 @@ class LLMEngine:
 
         return "\n\n".join(formatted)
 
+    def _candidate_profile(self) -> str:
+        """
+        Session-level summary of the candidate for the system prompt.
+
+        The first chunk of each document (usually a resume header or
+        summary), capped at PROFILE_MAX_CHARS. Rebuilt only when the index
+        fingerprint changes, so the prompt prefix stays byte-identical
+        between questions.
+
+        Returns:
+            Profile text
+        """
+        fingerprint = self._index_fingerprint()
+        if self._profile is not None and self._profile[0] == fingerprint:
+            return self._profile[1]
+
+        profile = "No documents indexed."
+        try:
+            results = self.collection.get(where={'chunk_id': 0}, include=['documents', 'metadatas'])
+            first_chunks = sorted(
+                zip(results['metadatas'], results['documents']),
+                key=lambda item: self._chunk_source(item[0])
+            )
+            parts = []
+            remaining = self.PROFILE_MAX_CHARS
+            for metadata, text in first_chunks:
+                if remaining <= 0:
+                    break
+                part = f"[{self._chunk_source(metadata)}] {' '.join(text.split())}"[:remaining]
+                parts.append(part)
+                remaining -= len(part)
+            if parts:
+                profile = "\n".join(parts)
+        except Exception as e:
+            self.logger.debug(f"Candidate profile unavailable: {e}")
+
+        self._profile = (fingerprint, profile)
+        return profile
+
+    def system_prompt(self) -> Optional[str]:
+        """
+        The fixed system message sent with every question.
+
+        Returns:
+            System prompt, or None when prompt_cache is off
+        """
+        if not self.prompt_cache:
+            return None
+        return SYSTEM_PROMPT.format(profile=self._candidate_profile())
+
+    def _generation_request(
+        self,
+        question: str,
+        context: Optional[List[Dict[str, Any]]],
+        temperature: float,
+        max_tokens: int,
+        model: Optional[str] = None
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Build the Ollama generation request.
+
+        With prompt_cache, the instructions and candidate profile go in a
+        fixed system message and only the user message (retrieved context
+        and question) changes, so Ollama evaluates just that tail.
+
+        Args:
+            model: Ollama model to generate with (defaults to self.model)
+
+        Returns:
+            (whether useful context was found, Ollama method name ("chat" or
+            "generate"), keyword arguments for it)
+        """
+        model = model or self.model
+        has_context = bool(context and max(context[0]['score'], context[0].get('coverage', 0.0)) > 0.3)
+        if not has_context:
+            self.logger.warning("No relevant context found, using fallback prompt")
+
+        options = {
+            'temperature': temperature,
+            'num_predict': max_tokens,
+            'stop': self.STOP_SEQUENCES
+        }
+
+        if not self.prompt_cache:
+            if has_context:
+                prompt = PROMPT_TEMPLATE.format(context=self._format_context(context), question=question)
+            else:
+                prompt = FALLBACK_PROMPT.format(question=question)
+            return has_context, 'generate', {'model': model, 'prompt': prompt, 'options': options}
+
+        if has_context:
+            user_prompt = QUESTION_PROMPT.format(context=self._format_context(context), question=question)
+        else:
+            user_prompt = FALLBACK_QUESTION_PROMPT.format(question=question)
+        messages = [
+            {'role': 'system', 'content': self.system_prompt()},
+            {'role': 'user', 'content': user_prompt}
+        ]
+        return has_context, 'chat', {'model': model, 'messages': messages, 'options': options}
+
+    def _start_generation(
+        self,
+        question: str,
+        context: Optional[List[Dict[str, Any]]],
+        temperature: float,
+        max_tokens: int,
+        stream: bool
+    ) -> Tuple[bool, Any]:
+        """
+        Send the generation request to Ollama.
+
+        Returns:
+            (whether useful context was found, Ollama response or stream)
+        """
+        has_context, method, request = self._generation_request(question, context, temperature, max_tokens)
+        return has_context, getattr(ollama, method)(stream=stream, **request)
+
+    def _answer_result(
+        self,
+        question: str,
+        answer: str,
+        context: Optional[List[Dict[str, Any]]],
+        has_context: bool,
+        start_time: float,
+        response: Any
+    ) -> Dict[str, Any]:
+        """
+        Build the result dictionary for a generated answer.
+
+        Args:
+            question: The interview question
+            answer: Generated text
+            context: Context chunks the answer was generated from
+            has_context: Whether the context prompt was used
+            start_time: time.time() when answering started
+            response: Ollama response (or final stream chunk) with timings
+
+        Returns:
+            Result dictionary (see generate_answer)
+        """
+        answer = answer.strip()
+        sources = list(set([c['source'] for c in context])) if context else []
+        return {
+            'answer': answer,
+            'confidence': self.get_confidence_score(question, answer, context),
+            'sources': sources,
+            'context_used': has_context,
+            'generation_time': time.time() - start_time,
+            'prompt_eval': self._record_prompt_eval(response),
+            'question': question
+        }
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        """Generated text in a generate or chat response (or stream chunk)."""
+        message = response.get('message')
+        if message is not None:
+            return message.get('content', '')
+        return response.get('response', '')
+
+    def _record_prompt_eval(self, response: Any) -> Dict[str, Any]:
+        """
+        Record the prompt evaluation Ollama reported for one generation.
+
+        When the prompt prefix is reused from the KV cache, prompt_eval_count
+        covers only the newly evaluated tokens.
+
+        Returns:
+            Dictionary with tokens and ms (empty if Ollama did not report them)
+        """
+        tokens = response.get('prompt_eval_count')
+        duration = response.get('prompt_eval_duration')
+        if tokens is None or duration is None:
+            return {}
+        self._prompt_evals += 1
+        self._prompt_eval_tokens += tokens
+        self._prompt_eval_seconds += duration / 1e9
+        return {'tokens': int(tokens), 'ms': round(duration / 1e6, 1)}
+
+    def _index_fingerprint(self) -> Optional[str]:
+        """
+        Identify the models and indexed documents answers are generated from.
+
+        Changes when a model changes, the collection is recreated, chunks are
+        added or removed, or documents are re-indexed (DocumentProcessor
+        records 'indexed_at' in the collection metadata).
+
+        Returns:
+            Fingerprint string, or None if the collection cannot be read
+        """
+        try:
+            collection = self.client.get_collection(name=self.collection_name)
+            metadata = collection.metadata or {}
+            parts = [
+                self.model,
+                self.embed_model,
+                self.collection_name,
+                str(collection.id),
+                str(collection.count()),
+                str(metadata.get('indexed_at', ''))
+            ]
+        except Exception as e:
+            self.logger.debug(f"Index fingerprint unavailable: {e}")
+            return None
+        return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+    def _lookup_answer(
+        self,
+        cache: Optional[SemanticAnswerCache],
+        question: str,
+        start_time: float,
+        trace: Optional[LatencyTrace] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored answer for a similar question.
+
+        Args:
+            cache: Answer cache or answer bank to search
+            question: The interview question
+            start_time: time.time() when answering started
+            trace: Optional latency trace (marks embedding and token stages)
+
+        Returns:
+            Result dictionary (same keys as generate_answer, plus
+            'matched_question' and 'similarity'), or None on a miss
+        """
+        if cache is None:
+            return None
+
+        fingerprint = self._index_fingerprint()
+        if fingerprint is None:
+            return None
+
+        embedding = self._embed_question(question)
+        if embedding is None:
+            return None
+        return self._answer_from_cache(cache, question, embedding, fingerprint, start_time, trace)
+
+    def _answer_from_cache(
+        self,
+        cache: SemanticAnswerCache,
+        question: str,
+        embedding: List[float],
+        fingerprint: str,
+        start_time: float,
+        trace: Optional[LatencyTrace] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Search a cache with the question embedding (see _lookup_answer)."""
+        if trace:
+            trace.mark('embedding_done')
+
+        hit = cache.lookup(embedding, fingerprint)
+        if hit is None:
+            return None
+
+        entry, similarity = hit
+        if trace:
+            trace.mark('first_token')
+            trace.mark('last_token')
+
+        self.logger.info(
+            f"Stored answer found (similarity {similarity:.2f}) for: {question} "
+            f"(answered for: {entry['question']})"
+        )
+        result = {
+            'answer': entry['answer'],
+            'confidence': entry['confidence'],
+            'sources': entry['sources'] or [],
+            'context_used': entry['context_used'],
+            'generation_time': time.time() - start_time,
+            'question': question,
+            'matched_question': entry['question'],
+            'similarity': similarity
+        }
+        if 'context' in entry:
+            result['context'] = entry['context'] or []
+        return result
+
+    def _cached_answer(
+        self,
+        question: str,
+        start_time: float,
+        trace: Optional[LatencyTrace] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Answer cache lookup; hits are flagged with 'cached'."""
+        result = self._lookup_answer(self.answer_cache, question, start_time, trace)
+        if result is not None:
+            result['cached'] = True
+        return result
+
+    def match_answer_bank(
+        self,
+        question: str,
+        trace: Optional[LatencyTrace] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the pre-generated answer for the nearest bank question.
+
+        Args:
+            question: The detected interview question
+            trace: Optional latency trace (marks embedding and token stages)
+
+        Returns:
+            Result dictionary (as generate_answer, plus 'matched_question',
+            'similarity', 'context' and 'from_bank'), or None if no bank
+            question is close enough
+        """
+        result = self._lookup_answer(self.answer_bank, question, time.time(), trace)
+        if result is not None:
+            result['from_bank'] = True
+        return result
+
+    def answer_bank_current(self) -> bool:
+        """Whether the answer bank has answers built for the current index."""
+        fingerprint = self._index_fingerprint()
+        return fingerprint is not None and self.answer_bank.is_current(fingerprint)
+
+    def build_answer_bank(
+        self,
+        questions: List[str],
+        workers: int = 4,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Pre-generate answers and retrieval contexts for a question bank.
+
+        Run after documents are processed; the bank is replaced.
+
+        Args:
+            questions: Questions to answer (see answer_bank.load_questions)
+            workers: Concurrent Ollama requests
+            progress_callback: Optional callback function(current, total, message)
+
+        Returns:
+            Build statistics (questions, stored, failed, errors, elapsed)
+        """
+        fingerprint = self._index_fingerprint()
+        if fingerprint is None or self.collection.count() == 0:
+            self.logger.warning("No indexed documents; answer bank not built")
+            return {'questions': len(questions), 'stored': 0, 'failed': 0,
+                    'errors': ["No indexed documents"], 'elapsed': 0.0}
+
+        def answer(question: str) -> Dict[str, Any]:
+            # Embed without a deadline first: concurrent generation slows
+            # Ollama down, and a timed-out embedding would drop vector retrieval
+            self._get_embedding(question)
+            context = self.retrieve_context(question, n_results=3)
+            result = self.generate_answer(question, context=context)
+            result['context'] = context
+            return result
+
+        return self.answer_bank.build(
+            questions, answer, self._get_embedding, fingerprint,
+            workers=workers, progress_callback=progress_callback
+        )
+
+    def _cache_answer(self, question: str, result: Dict[str, Any]) -> None:
+        """Store a successfully generated answer in the answer cache."""
+        if self.answer_cache is None or not result.get('answer') or 'error' in result:
+            return
+
+        fingerprint = self._index_fingerprint()
+        if fingerprint is None:
+            return
+
+        try:
+            self.answer_cache.store(question, self._get_embedding(question), result, fingerprint)
+        except RuntimeError:
+            pass
+
     def generate_answer(
         self,
         question: str,
         context: Optional[List[Dict[str, Any]]] = None,
         temperature: float = 0.7,
-        max_tokens: int = 250
+        max_tokens: int = 250,
+        trace: Optional[LatencyTrace] = None
     ) -> Dict[str, Any]:
         """
         Generate an interview answer using RAG.
@@ -326,6 +1074,7 @@ class LLMEngine:
             context: Optional pre-retrieved context (if None, will retrieve)
             temperature: Generation temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
+            trace: Optional latency trace (marks retrieval and token stages)
 
         Returns:
             Dictionary with keys:
@@ -334,80 +1083,41 @@ class LLMEngine:
                 - sources: List of source documents used
                 - context_used: Whether context was available
                 - generation_time: Time taken to generate
+                - prompt_eval: Prompt tokens evaluated and time (ms) reported by Ollama
+                - cached: Present (True) when the answer came from the answer cache
         """
         start_time = time.time()
 
+        # A previously generated answer to the same question skips RAG entirely
+        cached = self._cached_answer(question, start_time, trace)
+        if cached is not None:
+            return cached
+
         # Retrieve context if not provided
         if context is None:
-            context = self.retrieve_context(question, n_results=3)
-
-        # Determine if we have useful context
-        has_context = bool(context and context[0]['score'] > 0.3)
-
-        # Build prompt
-        if has_context:
-            formatted_context = self._format_context(context)
-            prompt = PROMPT_TEMPLATE.format(
-                context=formatted_context,
-                question=question
-            )
-        else:
-            prompt = FALLBACK_PROMPT.format(question=question)
-            self.logger.warning("No relevant context found, using fallback prompt")
+            context = self.retrieve_context(question, n_results=3, trace=trace)
 
         # Generate answer
         try:
             self.logger.info(f"Generating answer for: {question}")
-            response = ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={
-                    'temperature': temperature,
-                    'num_predict': max_tokens,
-                    'stop': ['\n\n', 'Question:', 'Interview Question:']
-                }
+            request_time = time.time()
+            has_context, response = self._start_generation(
+                question, context, temperature, max_tokens, stream=False
             )
 
-            answer = response['response'].strip()
-            generation_time = time.time() - start_time
-
-            # Calculate confidence score
-            confidence = self.get_confidence_score(question, answer, context)
-
-            # Extract sources
-            sources = list(set([c['source'] for c in context])) if context else []
+            if trace:
+                self._mark_generated(trace, request_time, response)
 
-            result = {
-                'answer': answer,
-                'confidence': confidence,
-                'sources': sources,
-                'context_used': has_context,
-                'generation_time': generation_time,
-                'question': question
-            }
-
-            self.logger.info(
-                f"Generated answer in {generation_time:.2f}s "
-                f"(confidence: {confidence:.0%}, sources: {len(sources)})"
+            result = self._answer_result(
+                question, self._response_text(response), context, has_context, start_time, response
             )
-
+            self._log_generated(result)
+            self._cache_answer(question, result)
             return result
 
         except Exception as e:
             self.logger.error(f"Answer generation failed: {e}")
-
-            # Return fallback response
-            return {
-                'answer': (
-                    "I apologize, but I'm having trouble generating a response right now. "
-                    "Could you please rephrase the question?"
-                ),
-                'confidence': 0.0,
-                'sources': [],
-                'context_used': False,
-                'generation_time': time.time() - start_time,
-                'error': str(e)
-            }
+            return self._failed_answer(start_time, e)
 
     def stream_answer(
         self,
@@ -415,7 +1125,8 @@ class LLMEngine:
         callback: Callable[[str], None],
         context: Optional[List[Dict[str, Any]]] = None,
         temperature: float = 0.7,
-        max_tokens: int = 250
+        max_tokens: int = 250,
+        trace: Optional[LatencyTrace] = None
     ) -> Dict[str, Any]:
         """
         Generate answer with streaming (for real-time UI updates).
@@ -426,90 +1137,536 @@ class LLMEngine:
             context: Optional pre-retrieved context
             temperature: Generation temperature
             max_tokens: Maximum tokens in response
+            trace: Optional latency trace (marks retrieval and token stages)
 
         Returns:
             Dictionary with metadata (same as generate_answer)
         """
         start_time = time.time()
 
+        # A cached answer is delivered in one piece
+        cached = self._cached_answer(question, start_time, trace)
+        if cached is not None:
+            callback(cached['answer'])
+            return cached
+
         # Retrieve context if not provided
         if context is None:
-            context = self.retrieve_context(question, n_results=3)
-
-        # Determine if we have useful context
-        has_context = bool(context and context[0]['score'] > 0.3)
-
-        # Build prompt
-        if has_context:
-            formatted_context = self._format_context(context)
-            prompt = PROMPT_TEMPLATE.format(
-                context=formatted_context,
-                question=question
-            )
-        else:
-            prompt = FALLBACK_PROMPT.format(question=question)
+            context = self.retrieve_context(question, n_results=3, trace=trace)
 
         # Generate with streaming
         try:
             self.logger.info(f"Streaming answer for: {question}")
 
             full_answer = ""
-            stream = ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                stream=True,
-                options={
-                    'temperature': temperature,
-                    'num_predict': max_tokens,
-                    'stop': ['\n\n', 'Question:', 'Interview Question:']
-                }
+            has_context, stream = self._start_generation(
+                question, context, temperature, max_tokens, stream=True
             )
 
+            last_chunk = {}
             for chunk in stream:
-                token = chunk['response']
+                token = self._response_text(chunk)
+                if trace and not full_answer:
+                    trace.mark('first_token')
                 full_answer += token
                 callback(token)
+                last_chunk = chunk
+
+            if trace:
+                trace.mark('last_token')
+
+            # Ollama reports timings on the final chunk
+            result = self._answer_result(question, full_answer, context, has_context, start_time, last_chunk)
+            self._log_generated(result, streamed=True)
+            self._cache_answer(question, result)
+            return result
 
-            generation_time = time.time() - start_time
+        except Exception as e:
+            self.logger.error(f"Streaming generation failed: {e}")
+            result = self._failed_answer(start_time, e, streamed=True)
+            callback(result['answer'])
+            return result
 
-            # Calculate confidence
-            confidence = self.get_confidence_score(question, full_answer, context)
+    # -------------------------------------------------------------------------
+    # Async API
+    # -------------------------------------------------------------------------
 
-            # Extract sources
-            sources = list(set([c['source'] for c in context])) if context else []
+    def submit(self, coro: Awaitable[Any], question: str = "") -> GenerationHandle:
+        """
+        Run a coroutine (such as agenerate_answer) on the engine's event loop.
 
-            result = {
-                'answer': full_answer.strip(),
-                'confidence': confidence,
-                'sources': sources,
-                'context_used': has_context,
-                'generation_time': generation_time,
-                'question': question
-            }
+        Args:
+            coro: Coroutine to run
+            question: Question it answers (for logs)
 
-            self.logger.info(
-                f"Streamed answer in {generation_time:.2f}s "
-                f"(confidence: {confidence:.0%})"
-            )
+        Returns:
+            Cancel handle
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._event_loop())
+        handle = GenerationHandle(future, question)
+        with self._loop_lock:
+            self._in_flight.append(handle)
+        handle.add_done_callback(self._request_done)
+        return handle
+
+    def submit_answer(
+        self,
+        question: str,
+        callback: Optional[Callable[[str], None]] = None,
+        context: Optional[List[Dict[str, Any]]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 250,
+        trace: Optional[LatencyTrace] = None,
+        supersede: bool = True,
+        on_draft: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> GenerationHandle:
+        """
+        Start answering a question in the background.
+
+        Args:
+            question: The interview question
+            callback: Function called with each streamed token (on the event
+                loop thread); None generates without streaming
+            context: Optional pre-retrieved context
+            temperature: Generation temperature
+            max_tokens: Maximum tokens in response
+            trace: Optional latency trace
+            supersede: Cancel every request still in flight first, so an
+                outdated answer stops using the model immediately
+            on_draft: With a draft_model, called with the draft result when
+                a refined answer will follow (see acascade_answer)
+
+        Returns:
+            Cancel handle; result() returns the generate_answer dictionary
+        """
+        if supersede:
+            self.cancel_in_flight()
+        if self.draft_model:
+            coro = self.acascade_answer(question, callback, on_draft, context, temperature, max_tokens, trace)
+        elif callback is not None:
+            coro = self.astream_answer(question, callback, context, temperature, max_tokens, trace)
+        else:
+            coro = self.agenerate_answer(question, context, temperature, max_tokens, trace)
+        return self.submit(coro, question)
 
+    def cancel_in_flight(self) -> int:
+        """
+        Cancel every request submitted to the event loop that is still running.
+
+        Returns:
+            Number of requests cancelled
+        """
+        with self._loop_lock:
+            handles = list(self._in_flight)
+        return sum(1 for handle in handles if handle.cancel())
+
+    async def aretrieve_context(
+        self,
+        question: str,
+        n_results: int = 3,
+        trace: Optional[LatencyTrace] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async retrieve_context.
+
+        The question is embedded with ollama.AsyncClient; the ChromaDB query
+        runs in a worker thread (ChromaDB has no async client for a local
+        database).
+
+        Returns:
+            Context chunks (see retrieve_context)
+        """
+        if not self._has_documents():
+            return []
+
+        try:
+            embedding = None
+            if self.retrieval_mode != 'bm25':
+                embedding = await self._aembed_question(question)
+            return await asyncio.to_thread(self._retrieve_ranked, question, embedding, n_results, trace)
+
+        except Exception as e:
+            self.logger.error(f"Context retrieval failed: {e}")
+            return []
+
+    async def agenerate_answer(
+        self,
+        question: str,
+        context: Optional[List[Dict[str, Any]]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 250,
+        trace: Optional[LatencyTrace] = None
+    ) -> Dict[str, Any]:
+        """
+        Async generate_answer. Cancelling it closes the Ollama request,
+        which stops the generation.
+
+        Returns:
+            Dictionary with the same keys as generate_answer
+        """
+        start_time = time.time()
+
+        cached = await self._acached_answer(question, start_time, trace)
+        if cached is not None:
+            return cached
+
+        if context is None:
+            context = await self.aretrieve_context(question, n_results=3, trace=trace)
+
+        try:
+            self.logger.info(f"Generating answer for: {question}")
+            result = await self._arun_generation(question, context, temperature, max_tokens, start_time, trace=trace)
+            await asyncio.to_thread(self._cache_answer, question, result)
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Answer generation failed: {e}")
+            return self._failed_answer(start_time, e)
+
+    async def astream_answer(
+        self,
+        question: str,
+        callback: Callable[[str], None],
+        context: Optional[List[Dict[str, Any]]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 250,
+        trace: Optional[LatencyTrace] = None
+    ) -> Dict[str, Any]:
+        """
+        Async stream_answer. Cancelling it between tokens closes the stream,
+        which stops the generation.
+
+        Returns:
+            Dictionary with the same keys as generate_answer
+        """
+        start_time = time.time()
+
+        cached = await self._acached_answer(question, start_time, trace)
+        if cached is not None:
+            callback(cached['answer'])
+            return cached
+
+        if context is None:
+            context = await self.aretrieve_context(question, n_results=3, trace=trace)
+
+        try:
+            self.logger.info(f"Streaming answer for: {question}")
+            result = await self._arun_generation(
+                question, context, temperature, max_tokens, start_time, callback=callback, trace=trace
+            )
+            await asyncio.to_thread(self._cache_answer, question, result)
             return result
 
         except Exception as e:
             self.logger.error(f"Streaming generation failed: {e}")
+            result = self._failed_answer(start_time, e, streamed=True)
+            callback(result['answer'])
+            return result
+
+    async def acascade_answer(
+        self,
+        question: str,
+        callback: Optional[Callable[[str], None]] = None,
+        on_draft: Optional[Callable[[Dict[str, Any]], None]] = None,
+        context: Optional[List[Dict[str, Any]]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 250,
+        trace: Optional[LatencyTrace] = None
+    ) -> Dict[str, Any]:
+        """
+        Draft an answer with draft_model, then refine it with the main model.
+
+        The draft is streamed to callback (or generated whole without one).
+        If its confidence reaches refine_threshold it is the answer;
+        otherwise on_draft(draft) is called so it can be shown, and the main
+        model's answer from the same context replaces it. Without a
+        draft_model this is astream_answer (or agenerate_answer).
+
+        Args:
+            question: The interview question
+            callback: Function called with each draft token
+            on_draft: Function called with the draft result when a refined
+                answer will follow
+            context: Optional pre-retrieved context
+            temperature: Generation temperature
+            max_tokens: Maximum tokens in each answer
+            trace: Optional latency trace (marks the draft's token stages)
 
-            error_msg = (
-                "I apologize, but I'm having trouble generating a response right now."
+        Returns:
+            Dictionary with the same keys as generate_answer, plus model,
+            refined (whether the main model produced the answer) and, when
+            refined, draft (the draft's answer, confidence and generation_time)
+        """
+        if not self.draft_model:
+            if callback is None:
+                return await self.agenerate_answer(question, context, temperature, max_tokens, trace)
+            return await self.astream_answer(question, callback, context, temperature, max_tokens, trace)
+
+        start_time = time.time()
+
+        cached = await self._acached_answer(question, start_time, trace)
+        if cached is not None:
+            if callback is not None:
+                callback(cached['answer'])
+            return cached
+
+        if context is None:
+            context = await self.aretrieve_context(question, n_results=3, trace=trace)
+
+        def start_refine() -> asyncio.Future:
+            task = asyncio.ensure_future(
+                self._arun_generation(question, context, temperature, max_tokens, start_time)
+            )
+            # Failures of a refine pass that is no longer needed are already logged
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            return task
+
+        refine_task = start_refine() if self.parallel_refine else None
+        try:
+            draft = None
+            try:
+                self.logger.info(f"Drafting answer with {self.draft_model} for: {question}")
+                draft = await self._arun_generation(
+                    question, context, temperature, max_tokens, start_time,
+                    callback=callback, trace=trace, model=self.draft_model
+                )
+                draft['model'] = self.draft_model
+                self._drafts += 1
+            except Exception as e:
+                self.logger.error(f"Draft generation failed: {e}")
+
+            if draft is not None and draft['confidence'] >= self.refine_threshold:
+                self._refine_skipped += 1
+                self.logger.info(f"Draft confidence {draft['confidence']:.0%}, skipping refinement")
+                draft['refined'] = False
+                await asyncio.to_thread(self._cache_answer, question, draft)
+                return draft
+
+            if draft is not None and on_draft is not None:
+                on_draft(draft)
+
+            try:
+                self.logger.info(f"Refining answer with {self.model} for: {question}")
+                if refine_task is None:
+                    refine_task = start_refine()
+                result = await refine_task
+            except Exception as e:
+                self.logger.error(f"Refine generation failed: {e}")
+                if draft is not None:
+                    draft['refined'] = False
+                    draft['refine_error'] = str(e)
+                    return draft
+                result = self._failed_answer(start_time, e, streamed=callback is not None)
+                if callback is not None:
+                    callback(result['answer'])
+                return result
+
+            self._refined += 1
+            result['model'] = self.model
+            result['refined'] = True
+            if draft is not None:
+                result['draft'] = {key: draft[key] for key in ('answer', 'confidence', 'generation_time')}
+            await asyncio.to_thread(self._cache_answer, question, result)
+            return result
+
+        finally:
+            # Cancelled, or the draft was good enough
+            if refine_task is not None and not refine_task.done():
+                refine_task.cancel()
+
+    async def _arun_generation(
+        self,
+        question: str,
+        context: Optional[List[Dict[str, Any]]],
+        temperature: float,
+        max_tokens: int,
+        start_time: float,
+        callback: Optional[Callable[[str], None]] = None,
+        trace: Optional[LatencyTrace] = None,
+        model: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        One Ollama generation on the async client (errors propagate).
+
+        Args:
+            callback: Stream tokens to this function (None waits for the
+                whole answer)
+            model: Ollama model (defaults to self.model)
+
+        Returns:
+            Result dictionary (see generate_answer)
+        """
+        request_time = time.time()
+        # The system prompt may read the candidate profile from ChromaDB
+        has_context, method, request = await asyncio.to_thread(
+            self._generation_request, question, context, temperature, max_tokens, model
+        )
+
+        if callback is None:
+            response = await getattr(self._async_client(), method)(**request)
+            if trace:
+                self._mark_generated(trace, request_time, response)
+            result = self._answer_result(
+                question, self._response_text(response), context, has_context, start_time, response
             )
-            callback(error_msg)
+            self._log_generated(result)
+            return result
 
-            return {
-                'answer': error_msg,
-                'confidence': 0.0,
-                'sources': [],
-                'context_used': False,
-                'generation_time': time.time() - start_time,
-                'error': str(e)
-            }
+        full_answer = ""
+        stream = await getattr(self._async_client(), method)(stream=True, **request)
+
+        last_chunk = {}
+        try:
+            async for chunk in stream:
+                token = self._response_text(chunk)
+                if trace and not full_answer:
+                    trace.mark('first_token')
+                full_answer += token
+                callback(token)
+                last_chunk = chunk
+        finally:
+            # Closes the HTTP response if we stop early (cancellation)
+            aclose = getattr(stream, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+
+        if trace:
+            trace.mark('last_token')
+
+        # Ollama reports timings on the final chunk
+        result = self._answer_result(question, full_answer, context, has_context, start_time, last_chunk)
+        self._log_generated(result, streamed=True)
+        return result
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """The engine's event loop, started on a daemon thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, daemon=True, name="LLMEngineLoop").start()
+            return self._loop
+
+    def _async_client(self) -> Any:
+        """ollama.AsyncClient for the running event loop (its connections are per loop)."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = ollama.AsyncClient(host=OLLAMA_HOST)
+            self._async_clients[loop] = client
+        return client
+
+    def _request_done(self, handle: GenerationHandle) -> None:
+        with self._loop_lock:
+            if handle in self._in_flight:
+                self._in_flight.remove(handle)
+        if handle.cancelled():
+            self._cancelled_requests += 1
+            self.logger.info(f"Cancelled request for: {handle.question}")
+
+    async def _aget_embedding(self, text: str) -> List[float]:
+        """Async _get_embedding (same cache)."""
+        embedding = self.embedding_cache.get(self.embed_model, text)
+        if embedding is not None:
+            return embedding
+
+        try:
+            response = await self._async_client().embeddings(model=self.embed_model, prompt=text)
+        except Exception as e:
+            self.logger.error(f"Embedding generation failed: {e}")
+            raise RuntimeError(f"Failed to generate embedding: {e}")
+
+        embedding = response['embedding']
+        self.embedding_cache.put(self.embed_model, text, embedding)
+        return embedding
+
+    async def _aembed_question(self, text: str) -> Optional[List[float]]:
+        """
+        Async _embed_question. A timed-out embedding keeps running and is
+        cached when it finishes.
+
+        Returns:
+            The embedding, or None if it failed or timed out
+        """
+        task = asyncio.ensure_future(self._aget_embedding(text))
+        # Failures after a timeout are already logged
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), self.embedding_timeout)
+        except asyncio.TimeoutError:
+            self._embedding_timeouts += 1
+            self.logger.warning(f"Question embedding took over {self.embedding_timeout:.1f}s")
+        except RuntimeError:
+            pass
+        return None
+
+    async def _acached_answer(
+        self,
+        question: str,
+        start_time: float,
+        trace: Optional[LatencyTrace] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async _cached_answer.
+
+        The fingerprint (ChromaDB) and cache lookup run in a worker thread so
+        they do not block other coroutines or a pending cancel.
+        """
+        if self.answer_cache is None:
+            return None
+
+        fingerprint = await asyncio.to_thread(self._index_fingerprint)
+        if fingerprint is None:
+            return None
+
+        embedding = await self._aembed_question(question)
+        if embedding is None:
+            return None
+
+        result = await asyncio.to_thread(
+            self._answer_from_cache, self.answer_cache, question, embedding, fingerprint, start_time, trace
+        )
+        if result is not None:
+            result['cached'] = True
+        return result
+
+    def close(self) -> None:
+        """Cancel in-flight requests and stop the event loop."""
+        self.cancel_in_flight()
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    @staticmethod
+    def _mark_generated(trace: LatencyTrace, request_time: float, response: Any) -> None:
+        """Mark token stages for a non-streaming response."""
+        # The first token follows model load + prompt eval (Ollama reports
+        # both in nanoseconds)
+        prefill = (response.get('load_duration', 0) + response.get('prompt_eval_duration', 0)) / 1e9
+        trace.mark('first_token', min(request_time + prefill, time.time()))
+        trace.mark('last_token')
+
+    def _log_generated(self, result: Dict[str, Any], streamed: bool = False) -> None:
+        verb = "Streamed" if streamed else "Generated"
+        self.logger.info(
+            f"{verb} answer in {result['generation_time']:.2f}s "
+            f"(confidence: {result['confidence']:.0%}, sources: {len(result['sources'])})"
+        )
+
+    @staticmethod
+    def _failed_answer(start_time: float, error: Exception, streamed: bool = False) -> Dict[str, Any]:
+        """Fallback result when generation fails."""
+        answer = "I apologize, but I'm having trouble generating a response right now."
+        if not streamed:
+            answer += " Could you please rephrase the question?"
+        return {
+            'answer': answer,
+            'confidence': 0.0,
+            'sources': [],
+            'context_used': False,
+            'generation_time': time.time() - start_time,
+            'error': str(error)
+        }
 
     def get_confidence_score(
         self,
@@ -531,8 +1688,8 @@ class LLMEngine:
         if not context or len(context) == 0:
             return 0.2  # Low confidence without context
 
-        # Get top similarity score
-        top_score = context[0]['score']
+        # Get top similarity score (keyword-only chunks have none and count as 0)
+        top_score = max(chunk['score'] for chunk in context)
 
         # Confidence thresholds based on similarity
         if top_score >= 0.7:
@@ -569,9 +1726,11 @@ class LLMEngine:
         return max(0.0, min(1.0, base_confidence))
 
     def clear_cache(self) -> None:
-        """Clear the embedding cache."""
-        self._embedding_cache.clear()
-        self.logger.info("Embedding cache cleared")
+        """Clear the embedding (this model's) and answer caches."""
+        self.embedding_cache.clear(self.embed_model)
+        if self.answer_cache is not None:
+            self.answer_cache.clear()
+        self.logger.info("Embedding and answer caches cleared")
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -585,7 +1744,36 @@ class LLMEngine:
             'embed_model': self.embed_model,
             'collection_name': self.collection_name,
             'document_count': self.collection.count(),
-            'cache_size': len(self._embedding_cache),
+            'cache_size': self.embedding_cache.get_stats()['memory_entries'],
+            'embedding_cache': self.embedding_cache.get_stats(),
+            'answer_cache': self.answer_cache.get_stats() if self.answer_cache else None,
+            'answer_bank': self.answer_bank.get_stats(),
+            'retrieval': {
+                'mode': self.retrieval_mode,
+                'vector_backend': self.vector_backend,
+                'bm25_fallbacks': self._bm25_fallbacks,
+                'embedding_timeouts': self._embedding_timeouts
+            },
+            'requests': {
+                'in_flight': len(self._in_flight),
+                'cancelled': self._cancelled_requests
+            },
+            'cascade': {
+                'draft_model': self.draft_model,
+                'refine_threshold': self.refine_threshold,
+                'parallel_refine': self.parallel_refine,
+                'drafts': self._drafts,
+                'refined': self._refined,
+                'refine_skipped': self._refine_skipped
+            },
+            'prompt_eval': {
+                'prompt_cache': self.prompt_cache,
+                'generations': self._prompt_evals,
+                'avg_tokens': round(self._prompt_eval_tokens / self._prompt_evals, 1) if self._prompt_evals else 0.0,
+                'avg_ms': round(self._prompt_eval_seconds * 1000 / self._prompt_evals, 1) if self._prompt_evals else 0.0
+            },
+            'bm25_index': self.bm25_index.get_stats(),
+            'vector_index': self.vector_index.get_stats(),
             'db_path': str(self.db_path)
         }
 
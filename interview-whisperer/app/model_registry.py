@@ -0,0 +1,170 @@
+"""
+Whisper Model Registry for Interview Whisperer
+
+Process-wide cache of loaded Whisper models, keyed by model name, device
+and precision. Models load on a background thread so callers (the
+launcher's Tk thread in particular) never block on weight loading, and
+every AudioEngine asking for the same key shares one loaded model.
+"""
+
+import gc
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import whisper
+
+logger = logging.getLogger(__name__)
+
+# (model name, device, precision)
+ModelKey = Tuple[str, str, str]
+
+
+class WhisperModelRegistry:
+    """
+    Thread-safe registry of Whisper models loaded in the background.
+
+    Features:
+    - One load per (model, device, precision), shared by all engines
+    - Non-blocking loads returning a readiness future
+    - Per-model status ("loading", "ready", "failed")
+    - Explicit eviction when the configured model changes
+    """
+
+    def __init__(self):
+        """Initialize an empty registry with a single loader thread."""
+        self._lock = threading.Lock()
+        self._futures: Dict[ModelKey, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WhisperLoader")
+
+    @staticmethod
+    def make_key(name: str, device: Optional[str] = None, precision: str = "fp32") -> ModelKey:
+        """
+        Build a registry key.
+
+        Args:
+            name: Whisper model size ("tiny", "base", ...)
+            device: Torch device ("cpu", "cuda", ...); None lets Whisper choose
+            precision: "fp32" or "fp16"
+
+        Returns:
+            Registry key tuple
+        """
+        return (name, device or "auto", precision)
+
+    def load_async(self, name: str, device: Optional[str] = None, precision: str = "fp32") -> Future:
+        """
+        Start loading a model in the background (no-op if already loaded/loading).
+
+        Args:
+            name: Whisper model size
+            device: Torch device, or None for Whisper's default
+            precision: "fp32" or "fp16"
+
+        Returns:
+            Future resolving to the loaded model
+        """
+        key = self.make_key(name, device, precision)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None or (future.done() and future.exception() is not None):
+                # First request, or retry after a failed load
+                logger.info(f"Loading Whisper model '{name}' in background ({key[1]}, {precision})...")
+                future = self._executor.submit(self._load, name, device)
+                self._futures[key] = future
+            return future
+
+    def get(self, name: str, device: Optional[str] = None, precision: str = "fp32",
+            timeout: Optional[float] = None) -> Any:
+        """
+        Get a loaded model, waiting for it if necessary.
+
+        Args:
+            name: Whisper model size
+            device: Torch device, or None for Whisper's default
+            precision: "fp32" or "fp16"
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Loaded Whisper model
+
+        Raises:
+            RuntimeError: If the model failed to load
+        """
+        future = self.load_async(name, device, precision)
+        try:
+            return future.result(timeout=timeout)
+        except Exception as e:
+            raise RuntimeError(f"Failed to load Whisper model '{name}': {e}")
+
+    def status(self, name: str, device: Optional[str] = None, precision: str = "fp32") -> str:
+        """
+        Get the load status of a model.
+
+        Returns:
+            "not_loaded", "loading", "ready" or "failed"
+        """
+        key = self.make_key(name, device, precision)
+        with self._lock:
+            future = self._futures.get(key)
+        if future is None:
+            return "not_loaded"
+        if not future.done():
+            return "loading"
+        return "failed" if future.exception() is not None else "ready"
+
+    def evict(self, name: str, device: Optional[str] = None, precision: Optional[str] = None) -> int:
+        """
+        Drop models from the registry.
+
+        Engines still holding a reference keep the model alive until they
+        are discarded; the registry just stops handing it out.
+
+        Args:
+            name: Whisper model size to evict
+            device: Only evict this device (None evicts all devices)
+            precision: Only evict this precision (None evicts all)
+
+        Returns:
+            Number of registry entries removed
+        """
+        with self._lock:
+            keys = [
+                key for key in self._futures
+                if key[0] == name
+                and (device is None or key[1] == device)
+                and (precision is None or key[2] == precision)
+            ]
+            for key in keys:
+                self._futures.pop(key).cancel()
+
+        if keys:
+            gc.collect()
+            logger.info(f"Evicted Whisper model '{name}' ({len(keys)} entries)")
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, str]:
+        """
+        Get the status of every registered model.
+
+        Returns:
+            Dictionary mapping "name/device/precision" to its status
+        """
+        with self._lock:
+            keys = list(self._futures)
+        return {"/".join(key): self.status(*key) for key in keys}
+
+    def _load(self, name: str, device: Optional[str]) -> Any:
+        """Load a model (runs on the loader thread)."""
+        try:
+            model = whisper.load_model(name, device=device)
+            logger.info(f"✓ Whisper model '{name}' loaded successfully")
+            return model
+        except Exception as e:
+            logger.error(f"✗ Failed to load Whisper model '{name}': {e}")
+            raise
+
+
+# Shared registry for the whole process
+model_registry = WhisperModelRegistry()
@@ -0,0 +1,244 @@
+"""
+Ollama Keep-Alive for Interview Whisperer
+
+Keeps the generation and embedding models (and the draft model, if any)
+resident in Ollama for the length of an interview session. Without it the first question pays the
+model load (several seconds for an 8B model), and any quiet stretch
+longer than Ollama's keep-alive (5 minutes by default) unloads the model
+again mid-interview.
+
+A session warms the models with a dummy request, refreshes their
+keep-alive with periodic heartbeats, and unloads them (keep_alive=0)
+when it ends so the memory goes back to the user.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+import ollama
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaKeepAlive:
+    """
+    Warm-up, heartbeats and release for one LLM (plus an optional draft
+    model) and one embedding model.
+
+    Usage:
+        keepalive = OllamaKeepAlive("llama3.1:8b", "nomic-embed-text")
+        keepalive.start(system_prompt)   # returns immediately; warms up in the background
+        ...
+        keepalive.stop()                 # unloads the models
+
+    Warm-up runs on the heartbeat thread, so starting a session never
+    blocks; a question asked before warm-up finishes simply waits on the
+    same model load inside Ollama.
+    """
+
+    # Dummy requests used to load the models
+    WARM_UP_PROMPT = "Hello"
+    WARM_UP_EMBED_TEXT = "warm up"
+
+    def __init__(
+        self,
+        llm_model: str,
+        embed_model: str,
+        keep_alive: Union[str, int] = "10m",
+        heartbeat_interval: float = 60.0,
+        client: Any = None,
+        draft_model: Optional[str] = None
+    ):
+        """
+        Initialize the keep-alive manager.
+
+        Args:
+            llm_model: Ollama generation model
+            embed_model: Ollama embedding model
+            keep_alive: How long Ollama keeps a model after each request
+                (Ollama duration such as "10m", or seconds)
+            heartbeat_interval: Seconds between keep-alive refreshes (must be
+                shorter than keep_alive)
+            client: Ollama client (defaults to the ollama module)
+            draft_model: Small model that drafts answers (LLMEngine cascade)
+        """
+        self.llm_model = llm_model
+        self.draft_model = draft_model
+        self.embed_model = embed_model
+        self.keep_alive = keep_alive
+        self.heartbeat_interval = heartbeat_interval
+        self._client = client or ollama
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._warm = threading.Event()
+
+        # Stats for the current session
+        self.warm_up_seconds: Dict[str, float] = {}
+        self.warm_up_error: Optional[str] = None
+        self.heartbeats = 0
+        self.heartbeat_failures = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True between start() and stop()."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_warm(self) -> bool:
+        """True once the models have been loaded this session."""
+        return self._warm.is_set()
+
+    def start(self, system_prompt: Optional[str] = None) -> None:
+        """
+        Warm the models up and keep them loaded until stop() (no-op if running).
+
+        Args:
+            system_prompt: System message the session's questions are sent
+                with; warming up with it leaves its prefill in Ollama's KV
+                cache for the first question
+        """
+        with self._lock:
+            if self.is_running:
+                return
+            self._stop_event.clear()
+            self._warm.clear()
+            self.warm_up_seconds = {}
+            self.warm_up_error = None
+            self.heartbeats = 0
+            self.heartbeat_failures = 0
+            self._thread = threading.Thread(
+                target=self._run, args=(system_prompt,), daemon=True, name="OllamaKeepAlive"
+            )
+            self._thread.start()
+
+    def wait_until_warm(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until warm-up finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the models are warm
+        """
+        return self._warm.wait(timeout)
+
+    def stop(self, release: bool = True) -> None:
+        """
+        Stop the heartbeats.
+
+        Args:
+            release: Also ask Ollama to unload the models now
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+        if thread is not None:
+            thread.join(timeout=5.0)
+        if release:
+            self._release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get keep-alive statistics.
+
+        Returns:
+            Dictionary with running/warm flags, per-model warm-up seconds,
+            warm-up error, and heartbeat counters
+        """
+        return {
+            'running': self.is_running,
+            'warm': self.is_warm,
+            'keep_alive': self.keep_alive,
+            'warm_up_seconds': dict(self.warm_up_seconds),
+            'warm_up_error': self.warm_up_error,
+            'heartbeats': self.heartbeats,
+            'heartbeat_failures': self.heartbeat_failures
+        }
+
+    # -------------------------------------------------------------------------
+    # Heartbeat thread
+    # -------------------------------------------------------------------------
+
+    def _run(self, system_prompt: Optional[str]) -> None:
+        self._warm_up(system_prompt)
+        while not self._stop_event.wait(self.heartbeat_interval):
+            self._heartbeat()
+
+    def _llm_models(self) -> Dict[str, str]:
+        """Generation models to keep loaded, by stats key."""
+        models = {'llm': self.llm_model}
+        if self.draft_model:
+            models['draft'] = self.draft_model
+        return models
+
+    def _warm_up(self, system_prompt: Optional[str]) -> None:
+        """Load every model with a dummy request each, timing them separately."""
+        try:
+            for key, model in self._llm_models().items():
+                start = time.perf_counter()
+                if system_prompt:
+                    self._client.chat(
+                        model=model,
+                        messages=[
+                            {'role': 'system', 'content': system_prompt},
+                            {'role': 'user', 'content': self.WARM_UP_PROMPT}
+                        ],
+                        options={'num_predict': 1},
+                        keep_alive=self.keep_alive
+                    )
+                else:
+                    self._client.generate(
+                        model=model,
+                        prompt=self.WARM_UP_PROMPT,
+                        options={'num_predict': 1},
+                        keep_alive=self.keep_alive
+                    )
+                self.warm_up_seconds[key] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            self._client.embeddings(
+                model=self.embed_model,
+                prompt=self.WARM_UP_EMBED_TEXT,
+                keep_alive=self.keep_alive
+            )
+            self.warm_up_seconds['embed'] = time.perf_counter() - start
+        except Exception as e:
+            self.warm_up_error = str(e)
+            logger.warning(f"Ollama warm-up failed: {e}")
+            return
+
+        self._warm.set()
+        models = dict(self._llm_models(), embed=self.embed_model)
+        timings = ", ".join(f"{models[key]} {seconds:.2f}s" for key, seconds in self.warm_up_seconds.items())
+        logger.info(f"Ollama models warm in {sum(self.warm_up_seconds.values()):.2f}s ({timings})")
+
+    def _heartbeat(self) -> None:
+        """Refresh every model's keep-alive (an empty generate only loads the model)."""
+        try:
+            for model in self._llm_models().values():
+                self._client.generate(model=model, prompt="", keep_alive=self.keep_alive)
+            self._client.embeddings(model=self.embed_model, prompt="", keep_alive=self.keep_alive)
+            self.heartbeats += 1
+            if not self.is_warm:
+                # Warm-up failed earlier but Ollama is reachable now
+                self._warm.set()
+        except Exception as e:
+            self.heartbeat_failures += 1
+            logger.debug(f"Ollama keep-alive heartbeat failed: {e}")
+
+    def _release(self) -> None:
+        """Ask Ollama to unload every model."""
+        try:
+            for model in self._llm_models().values():
+                self._client.generate(model=model, prompt="", keep_alive=0)
+            self._client.embeddings(model=self.embed_model, prompt="", keep_alive=0)
+            models = ", ".join(self._llm_models().values())
+            logger.info(f"Released Ollama models {models} and {self.embed_model}")
+        except Exception as e:
+            logger.debug(f"Ollama model release failed: {e}")
+        self._warm.clear()
@@ -53,8 +53,15 @@ class OverlayWindow:
     - Smooth fade animations
     - Keyboard shortcuts
     - Thread-safe updates
+    - Streaming answers: tokens are batched into rate-limited appends
     """
 
+    # Upper bound on streamed-answer redraws per second
+    MAX_STREAM_UPDATES_PER_SECOND = 20
+
+    # Shown when a streamed answer finishes without any text
+    EMPTY_ANSWER_TEXT = "(No answer was generated)"
+
     def __init__(self, width: int = 400, height: int = 350, transparency: float = 0.95,
                  position: str = "top-right", font_size: int = 10, always_on_top: bool = True,
                  show_confidence: bool = True, show_sources: bool = True):
@@ -84,6 +91,14 @@ class OverlayWindow:
         self.animation_id = None
         self._lock = threading.Lock()
 
+        # Streaming answer state (buffer shared with worker threads under _lock)
+        self._token_buffer: list = []
+        self._stream_id = 0  # Bumped per answer so stale flushes are ignored
+        self._flush_scheduled = False
+        self._last_flush = 0.0
+        self._awaiting_first_token = False
+        self._on_first_token: Optional[Callable[[], None]] = None
+
         # Create main window
         self.window = tk.Tk()
         self.window.title("Interview Whisperer")
@@ -427,7 +442,8 @@ class OverlayWindow:
         question: str,
         answer: str,
         confidence: float,
-        tips: Optional[Dict[str, str]] = None
+        tips: Optional[Dict[str, str]] = None,
+        on_rendered: Optional[Callable[[], None]] = None
     ):
         """
         Update overlay with new suggestion.
@@ -437,17 +453,23 @@ class OverlayWindow:
             answer: The AI-generated answer suggestion
             confidence: Confidence score (0.0 to 1.0)
             tips: Optional dict with 'time' and 'method' keys
+            on_rendered: Optional function called on the main thread once
+                        the suggestion has been drawn
         """
         with self._lock:
+            # Replaces any answer being streamed
+            self._stream_id += 1
+            self._token_buffer = []
             # Schedule update on main thread
-            self.window.after(0, self._update_suggestion, question, answer, confidence, tips)
+            self.window.after(0, self._update_suggestion, question, answer, confidence, tips, on_rendered)
 
     def _update_suggestion(
         self,
         question: str,
         answer: str,
         confidence: float,
-        tips: Optional[Dict[str, str]]
+        tips: Optional[Dict[str, str]],
+        on_rendered: Optional[Callable[[], None]] = None
     ):
         """Internal method to update UI (must run on main thread)"""
         # Update question
@@ -463,15 +485,161 @@ class OverlayWindow:
         self._update_confidence(confidence)
 
         # Update tips if provided
+        self._update_tips(tips)
+
+        # Fade in animation
+        self._fade_in()
+
+        if on_rendered:
+            # Flush pending drawing so the timestamp reflects what the user sees
+            self.window.update_idletasks()
+            on_rendered()
+
+    def start_answer(
+        self,
+        question: str,
+        tips: Optional[Dict[str, str]] = None,
+        on_first_token: Optional[Callable[[], None]] = None
+    ):
+        """
+        Show a question and prepare to stream its answer.
+
+        Follow with append_token() for each token and finish_answer()
+        once generation is done.
+
+        Args:
+            question: The detected interview question
+            tips: Optional dict with 'time' and 'method' keys
+            on_first_token: Optional function called on the main thread
+                           once the first token is visible
+        """
+        with self._lock:
+            self._stream_id += 1
+            self._token_buffer = []
+            self.window.after(0, self._start_answer, self._stream_id, question, tips, on_first_token)
+
+    def append_token(self, token: str):
+        """
+        Append a streamed token to the answer (thread-safe).
+
+        Tokens are buffered and drawn in batches, at most
+        MAX_STREAM_UPDATES_PER_SECOND times per second.
+
+        Args:
+            token: Text to append
+        """
+        with self._lock:
+            self._token_buffer.append(token)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+            interval = 1.0 / self.MAX_STREAM_UPDATES_PER_SECOND
+            delay = max(0.0, self._last_flush + interval - time.time())
+            self.window.after(int(delay * 1000), self._flush_tokens, self._stream_id)
+
+    def finish_answer(
+        self,
+        confidence: float,
+        tips: Optional[Dict[str, str]] = None,
+        on_rendered: Optional[Callable[[], None]] = None,
+        answer: Optional[str] = None
+    ):
+        """
+        Complete a streamed answer: draw remaining tokens and the confidence.
+
+        Args:
+            confidence: Confidence score (0.0 to 1.0)
+            tips: Optional dict with 'time' and 'method' keys
+            on_rendered: Optional function called on the main thread once
+                        the complete answer has been drawn
+            answer: The complete answer, shown in place of the "Generating"
+                    placeholder if no token was streamed
+        """
+        with self._lock:
+            self.window.after(0, self._finish_answer, self._stream_id, confidence, tips, on_rendered, answer)
+
+    def _start_answer(self, stream_id: int, question: str, tips: Optional[Dict[str, str]],
+                      on_first_token: Optional[Callable[[], None]]):
+        """Internal method to reset the answer for streaming (main thread)"""
+        if stream_id != self._stream_id:
+            return
+
+        self.question_text.config(text=question)
+
+        self.answer_text.config(state=tk.NORMAL)
+        self.answer_text.delete("1.0", tk.END)
+        self.answer_text.insert("1.0", "⏳ Generating answer...")
+        self.answer_text.config(state=tk.DISABLED)
+        self._awaiting_first_token = True
+        self._on_first_token = on_first_token
+
+        self.confidence_label.config(text="[○○○] --", fg=self.colors.text_secondary)
+        self._update_tips(tips)
+        self._fade_in()
+
+    def _flush_tokens(self, stream_id: Optional[int] = None):
+        """Internal method to append buffered tokens (main thread)"""
+        with self._lock:
+            self._flush_scheduled = False
+            if stream_id is not None and stream_id != self._stream_id:
+                # Scheduled for a previous answer: tokens now in the buffer
+                # belong to the new one, which must be started first
+                if self._token_buffer:
+                    self._flush_scheduled = True
+                    self.window.after(0, self._flush_tokens, self._stream_id)
+                return
+            text = "".join(self._token_buffer)
+            self._token_buffer = []
+            self._last_flush = time.time()
+
+        if not text:
+            return
+
+        self.answer_text.config(state=tk.NORMAL)
+        if self._awaiting_first_token:
+            # Replace the placeholder (leading whitespace is a tokenizer artifact)
+            self.answer_text.delete("1.0", tk.END)
+            text = text.lstrip()
+        # Insert only the new text; the widget is never rebuilt while streaming
+        self.answer_text.insert(tk.END, text)
+        self.answer_text.see(tk.END)
+        self.answer_text.config(state=tk.DISABLED)
+
+        if self._awaiting_first_token and text:
+            self._awaiting_first_token = False
+            if self._on_first_token:
+                self.window.update_idletasks()
+                self._on_first_token()
+                self._on_first_token = None
+
+    def _finish_answer(self, stream_id: int, confidence: float, tips: Optional[Dict[str, str]],
+                       on_rendered: Optional[Callable[[], None]], answer: Optional[str] = None):
+        """Internal method to complete a streamed answer (main thread)"""
+        if stream_id != self._stream_id:
+            return
+
+        # A batched flush may still be scheduled; draw the remainder now
+        self._flush_tokens()
+        if self._awaiting_first_token:
+            # No token arrived: don't leave the placeholder up
+            with self._lock:
+                self._token_buffer.append((answer or "").strip() or self.EMPTY_ANSWER_TEXT)
+            self._flush_tokens()
+        self._update_confidence(confidence)
+        self._update_tips(tips)
+
+        if on_rendered:
+            self.window.update_idletasks()
+            on_rendered()
+
+    def _update_tips(self, tips: Optional[Dict[str, str]]):
+        """Update the tips section if tips are provided"""
         if tips:
             if 'time' in tips:
                 self.tip_time.config(text=f"⏱️  {tips['time']}")
             if 'method' in tips:
                 self.tip_method.config(text=f"📋 {tips['method']}")
 
-        # Fade in animation
-        self._fade_in()
-
     def _update_confidence(self, confidence: float):
         """Update confidence indicator based on score"""
         percentage = int(confidence * 100)
@@ -531,6 +699,8 @@ class OverlayWindow:
     def clear(self):
         """Clear current suggestion and show waiting state"""
         with self._lock:
+            self._stream_id += 1
+            self._token_buffer = []
             self.window.after(0, self._clear_suggestion)
 
     def _clear_suggestion(self):
@@ -0,0 +1,221 @@
+"""
+Question Scheduler for Interview Whisperer
+
+Runs question handling on a single worker with a one-slot "latest"
+mailbox. When the interviewer asks a second question before the first is
+answered, the first is abandoned instead of competing with the second
+for the local model:
+
+- A question still waiting in the mailbox is replaced (dropped)
+- A question being answered is cancelled (preempted); its handler checks
+  the job's cancelled flag, and cancel callbacks registered on the job
+  stop work already in flight (e.g. the Ollama request)
+"""
+
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QuestionJob:
+    """One detected question waiting for, or receiving, an answer."""
+    id: int
+    question: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    submitted_at: float = field(default_factory=time.time)
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    _cancel_callbacks: List[Callable[[], Any]] = field(default_factory=list, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True once a newer question superseded this one."""
+        return self.cancelled.is_set()
+
+    def add_cancel_callback(self, fn: Callable[[], Any]) -> None:
+        """
+        Call fn when the job is cancelled (immediately if it already is).
+
+        Args:
+            fn: Stops work started for this job, e.g. GenerationHandle.cancel
+        """
+        with self._lock:
+            if not self.cancelled.is_set():
+                self._cancel_callbacks.append(fn)
+                return
+        self._call(fn)
+
+    def cancel(self) -> bool:
+        """
+        Cancel the job and run its cancel callbacks.
+
+        Returns:
+            True if the job was not already cancelled
+        """
+        with self._lock:
+            if self.cancelled.is_set():
+                return False
+            self.cancelled.set()
+            callbacks, self._cancel_callbacks = self._cancel_callbacks, []
+        for fn in callbacks:
+            self._call(fn)
+        return True
+
+    @staticmethod
+    def _call(fn: Callable[[], Any]) -> None:
+        try:
+            fn()
+        except Exception as e:
+            logger.warning(f"Cancel callback failed: {e}")
+
+
+class QuestionScheduler:
+    """
+    Single worker, latest question wins.
+
+    Usage:
+        scheduler = QuestionScheduler(handle_job)
+        scheduler.submit(question, max_tokens=250)
+
+    The handler runs on the worker thread, one job at a time. It should
+    register cancel callbacks for background work it starts and stop
+    (without touching the UI) once job.is_cancelled is set.
+    """
+
+    def __init__(self, handler: Callable[[QuestionJob], None]):
+        """
+        Initialize the scheduler.
+
+        Args:
+            handler: handler(job), called on the worker thread
+        """
+        self.handler = handler
+
+        self._cond = threading.Condition()
+        self._pending: Optional[QuestionJob] = None
+        self._current: Optional[QuestionJob] = None
+        self._ids = itertools.count(1)
+        self._worker: Optional[threading.Thread] = None
+        self._shutdown = False
+
+        # Counters
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.preempted = 0
+
+    def submit(self, question: str, **kwargs: Any) -> QuestionJob:
+        """
+        Queue a question, superseding any older one.
+
+        Args:
+            question: The detected question
+            **kwargs: Passed to the handler as job.kwargs
+
+        Returns:
+            The queued job
+        """
+        job = QuestionJob(id=next(self._ids), question=question, kwargs=kwargs)
+        preempted = None
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Question scheduler is shut down")
+            self.submitted += 1
+
+            if self._pending is not None:
+                # Never started, so no callbacks to run
+                self._pending.cancel()
+                self.dropped += 1
+                logger.info(f"Dropped unanswered question: {self._pending.question}")
+            if self._current is not None and not self._current.is_cancelled:
+                preempted = self._current
+                self.preempted += 1
+                logger.info(f"Preempted question: {preempted.question}")
+
+            self._pending = job
+            self._ensure_worker()
+            self._cond.notify()
+
+        # Outside the lock: callbacks may block briefly (e.g. closing a request)
+        if preempted is not None:
+            preempted.cancel()
+        return job
+
+    def cancel_all(self) -> None:
+        """Drop the waiting question and cancel the running one (counters unchanged)."""
+        with self._cond:
+            pending, self._pending = self._pending, None
+            current = self._current
+        for job in (pending, current):
+            if job is not None:
+                job.cancel()
+
+    def reset_stats(self) -> None:
+        """Zero the counters (e.g. at the start of a session)."""
+        with self._cond:
+            self.submitted = self.completed = self.dropped = self.preempted = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with submitted/completed/dropped/preempted counts and
+            whether a question is running or waiting
+        """
+        with self._cond:
+            return {
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'dropped': self.dropped,
+                'preempted': self.preempted,
+                'running': self._current.question if self._current else None,
+                'pending': self._pending is not None
+            }
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Cancel outstanding work and stop the worker."""
+        self.cancel_all()
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread (condition held)."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, daemon=True, name="QuestionWorker")
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._shutdown:
+                    self._cond.wait()
+                if self._shutdown:
+                    return
+                job, self._pending = self._pending, None
+                self._current = job
+
+            try:
+                self.handler(job)
+            except Exception as e:
+                logger.error(f"Question handler failed: {e}", exc_info=True)
+            finally:
+                with self._cond:
+                    self._current = None
+                    if not job.is_cancelled:
+                        self.completed += 1
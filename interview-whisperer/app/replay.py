@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Offline Replay for Interview Whisperer
+
+Feeds recorded interviews through AudioEngine (the same chunking,
+transcription and question detection path as the microphone), either
+paced at real time or as fast as possible, and reports per-chunk
+latency, real-time factor and detected questions.
+
+Use it as a regression and performance harness for Whisper model and
+audio config changes:
+
+    python replay.py interview.wav --model base --json report.json
+"""
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+try:
+    from .audio_engine import AudioEngine, AudioConfig
+    from .audio_sources import ArraySource, FileSource
+except ImportError:
+    # Fallback for direct execution
+    from audio_engine import AudioEngine, AudioConfig
+    from audio_sources import ArraySource, FileSource
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayReport:
+    """Results of one replay run."""
+    audio_seconds: float
+    wall_seconds: float = 0.0
+    model_load_seconds: float = 0.0
+    chunks: List[Dict[str, Any]] = field(default_factory=list)
+    transcripts: List[Dict[str, Any]] = field(default_factory=list)
+    completed: bool = True
+
+    @property
+    def questions(self) -> List[str]:
+        """Transcripts detected as questions, in order."""
+        return [t['text'] for t in self.transcripts if t['is_question']]
+
+    @property
+    def realtime_factor(self) -> float:
+        """Wall time / audio time for the whole run (< 1.0 is faster than real time)."""
+        return self.wall_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+    def latency_percentiles(self) -> Dict[str, float]:
+        """p50/p95/max latency (seconds) over chunks that produced text."""
+        latencies = [c['latency'] for c in self.chunks if c['text']]
+        if not latencies:
+            return {'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+        return {
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+            'max': float(max(latencies))
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get headline numbers.
+
+        Returns:
+            Dictionary with audio/wall time, real-time factors, chunk
+            counts, latency percentiles and detected questions
+        """
+        decode_seconds = sum(c['decode_seconds'] for c in self.chunks)
+        return {
+            'completed': self.completed,
+            'audio_seconds': round(self.audio_seconds, 2),
+            'wall_seconds': round(self.wall_seconds, 2),
+            'model_load_seconds': round(self.model_load_seconds, 2),
+            'realtime_factor': round(self.realtime_factor, 3),
+            'decode_realtime_factor': round(decode_seconds / self.audio_seconds, 3) if self.audio_seconds else 0.0,
+            'chunks': len(self.chunks),
+            'chunks_with_text': sum(1 for c in self.chunks if c['text']),
+            'latency': {k: round(v, 3) for k, v in self.latency_percentiles().items()},
+            'questions': self.questions
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Full report (summary, per-chunk metrics and transcripts) for JSON output."""
+        return {
+            'summary': self.summary(),
+            'chunks': self.chunks,
+            'transcripts': self.transcripts
+        }
+
+
+def replay(
+    audio: Union[str, Path, np.ndarray],
+    model: str = "base",
+    config: Optional[AudioConfig] = None,
+    realtime: bool = False,
+    sample_rate: int = 16000,
+    language: str = "en",
+    timeout: Optional[float] = None
+) -> ReplayReport:
+    """
+    Run recorded audio through AudioEngine and collect metrics.
+
+    Args:
+        audio: Path to a WAV/FLAC file, or a NumPy array of samples
+        model: Whisper model size
+        config: AudioConfig to test (defaults to AudioConfig())
+        realtime: Pace the audio at real time instead of as fast as possible
+        sample_rate: Sample rate of ``audio`` when it is an array
+        language: Transcription language code
+        timeout: Maximum seconds for the whole run (None waits indefinitely)
+
+    Returns:
+        ReplayReport with per-chunk metrics and transcripts
+    """
+    if isinstance(audio, np.ndarray):
+        source = ArraySource(audio, sample_rate=sample_rate, realtime=realtime)
+    else:
+        source = FileSource(audio, realtime=realtime)
+
+    report = ReplayReport(audio_seconds=source.duration)
+    engine = AudioEngine(model=model, language=language, config=config, source=source)
+
+    # Model loading is reported separately so it does not skew the RTF
+    load_start = time.perf_counter()
+    if not engine.wait_until_ready():
+        raise RuntimeError(f"Whisper model '{model}' failed to load")
+    report.model_load_seconds = time.perf_counter() - load_start
+
+    def on_transcript(text: str, is_question: bool) -> None:
+        report.transcripts.append({'text': text, 'is_question': is_question})
+
+    try:
+        start = time.perf_counter()
+        engine.start_listening(on_transcript, chunk_callback=report.chunks.append)
+        report.completed = engine.wait_until_finished(timeout)
+        report.wall_seconds = time.perf_counter() - start
+    finally:
+        engine.close()
+
+    if not report.completed:
+        logger.warning(f"Replay timed out after {timeout}s; report is partial")
+    return report
+
+
+def _print_report(report: ReplayReport) -> None:
+    """Print a human-readable report."""
+    summary = report.summary()
+
+    print("=" * 60)
+    print("Replay Report")
+    print("=" * 60)
+    print(f"Audio:        {summary['audio_seconds']:.1f}s")
+    print(f"Wall time:    {summary['wall_seconds']:.1f}s (model load {summary['model_load_seconds']:.1f}s)")
+    print(f"RTF:          {summary['realtime_factor']:.3f} overall, {summary['decode_realtime_factor']:.3f} decode")
+    print(f"Chunks:       {summary['chunks']} ({summary['chunks_with_text']} with text)")
+    latency = summary['latency']
+    print(f"Latency:      p50 {latency['p50']:.2f}s | p95 {latency['p95']:.2f}s | max {latency['max']:.2f}s")
+    print()
+
+    print(f"Questions detected: {len(summary['questions'])}")
+    for question in summary['questions']:
+        print(f"  ❓ {question}")
+
+    if not summary['completed']:
+        print("\n⚠️  Replay timed out; results are partial")
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Replay recorded audio through the Audio Engine - Interview Whisperer"
+    )
+    parser.add_argument("audio", type=str, help="WAV (or FLAC with soundfile) recording")
+    parser.add_argument("--model", type=str, default="base", help="Whisper model size")
+    parser.add_argument("--realtime", action="store_true", help="Pace playback at real time")
+    parser.add_argument("--segmentation", choices=["vad", "fixed"], default="vad", help="Chunking mode")
+    parser.add_argument("--streaming", action="store_true", help="Use streaming transcription")
+    parser.add_argument("--workers", type=int, default=1, help="Transcription worker processes")
+    parser.add_argument("--timeout", type=float, default=None, help="Abort after this many seconds")
+    parser.add_argument("--json", type=str, default=None, help="Write the full report to this file")
+
+    args = parser.parse_args()
+
+    config = AudioConfig(
+        segmentation=args.segmentation,
+        streaming=args.streaming,
+        transcription_workers=args.workers
+    )
+
+    try:
+        result = replay(args.audio, model=args.model, config=config,
+                        realtime=args.realtime, timeout=args.timeout)
+    except Exception as e:
+        print(f"✗ Replay failed: {e}")
+        sys.exit(1)
+
+    _print_report(result)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result.to_dict(), f, indent=2)
+        print(f"\n✓ Report written to {args.json}")
@@ -185,6 +185,17 @@ class SettingsDialog:
         context_spin.grid(row=8, column=1, padx=10, pady=5, sticky=tk.W)
         self._create_info(frame, "How much audio context to keep", 9)
 
+        # Streaming Transcription
+        self._create_label(frame, "Streaming Transcription:", 10)
+        self.streaming_var = tk.BooleanVar(value=self.settings.audio.streaming)
+        streaming_check = tk.Checkbutton(frame,
+                                        variable=self.streaming_var,
+                                        bg=self.colors['bg_medium'],
+                                        fg=self.colors['fg_primary'],
+                                        selectcolor=self.colors['bg_light'])
+        streaming_check.grid(row=10, column=1, padx=10, pady=5, sticky=tk.W)
+        self._create_info(frame, "Show words within ~2s instead of per chunk", 11)
+
     def _create_display_tab(self):
         """Create display preferences tab"""
         frame = ttk.Frame(self.notebook, style="Medium.TFrame", padding="20")
@@ -484,6 +495,7 @@ class SettingsDialog:
         self.settings.audio.chunk_duration = self.chunk_dur_var.get()
         self.settings.audio.silence_duration = self.silence_dur_var.get()
         self.settings.audio.context_duration = self.context_dur_var.get()
+        self.settings.audio.streaming = self.streaming_var.get()
 
         self.settings.display.width = self.width_var.get()
         self.settings.display.height = self.height_var.get()
@@ -551,6 +563,7 @@ class SettingsDialog:
             self.chunk_dur_var.set(self.settings.audio.chunk_duration)
             self.silence_dur_var.set(self.settings.audio.silence_duration)
             self.context_dur_var.set(self.settings.audio.context_duration)
+            self.streaming_var.set(self.settings.audio.streaming)
 
             self.width_var.set(self.settings.display.width)
             self.height_var.set(self.settings.display.height)
@@ -6,6 +6,7 @@ Handles loading, saving, and validation of user preferences
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
@@ -20,9 +21,17 @@ class AudioSettings:
     sample_rate: int = 16000
     channels: int = 1
     chunk_duration: float = 5.0
+    segmentation: str = "vad"  # vad (per utterance) or fixed (per chunk_duration)
     silence_threshold: float = 0.01  # Voice activation sensitivity
     silence_duration: float = 1.5
     context_duration: float = 30.0
+    streaming: bool = False  # Sliding-window transcription with partial results
+    stream_step: float = 1.0
+    stream_window: float = 10.0
+    transcription_workers: int = 1  # Whisper worker processes (1 = in-thread)
+    queue_size: int = 8  # Chunks waiting for transcription before backpressure
+    queue_policy: str = "coalesce"  # drop_oldest, drop_newest or coalesce
+    max_chunk_age: float = 10.0  # Queueing delay (s) treated as behind real time
 
 
 @dataclass
@@ -41,8 +50,12 @@ class DisplaySettings:
 @dataclass
 class DocumentSettings:
     """Document processing options"""
-    chunk_size: int = 500  # words
-    chunk_overlap: int = 50  # words
+    chunk_size: int = 500  # in chunk_unit
+    chunk_overlap: int = 50  # in chunk_unit
+    chunk_unit: str = "words"  # words or tokens (embedding model's tokenizer, needs tokenizers)
+    embed_batch_size: int = 32  # Chunks per Ollama embed request
+    embed_concurrency: int = 2  # Embed requests in flight at once
+    extract_workers: int = 0  # Processes extracting PDF/DOCX text (0 = one per CPU)
     supported_extensions: list = None
     auto_process: bool = False  # Auto-process new documents
 
@@ -60,6 +73,24 @@ class LLMSettings:
     temperature: float = 0.7
     max_tokens: int = 250
     n_results: int = 3  # Number of context chunks to retrieve
+    retrieval_mode: str = "hybrid"  # hybrid (vector + BM25), vector or bm25
+    embedding_timeout: float = 2.0  # Seconds before retrieval falls back to BM25 alone
+    vector_backend: str = "chroma"  # chroma, or numpy (memory-mapped brute-force search)
+    vector_dtype: str = "float32"  # NumPy index storage: float32 or float16 (half the memory)
+    speculative_retrieval: bool = True  # Retrieve context from partial transcripts (streaming mode)
+    stream_answers: bool = True  # Stream tokens into the overlay as they are generated
+    prompt_cache: bool = True  # Fixed system prompt so Ollama reuses the prompt prefix's KV cache
+    draft_model: str = ""  # Small (1-3B) Ollama model that drafts answers first; "" disables the cascade
+    refine_threshold: float = 0.8  # Draft confidence at which the main model's refine pass is skipped
+    parallel_refine: bool = False  # Run the main model alongside the draft instead of after it
+    answer_cache: bool = True  # Reuse answers to semantically repeated questions
+    answer_cache_threshold: float = 0.92  # Cosine similarity for an answer cache hit
+    answer_bank: bool = True  # Show pre-generated answers to common questions first
+    answer_bank_threshold: float = 0.85  # Cosine similarity to the nearest bank question
+    answer_bank_workers: int = 4  # Concurrent Ollama requests when building the bank
+    keep_models_warm: bool = True  # Preload Ollama models and keep them loaded during a session
+    keep_alive_minutes: int = 10  # How long Ollama keeps a model after each request
+    keep_alive_interval: float = 60.0  # Seconds between keep-alive heartbeats
 
 
 class SettingsManager:
@@ -178,6 +209,28 @@ class SettingsManager:
         if not (1 <= self.audio.chunk_duration <= 30):
             warnings.append(f"Chunk duration {self.audio.chunk_duration}s may cause issues")
 
+        if self.audio.segmentation not in ['vad', 'fixed']:
+            errors.append(f"Invalid segmentation mode: {self.audio.segmentation}")
+
+        if self.audio.stream_window > 30:
+            errors.append("Streaming window cannot exceed Whisper's 30 second context")
+
+        if self.audio.stream_step >= self.audio.stream_window:
+            errors.append("Streaming step must be shorter than the streaming window")
+
+        max_workers = os.cpu_count() or 1
+        if not (1 <= self.audio.transcription_workers <= max_workers):
+            errors.append(f"Transcription workers must be between 1 and {max_workers}")
+
+        if self.audio.queue_size < 1:
+            errors.append("Audio queue size must be at least 1")
+
+        if self.audio.queue_policy not in ['drop_oldest', 'drop_newest', 'coalesce']:
+            errors.append(f"Invalid queue policy: {self.audio.queue_policy}")
+
+        if self.audio.max_chunk_age <= 0:
+            errors.append("Max chunk age must be positive")
+
         # Display validation
         if not (0.1 <= self.display.transparency <= 1.0):
             errors.append(f"Transparency must be between 0.1 and 1.0")
@@ -198,6 +251,20 @@ class SettingsManager:
         if self.document.chunk_overlap >= self.document.chunk_size:
             errors.append("Chunk overlap must be less than chunk size")
 
+        if self.document.chunk_unit not in ('words', 'tokens'):
+            errors.append(f"Chunk unit must be 'words' or 'tokens', not '{self.document.chunk_unit}'")
+
+        if self.document.embed_batch_size < 1:
+            errors.append("Embedding batch size must be at least 1")
+
+        if self.document.extract_workers < 0:
+            errors.append("Extraction workers must be 0 (one per CPU) or more")
+
+        if self.document.embed_concurrency < 1:
+            errors.append("Embedding concurrency must be at least 1")
+        elif self.document.embed_concurrency > 8:
+            warnings.append("Embedding concurrency > 8 mostly queues requests inside Ollama")
+
         # LLM validation
         if not (0.0 <= self.llm.temperature <= 2.0):
             warnings.append(f"Temperature {self.llm.temperature} is outside normal range (0.0-2.0)")
@@ -205,6 +272,39 @@ class SettingsManager:
         if not (50 <= self.llm.max_tokens <= 1000):
             warnings.append(f"Max tokens {self.llm.max_tokens} may be too extreme")
 
+        if self.llm.retrieval_mode not in ['hybrid', 'vector', 'bm25']:
+            errors.append(f"Invalid retrieval mode: {self.llm.retrieval_mode}")
+
+        if self.llm.embedding_timeout <= 0:
+            errors.append("Embedding timeout must be positive")
+
+        if self.llm.vector_backend not in ['chroma', 'numpy']:
+            errors.append(f"Invalid vector backend: {self.llm.vector_backend}")
+
+        if self.llm.vector_dtype not in ['float32', 'float16']:
+            errors.append(f"Invalid vector dtype: {self.llm.vector_dtype}")
+
+        if not (0.0 < self.llm.refine_threshold <= 1.0):
+            errors.append("Refine threshold must be between 0 and 1")
+        if self.llm.draft_model and self.llm.draft_model == self.llm.ollama_llm_model:
+            warnings.append("Draft model is the main model; the cascade only adds latency")
+
+        if not (0.0 < self.llm.answer_cache_threshold <= 1.0):
+            errors.append("Answer cache threshold must be between 0 and 1")
+        elif self.llm.answer_cache_threshold < 0.85:
+            warnings.append("Answer cache threshold < 0.85 may reuse answers for different questions")
+
+        if not (0.0 < self.llm.answer_bank_threshold <= 1.0):
+            errors.append("Answer bank threshold must be between 0 and 1")
+
+        if self.llm.answer_bank_workers < 1:
+            errors.append("Answer bank workers must be at least 1")
+
+        if self.llm.keep_alive_minutes < 1:
+            errors.append("Keep-alive must be at least 1 minute")
+        elif not (0 < self.llm.keep_alive_interval < self.llm.keep_alive_minutes * 60):
+            errors.append("Keep-alive interval must be positive and shorter than the keep-alive")
+
         return {'errors': errors, 'warnings': warnings}
 
     def get_audio_config(self) -> Dict[str, Any]:
@@ -214,9 +314,17 @@ class SettingsManager:
             'sample_rate': self.audio.sample_rate,
             'channels': self.audio.channels,
             'chunk_duration': self.audio.chunk_duration,
+            'segmentation': self.audio.segmentation,
             'silence_threshold': self.audio.silence_threshold,
             'silence_duration': self.audio.silence_duration,
-            'context_duration': self.audio.context_duration
+            'context_duration': self.audio.context_duration,
+            'streaming': self.audio.streaming,
+            'stream_step': self.audio.stream_step,
+            'stream_window': self.audio.stream_window,
+            'transcription_workers': self.audio.transcription_workers,
+            'queue_size': self.audio.queue_size,
+            'queue_policy': self.audio.queue_policy,
+            'max_chunk_age': self.audio.max_chunk_age
         }
 
     def get_overlay_config(self) -> Dict[str, Any]:
@@ -237,6 +345,10 @@ class SettingsManager:
         return {
             'chunk_size': self.document.chunk_size,
             'chunk_overlap': self.document.chunk_overlap,
+            'chunk_unit': self.document.chunk_unit,
+            'embed_batch_size': self.document.embed_batch_size,
+            'embed_concurrency': self.document.embed_concurrency,
+            'extract_workers': self.document.extract_workers,
             'supported_extensions': self.document.supported_extensions,
             'auto_process': self.document.auto_process
         }
@@ -249,7 +361,25 @@ class SettingsManager:
             'host': self.llm.ollama_host,
             'temperature': self.llm.temperature,
             'max_tokens': self.llm.max_tokens,
-            'n_results': self.llm.n_results
+            'n_results': self.llm.n_results,
+            'retrieval_mode': self.llm.retrieval_mode,
+            'embedding_timeout': self.llm.embedding_timeout,
+            'vector_backend': self.llm.vector_backend,
+            'vector_dtype': self.llm.vector_dtype,
+            'speculative_retrieval': self.llm.speculative_retrieval,
+            'stream_answers': self.llm.stream_answers,
+            'prompt_cache': self.llm.prompt_cache,
+            'draft_model': self.llm.draft_model,
+            'refine_threshold': self.llm.refine_threshold,
+            'parallel_refine': self.llm.parallel_refine,
+            'answer_cache': self.llm.answer_cache,
+            'answer_cache_threshold': self.llm.answer_cache_threshold,
+            'answer_bank': self.llm.answer_bank,
+            'answer_bank_threshold': self.llm.answer_bank_threshold,
+            'answer_bank_workers': self.llm.answer_bank_workers,
+            'keep_models_warm': self.llm.keep_models_warm,
+            'keep_alive_minutes': self.llm.keep_alive_minutes,
+            'keep_alive_interval': self.llm.keep_alive_interval
         }
 
 
@@ -0,0 +1,210 @@
+"""
+Speculative Retrieval for Interview Whisperer
+
+Starts question embedding and ChromaDB retrieval on transcripts *before*
+they are confirmed as questions (streaming partials, non-question
+utterances). Results are kept in a short-lived cache keyed by the
+normalized transcript span, so when a question is confirmed its context
+is usually already there and retrieval is off the critical path.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# retrieve_fn(text) -> context chunks (LLMEngine.retrieve_context)
+RetrieveFn = Callable[[str], List[Dict[str, Any]]]
+
+# Normalized transcript span
+SpanKey = Tuple[str, ...]
+
+
+def span_key(text: str) -> SpanKey:
+    """Normalize a transcript into a cache key (lowercase words, no punctuation)."""
+    return tuple(re.findall(r"[\w']+", text.lower()))
+
+
+class SpeculativeRetriever:
+    """
+    Prefetches retrieval results for transcript spans.
+
+    Usage:
+        retriever = SpeculativeRetriever(llm_engine.retrieve_context)
+        retriever.prefetch(partial_text)          # as transcripts arrive
+        context = retriever.get(question_text)    # when a question is confirmed
+
+    A single background thread runs retrievals. A prefetch that has not
+    started yet is cancelled when a newer one arrives (partials supersede
+    each other), so the queue never grows beyond one pending span.
+
+    A confirmed question matches a cached span when their word sets are
+    similar enough (Jaccard >= ``min_similarity``): the last streaming
+    partial and the final sentence usually differ only by a late word or
+    a correction.
+    """
+
+    def __init__(
+        self,
+        retrieve_fn: RetrieveFn,
+        ttl: float = 20.0,
+        max_entries: int = 32,
+        min_words: int = 3,
+        min_similarity: float = 0.8
+    ):
+        """
+        Initialize the retriever.
+
+        Args:
+            retrieve_fn: Function returning context chunks for a text
+            ttl: Seconds a prefetched result stays usable
+            max_entries: Maximum cached spans (oldest evicted first)
+            min_words: Spans shorter than this are not prefetched
+            min_similarity: Word-set Jaccard similarity for a cache hit
+        """
+        self.retrieve_fn = retrieve_fn
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.min_words = min_words
+        self.min_similarity = min_similarity
+
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[SpanKey, Tuple[float, Future]]" = OrderedDict()
+        self._pending: Optional[Tuple[SpanKey, Future]] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SpeculativeRetrieval")
+
+        # Counters
+        self.prefetches = 0
+        self.superseded = 0
+        self.hits = 0
+        self.misses = 0
+
+    def prefetch(self, text: str) -> bool:
+        """
+        Start retrieval for a transcript span in the background.
+
+        Args:
+            text: Partial or non-question transcript
+
+        Returns:
+            True if a new retrieval was started
+        """
+        key = span_key(text)
+        if len(key) < self.min_words:
+            return False
+
+        with self._lock:
+            self._expire()
+            if key in self._cache:
+                return False
+
+            # A newer span supersedes one still waiting for the worker
+            if self._pending is not None:
+                pending_key, pending_future = self._pending
+                if pending_future.cancel():
+                    self._cache.pop(pending_key, None)
+                    self.superseded += 1
+
+            future = self._executor.submit(self.retrieve_fn, " ".join(key))
+            self._cache[key] = (time.time(), future)
+            self._pending = (key, future)
+            self.prefetches += 1
+
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return True
+
+    def get(self, question: str, timeout: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get prefetched context for a confirmed question.
+
+        Waits for a matching retrieval that is still running (it started
+        earlier than a fresh one would).
+
+        Args:
+            question: Confirmed question text
+            timeout: Maximum seconds to wait for a running retrieval
+
+        Returns:
+            Context chunks, or None if nothing usable was prefetched
+        """
+        future = self._match(span_key(question))
+        if future is None:
+            self.misses += 1
+            return None
+
+        try:
+            context = future.result(timeout=timeout)
+        except Exception as e:
+            logger.debug(f"Speculative retrieval unusable: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return context
+
+    def _match(self, key: SpanKey) -> Optional[Future]:
+        """Find the most similar live cached span (most recent wins ties)."""
+        if not key:
+            return None
+        words = set(key)
+
+        with self._lock:
+            self._expire()
+            exact = self._cache.get(key)
+            if exact is not None and not exact[1].cancelled():
+                return exact[1]
+
+            best, best_score = None, 0.0
+            for cached_key, (_, future) in reversed(self._cache.items()):
+                if future.cancelled():
+                    continue
+                cached = set(cached_key)
+                score = len(words & cached) / len(words | cached)
+                if score >= self.min_similarity and score > best_score:
+                    best, best_score = future, score
+            return best
+
+    def _expire(self) -> None:
+        """Drop entries older than the TTL (lock held)."""
+        cutoff = time.time() - self.ttl
+        while self._cache:
+            key, (created, _) = next(iter(self._cache.items()))
+            if created >= cutoff:
+                break
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached spans (e.g. after documents are re-indexed)."""
+        with self._lock:
+            for _, future in self._cache.values():
+                future.cancel()
+            self._cache.clear()
+            self._pending = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get retriever statistics.
+
+        Returns:
+            Dictionary with cache size, prefetch/superseded counts and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'cached_spans': len(self._cache),
+            'prefetches': self.prefetches,
+            'superseded': self.superseded,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+    def shutdown(self) -> None:
+        """Stop the background thread (pending prefetches are cancelled)."""
+        self.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
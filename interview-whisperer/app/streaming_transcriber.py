@@ -0,0 +1,185 @@
+"""
+Streaming Transcriber for Interview Whisperer
+
+Incremental transcription over a sliding audio window. The window is
+re-decoded every step, and only the words that two consecutive hypotheses
+agree on are committed (local agreement). Committed words are never
+emitted twice, and the window is trimmed behind the last committed word so
+decoding cost stays bounded.
+
+The transcriber is independent of Whisper: it is driven by a
+``transcribe_fn(audio, prompt)`` that returns word timestamps.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class TimedWord:
+    """A transcribed word with absolute start/end times in seconds."""
+    start: float
+    end: float
+    text: str
+
+
+# transcribe_fn(audio, prompt) -> [(start, end, word), ...] relative to audio start
+TranscribeFn = Callable[[np.ndarray, str], List[Tuple[float, float, str]]]
+
+
+def _normalize(word: str) -> str:
+    """Normalize a word for agreement checks (case and punctuation insensitive)."""
+    return re.sub(r'[^\w\']', '', word.lower())
+
+
+class StreamingTranscriber:
+    """
+    Sliding-window transcriber with local-agreement commits.
+
+    Usage:
+        streamer = StreamingTranscriber(transcribe_fn, sample_rate=16000)
+        committed, tentative = streamer.push(block)   # every step
+        committed += streamer.flush()                  # on pause / stop
+    """
+
+    # Words starting this close before the last commit are treated as new
+    COMMIT_TOLERANCE = 0.1
+
+    # Longest n-gram checked when de-duplicating the committed tail
+    MAX_OVERLAP_WORDS = 5
+
+    # Characters of committed text passed to the decoder as a prompt
+    PROMPT_CHARS = 200
+
+    def __init__(self, transcribe_fn: TranscribeFn, sample_rate: int = 16000,
+                 window_duration: float = 10.0):
+        """
+        Initialize the streaming transcriber.
+
+        Args:
+            transcribe_fn: Function decoding audio into timed words
+            sample_rate: Audio sample rate in Hz
+            window_duration: Maximum seconds of audio re-decoded per step
+        """
+        self.transcribe_fn = transcribe_fn
+        self.sample_rate = sample_rate
+        self.window_duration = window_duration
+        self._prompt = ""
+        self.reset()
+
+    @property
+    def has_pending(self) -> bool:
+        """True if there are tentative (uncommitted) words."""
+        return bool(self._tentative)
+
+    @property
+    def window_seconds(self) -> float:
+        """Seconds of audio currently in the decode window."""
+        return len(self._audio) / self.sample_rate
+
+    def reset(self, keep_prompt: bool = True) -> None:
+        """
+        Drop the audio window and all uncommitted state.
+
+        Args:
+            keep_prompt: Keep committed text as decoder context
+        """
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._offset = 0.0  # Absolute time of the window start
+        self._committed_end = 0.0
+        self._committed_tail: List[TimedWord] = []
+        self._tentative: List[TimedWord] = []
+        if not keep_prompt:
+            self._prompt = ""
+
+    def push(self, audio: np.ndarray) -> Tuple[List[str], List[str]]:
+        """
+        Append audio, re-decode the window and commit the agreed prefix.
+
+        Args:
+            audio: New float32 samples
+
+        Returns:
+            Tuple of (newly committed words, tentative words)
+        """
+        self._audio = np.concatenate((self._audio, audio.astype(np.float32, copy=False)))
+
+        words = [
+            TimedWord(start + self._offset, end + self._offset, text.strip())
+            for start, end, text in self.transcribe_fn(self._audio, self._prompt)
+            if text.strip()
+        ]
+        hypothesis = self._drop_committed(words)
+
+        # Commit the longest prefix both hypotheses agree on
+        agreed = 0
+        for previous, current in zip(self._tentative, hypothesis):
+            if _normalize(previous.text) != _normalize(current.text):
+                break
+            agreed += 1
+
+        committed = hypothesis[:agreed]
+        self._tentative = hypothesis[agreed:]
+        self._commit(committed)
+
+        if self.window_seconds > self.window_duration:
+            cut = self._offset + self.window_seconds - self.window_duration
+            if self._committed_end < cut:
+                # Words in audio about to leave the window are accepted as is
+                forced = 0
+                while forced < len(self._tentative) and self._tentative[forced].start < cut:
+                    forced += 1
+                committed += self._tentative[:forced]
+                self._commit(self._tentative[:forced])
+                self._tentative = self._tentative[forced:]
+            self._trim(max(self._committed_end, cut))
+
+        return [w.text for w in committed], [w.text for w in self._tentative]
+
+    def flush(self) -> List[str]:
+        """
+        Commit all tentative words (end of utterance or stream).
+
+        Returns:
+            Newly committed words
+        """
+        flushed = self._tentative
+        self._commit(flushed)
+        self._tentative = []
+        self._trim(self._offset + self.window_seconds)
+        return [w.text for w in flushed]
+
+    def _drop_committed(self, words: List[TimedWord]) -> List[TimedWord]:
+        """Remove words already committed from a new hypothesis."""
+        fresh = [w for w in words if w.start >= self._committed_end - self.COMMIT_TOLERANCE]
+        if not fresh or not self._committed_tail:
+            return fresh
+
+        # Re-decoded boundary words can reappear with shifted timestamps:
+        # drop a leading n-gram that repeats the committed tail
+        tail = [_normalize(w.text) for w in self._committed_tail]
+        head = [_normalize(w.text) for w in fresh]
+        for n in range(min(self.MAX_OVERLAP_WORDS, len(tail), len(head)), 0, -1):
+            if tail[-n:] == head[:n]:
+                return fresh[n:]
+        return fresh
+
+    def _commit(self, words: List[TimedWord]) -> None:
+        """Record committed words and update the decoder prompt."""
+        if not words:
+            return
+        self._committed_end = words[-1].end
+        self._committed_tail = (self._committed_tail + words)[-self.MAX_OVERLAP_WORDS:]
+        self._prompt = (self._prompt + " " + " ".join(w.text for w in words)).strip()[-self.PROMPT_CHARS:]
+
+    def _trim(self, until: float) -> None:
+        """Drop window audio before absolute time ``until``."""
+        cut = int((until - self._offset) * self.sample_rate)
+        if cut <= 0:
+            return
+        cut = min(cut, len(self._audio))
+        self._audio = self._audio[cut:]
+        self._offset += cut / self.sample_rate
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Answer Bank
+
+Tests the batch build with fake answer and embedding functions:
+- Built-in and user-supplied questions are merged without duplicates
+- Every question is answered, stored with its context, and matched later
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from answer_bank import AnswerBank, DEFAULT_QUESTIONS, load_questions
+
+
+def test_load_questions_merges_user_file():
+    """User questions are appended; repeats of built-in ones are skipped."""
+    print("Testing question loading...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "question_bank.txt"
+        path.write_text("# my questions\nWhy fintech?\ntell me about yourself\n\n")
+
+        questions = load_questions(path)
+        assert questions[:len(DEFAULT_QUESTIONS)] == DEFAULT_QUESTIONS
+        assert questions[len(DEFAULT_QUESTIONS):] == ["Why fintech?"], questions
+    print("   ✓ Built-in + user questions, deduplicated")
+    return True
+
+
+def test_build_stores_answers_and_contexts():
+    """Concurrent build answers every question; failures are counted."""
+    print("\nTesting bank build...")
+    vectors = {"Why fintech?": [1.0, 0.0, 0.0], "Tell me about yourself.": [0.0, 1.0, 0.0],
+               "Broken question": [0.0, 0.0, 1.0]}
+
+    def answer_fn(question):
+        if question == "Broken question":
+            return {'answer': "", 'error': "model unavailable"}
+        return {'answer': f"Answer to {question}", 'confidence': 0.8, 'sources': ['resume.pdf'],
+                'context_used': True, 'context': [{'text': 'ctx', 'source': 'resume.pdf', 'score': 0.8}]}
+
+    progress = []
+    with tempfile.TemporaryDirectory() as tmp:
+        bank = AnswerBank(Path(tmp) / "answer_bank")
+        assert not bank.is_current("index-a")
+        stats = bank.build(list(vectors), answer_fn, vectors.get, "index-a", workers=3,
+                           progress_callback=lambda current, total, message: progress.append(current))
+
+        assert stats['stored'] == 2 and stats['failed'] == 1, stats
+        assert sorted(progress) == [1, 2, 3]
+
+        hit = bank.lookup([0.99, 0.05, 0.0], "index-a")
+        assert hit is not None
+        entry, _ = hit
+        assert entry['question'] == "Why fintech?" and entry['context'][0]['text'] == 'ctx'
+
+        # Built for this index only; a new index needs a rebuild
+        assert bank.is_current("index-a") and not bank.is_current("index-b")
+    print("   ✓ Answers and contexts stored, failed question reported")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Answer Bank Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Question Loading", test_load_questions_merges_user_file),
+        ("Bank Build", test_build_stores_answers_and_contexts)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
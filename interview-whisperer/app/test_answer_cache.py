@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Semantic Answer Cache
+
+Tests lookups with hand-made embeddings:
+- Similar questions hit, dissimilar ones miss, and entries persist to disk
+- A changed index fingerprint invalidates every cached answer
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from answer_cache import SemanticAnswerCache
+
+RESULT = {'answer': "I led the payments team.", 'confidence': 0.85,
+          'sources': ['resume.pdf'], 'context_used': True}
+
+
+def test_similar_question_hits_and_persists():
+    """A near-identical embedding hits, an orthogonal one misses, reload keeps entries."""
+    print("Testing cache hits...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "answer_cache"
+        cache = SemanticAnswerCache(path, threshold=0.9)
+        cache.store("Tell me about yourself", [1.0, 0.0, 0.0], RESULT, "index-a")
+
+        hit = cache.lookup([0.98, 0.1, 0.0], "index-a")
+        assert hit is not None and hit[0]['answer'] == RESULT['answer'], hit
+        assert hit[1] > 0.9
+        assert cache.lookup([0.0, 1.0, 0.0], "index-a") is None
+        assert cache.get_stats()['hit_rate'] == 0.5
+
+        reloaded = SemanticAnswerCache(path, threshold=0.9)
+        assert reloaded.lookup([1.0, 0.0, 0.0], "index-a") is not None
+    print("   ✓ Similar question answered from cache (and after reload)")
+    return True
+
+
+def test_fingerprint_change_invalidates():
+    """Answers generated for another index are dropped as stale."""
+    print("\nTesting invalidation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SemanticAnswerCache(Path(tmp) / "answer_cache")
+        cache.store("Why this company?", [0.0, 1.0], RESULT, "index-a")
+
+        assert cache.lookup([0.0, 1.0], "index-b") is None
+        stats = cache.get_stats()
+        assert stats['entries'] == 0 and stats['invalidations'] == 1, stats
+        assert stats['stale_dropped'] == 1
+    print("   ✓ Stale answers dropped after re-indexing")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Answer Cache Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Hits and Persistence", test_similar_question_hits_and_persists),
+        ("Invalidation", test_fingerprint_change_invalidates)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
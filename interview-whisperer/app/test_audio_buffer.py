@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Audio Buffers
+
+Tests the bounded transcription queue:
+- Each overflow policy keeps the right chunks
+- Coalesced chunks are capped and keep the oldest capture time
+- Age at dequeue is recorded
+"""
+
+import queue
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio_buffer import AudioChunk, AudioChunkQueue
+
+
+def _chunk(value, captured_at=None):
+    """One-sample chunk tagged with ``value``."""
+    return AudioChunk(np.full(1, value, dtype=np.float32), captured_at or time.time())
+
+
+def test_drop_policies():
+    """drop_oldest keeps the newest chunks, drop_newest keeps the first."""
+    print("Testing drop policies...")
+    oldest = AudioChunkQueue(maxsize=2, policy="drop_oldest")
+    newest = AudioChunkQueue(maxsize=2, policy="drop_newest")
+    for value in range(4):
+        oldest.put(_chunk(value))
+        newest.put(_chunk(value))
+
+    assert [oldest.get(0).audio[0] for _ in range(2)] == [2, 3]
+    assert [newest.get(0).audio[0] for _ in range(2)] == [0, 1]
+    assert oldest.dropped_chunks == newest.dropped_chunks == 2
+    print("   ✓ Both policies kept the expected chunks")
+    return True
+
+
+def test_coalesce():
+    """Coalescing merges the backlog into one capped chunk."""
+    print("\nTesting coalesce policy...")
+    chunks = AudioChunkQueue(maxsize=2, policy="coalesce", max_coalesce_samples=2)
+    chunks.put(_chunk(0, captured_at=100.0))
+    chunks.put(_chunk(1, captured_at=101.0))
+    chunks.put(_chunk(2))
+
+    merged = chunks.get(0)
+    assert chunks.qsize() == 0
+    assert list(merged.audio) == [1, 2], merged.audio
+    # Timed from the oldest chunk that survived the trim
+    assert merged.captured_at == 101.0
+    assert chunks.coalesced_chunks == 2 and chunks.trimmed_samples == 1
+
+    # A partly trimmed chunk still dates the merged one
+    chunks = AudioChunkQueue(maxsize=2, policy="coalesce", max_coalesce_samples=4)
+    chunks.put(AudioChunk(np.zeros(2, dtype=np.float32), 100.0))
+    chunks.put(AudioChunk(np.ones(2, dtype=np.float32), 101.0))
+    chunks.put(_chunk(2))
+    merged = chunks.get(0)
+    assert list(merged.audio) == [0, 1, 1, 2] and merged.captured_at == 100.0
+    print("   ✓ Backlog merged, trimmed to the most recent audio")
+    return True
+
+
+def test_age_at_dequeue():
+    """get() records how long a chunk waited and raises Empty on timeout."""
+    print("\nTesting age at dequeue...")
+    chunks = AudioChunkQueue()
+    chunks.put(_chunk(0, captured_at=time.time() - 3.0))
+    chunks.get(0)
+    assert 3.0 <= chunks.last_age < 4.0, chunks.last_age
+
+    try:
+        chunks.get(timeout=0.01)
+        raise AssertionError("expected queue.Empty")
+    except queue.Empty:
+        pass
+    print(f"   ✓ Age {chunks.last_age:.2f}s recorded")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Audio Buffer Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Drop Policies", test_drop_policies),
+        ("Coalesce", test_coalesce),
+        ("Age At Dequeue", test_age_at_dequeue)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Audio Sources
+
+Tests the recorded-audio sources used by offline replay:
+- ArraySource delivers every sample in fixed-size blocks
+- FileSource reads PCM WAV and resamples to the engine rate
+"""
+
+import sys
+import tempfile
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio_sources import ArraySource, FileSource
+
+
+def _collect(source, sample_rate=16000, blocksize=1024):
+    """Run a source as fast as possible and return the delivered samples."""
+    blocks = []
+
+    def callback(indata, frames, time_info, status):
+        assert indata.shape == (blocksize, 1) and frames == blocksize
+        blocks.append(indata[:, 0].copy())
+
+    with source.stream(sample_rate, 1, blocksize, callback):
+        for _ in range(500):
+            if source.finished:
+                break
+            source._done.wait(0.01)
+
+    assert source.finished, "source did not finish"
+    return np.concatenate(blocks)
+
+
+def test_array_source_delivers_all_samples():
+    """Every sample arrives in order; the last block is zero-padded."""
+    print("Testing ArraySource...")
+    audio = np.linspace(-1, 1, 5000, dtype=np.float32)
+    delivered = _collect(ArraySource(audio))
+
+    assert len(delivered) == 5 * 1024
+    assert np.array_equal(delivered[:5000], audio)
+    assert not delivered[5000:].any()
+    print(f"   ✓ {len(audio)} samples delivered in {len(delivered) // 1024} blocks")
+    return True
+
+
+def test_file_source_reads_and_resamples_wav():
+    """A stereo 8 kHz 16-bit WAV is mixed to mono and upsampled to 16 kHz."""
+    print("\nTesting FileSource...")
+    tone = (0.5 * np.sin(2 * np.pi * 440 * np.arange(8000) / 8000)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tone.wav"
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(2)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes((np.repeat(tone[:, None], 2, axis=1) * 32767).astype("<i2").tobytes())
+
+        source = FileSource(path)
+        assert source.sample_rate == 8000 and abs(source.duration - 1.0) < 1e-6
+        delivered = _collect(source)
+
+    assert len(delivered) >= 16000
+    rms = float(np.sqrt(np.mean(delivered[:16000] ** 2)))
+    assert abs(rms - 0.5 / np.sqrt(2)) < 0.01, rms
+    print(f"   ✓ 1.0s WAV resampled to {16000} samples (RMS {rms:.3f})")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Audio Source Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("ArraySource", test_array_source_delivers_all_samples),
+        ("FileSource", test_file_source_reads_and_resamples_wav)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
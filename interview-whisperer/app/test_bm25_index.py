@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the BM25 Index
+
+Tests keyword retrieval on a handful of chunks:
+- Exact technology names rank the right chunk first; updates are incremental
+- The index persists and reciprocal rank fusion merges two rankings
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bm25_index import BM25Index, reciprocal_rank_fusion, tokenize
+
+CHUNKS = {
+    'resume_0': "Led migration of payments services to Kubernetes and Terraform at Stripe.",
+    'resume_1': "Built a C++ pricing engine and a Node.js dashboard for analysts.",
+    'notes_0': "Prioritized the roadmap with RICE scoring and stakeholder interviews.",
+}
+
+
+def test_keyword_ranking_and_updates():
+    """Technology names hit; removed chunks disappear from results."""
+    print("Testing keyword ranking...")
+    assert "c++" in tokenize("Experience with C++?") and "node.js" in tokenize("Node.js.")
+
+    index = BM25Index()
+    index.add(list(CHUNKS), list(CHUNKS.values()), [{'file_name': 'resume.pdf'}] * 3)
+
+    results = index.search("Tell me about your Kubernetes experience", n_results=2)
+    assert results[0]['id'] == 'resume_0', results
+    assert 0.0 < results[0]['coverage'] <= 1.0
+    assert index.search("What have you built in C++?")[0]['id'] == 'resume_1'
+
+    index.remove(['resume_0'])
+    assert all(r['id'] != 'resume_0' for r in index.search("kubernetes"))
+    print("   ✓ Exact keywords ranked first, removals applied")
+    return True
+
+
+def test_persistence_and_fusion():
+    """A new instance loads the index; RRF favours chunks both rankings agree on."""
+    print("\nTesting persistence and fusion...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bm25_index.json"
+        BM25Index(path).add(list(CHUNKS), list(CHUNKS.values()))
+
+        reloaded = BM25Index(path)
+        assert len(reloaded) == 3
+        assert reloaded.search("RICE roadmap")[0]['id'] == 'notes_0'
+
+    fused = reciprocal_rank_fusion([['a', 'b', 'c'], ['b', 'd']])
+    assert fused[0][0] == 'b', fused
+    assert [doc_id for doc_id, _ in fused] == ['b', 'a', 'd', 'c']
+    print("   ✓ Index reloaded, fused ranking correct")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("BM25 Index Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Keyword Ranking", test_keyword_ranking_and_updates),
+        ("Persistence and Fusion", test_persistence_and_fusion)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
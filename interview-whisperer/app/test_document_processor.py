@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Document Processor
+
+Tests the ingestion pipeline with Ollama replaced by a stub:
+- Batched embedding: chunk order, retries with backoff, cancellation
+- Extraction workers: the same stats and errors with one or several
+- Streaming chunking: page by page gives the same chunks as whole text
+- Chunk unit: the unit actually used is recorded and passed to workers
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from docx import Document
+
+import document_processor
+import text_chunker
+from document_processor import DocumentProcessor
+
+
+def _processor(tmp, **kwargs):
+    """DocumentProcessor with its documents and database under tmp."""
+    root = Path(tmp)
+    return DocumentProcessor(str(root / "documents"), str(root / "db" / "chroma"), **kwargs)
+
+
+def _fake_embedding(text):
+    """Deterministic stand-in for an Ollama embedding."""
+    return [float(len(text)), float(sum(map(ord, text)) % 997), 1.0]
+
+
+def test_embedding_batches():
+    """Batches finishing out of order are reassembled in chunk order."""
+    print("Testing batched embedding...")
+    with tempfile.TemporaryDirectory() as tmp:
+        processor = _processor(tmp, embed_batch_size=3, embed_concurrency=4)
+        chunks = [f"chunk {i}" for i in range(20)]
+        requests = []
+
+        def request(batch):
+            requests.append(len(batch))
+            # Later batches answer first
+            time.sleep(0.002 * (20 - int(batch[0].split()[1])))
+            return [_fake_embedding(text) for text in batch]
+
+        processor._request_embeddings = request
+        progress = []
+        embeddings = processor.create_embeddings(chunks, lambda done, total, message: progress.append(done))
+
+        assert embeddings == [_fake_embedding(chunk) for chunk in chunks]
+        assert sorted(requests) == [2] + [3] * 6
+        assert progress == sorted(progress) and progress[-1] == 20
+    print("   ✓ 7 batches of up to 3, results in chunk order")
+    return True
+
+
+def test_embedding_retry_and_cancel():
+    """A failing batch is retried with backoff; one that keeps failing cancels the rest."""
+    print("\nTesting embedding retries...")
+    sleeps = []
+    real_time = document_processor.time
+    # Record backoff delays instead of sleeping
+    document_processor.time = SimpleNamespace(perf_counter=time.perf_counter, sleep=sleeps.append)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            processor = _processor(tmp, embed_batch_size=2, embed_concurrency=2)
+            processor.EMBED_RETRY_DELAY = 0.5
+            chunks = [f"chunk {i}" for i in range(6)]
+            failures = {'chunk 2': 2}
+
+            def flaky(batch):
+                if failures.get(batch[0], 0) > 0:
+                    failures[batch[0]] -= 1
+                    raise ConnectionError("connection refused")
+                return [_fake_embedding(text) for text in batch]
+
+            processor._request_embeddings = flaky
+            assert processor.create_embeddings(chunks) == [_fake_embedding(chunk) for chunk in chunks]
+            assert sleeps == [0.5, 1.0]
+
+            # One batch never succeeds: the call fails and queued batches are never sent
+            processor = _processor(tmp, embed_batch_size=1, embed_concurrency=1)
+            processor.EMBED_ATTEMPTS = 3
+            sent = []
+            never = threading.Event()
+
+            def broken(batch):
+                sent.append(batch[0])
+                if batch[0] == 'chunk 0':
+                    raise ConnectionError("connection refused")
+                # Holds the only worker, so later batches are still queued when the call fails
+                never.wait(0.5)
+                return [_fake_embedding(text) for text in batch]
+
+            processor._request_embeddings = broken
+            assert processor.create_embeddings(chunks) is None
+            # At most the batch the worker picked up before the cancel
+            assert sent[:3] == ['chunk 0'] * 3 and sent[3:] in ([], ['chunk 1'])
+    finally:
+        document_processor.time = real_time
+    print("   ✓ Retried with doubling delays, remaining batches cancelled")
+    return True
+
+
+def _write_documents(documents_dir):
+    """DOCX files (extracted on the pool), plain text, and files that fail."""
+    documents_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(6):
+        doc = Document()
+        for j in range(40):
+            doc.add_paragraph(f"Project {i} milestone {j} shipped on time. The team grew by {j} engineers.")
+        doc.save(documents_dir / f"project_{i}.docx")
+    (documents_dir / "corrupt.docx").write_bytes(b"not a zip archive")
+    (documents_dir / "empty.txt").write_text("")
+    (documents_dir / "notes.md").write_text("Prefers async code reviews. Asks about on-call load.")
+
+
+def _run(tmp, extract_workers):
+    processor = _processor(tmp, chunk_size=50, chunk_overlap=5, extract_workers=extract_workers)
+    processor._request_embeddings = lambda batch: [_fake_embedding(text) for text in batch]
+    _write_documents(processor.documents_dir)
+    progress = []
+    stats = processor.process_all_documents(lambda current, total, message: progress.append(current))
+    return processor, stats, progress
+
+
+def test_extract_workers_same_stats():
+    """Completion order varies with workers; the stats and error order do not."""
+    print("\nTesting extraction workers...")
+    timings = ('embedding_seconds', 'chunks_per_second')
+    results = {}
+    for workers in (1, 3):
+        with tempfile.TemporaryDirectory() as tmp:
+            processor, stats, progress = _run(tmp, workers)
+            assert sorted(set(progress)) == list(range(1, stats['total_files'] + 1))
+            assert len(processor.bm25_index) == processor.vector_index.count() == stats['total_chunks']
+            results[workers] = {k: v for k, v in stats.items() if k not in timings}
+
+    assert results[1] == results[3], (results[1], results[3])
+    assert results[1]['processed_files'] == 7 and results[1]['failed_files'] == 2
+    assert results[1]['errors'] == [
+        "No text extracted from corrupt.docx", "No text extracted from empty.txt"
+    ]
+    print(f"   ✓ {results[1]['total_chunks']} chunks, errors in scan order with 1 and 3 workers")
+    return True
+
+
+def test_streaming_chunks():
+    """iter_chunks over pages matches chunk_text over the joined pages."""
+    print("\nTesting streaming chunks...")
+    with tempfile.TemporaryDirectory() as tmp:
+        processor = _processor(tmp)
+        text = " ".join(f"Sentence {i} covers topic {i % 7}. Really? Yes! It shipped" for i in range(400))
+        # Pages end mid-sentence and mid-word
+        pages = [text[i:i + 997] for i in range(0, len(text), 997)]
+        for chunk_size, overlap in ((10, 0), (40, 8), (120, 20), (1000, 50)):
+            expected = processor.chunk_text("\n".join(pages), chunk_size, overlap)
+            assert list(processor.iter_chunks(pages, chunk_size, overlap)) == expected, chunk_size
+
+        # Text without punctuation is cut so each chunk fits chunk_size with its overlap
+        words = [f"w{i}" for i in range(1000)]
+        pages = [" ".join(words[i:i + 37]) for i in range(0, len(words), 37)]
+        chunks = list(processor.iter_chunks(pages, 100, 10))
+        assert max(len(chunk.split()) for chunk in chunks) == 100
+        chunks = list(processor.iter_chunks(pages, 100, 0))
+        assert [len(chunk.split()) for chunk in chunks] == [100] * 10
+        assert " ".join(chunks).split() == words
+
+        # ... measured in tokens when chunks are sized in tokens
+        processor.chunk_unit = 'tokens'
+        text_chunker._shared['nomic-embed-text'] = lambda word: 2
+        try:
+            chunks = list(processor.iter_chunks(pages, 100, 10))
+        finally:
+            del text_chunker._shared['nomic-embed-text']
+        assert max(2 * len(chunk.split()) for chunk in chunks) == 100
+    print("   ✓ Same chunks as chunk_text, unpunctuated runs cut at chunk_size")
+    return True
+
+
+def test_indexes_written_once_per_document():
+    """A document stored in several batches is added batch by batch but written once."""
+    print("\nTesting batched storage...")
+    with tempfile.TemporaryDirectory() as tmp:
+        processor = _processor(tmp, chunk_size=20, chunk_overlap=0, extract_workers=1)
+        processor.STORE_BATCH_CHUNKS = 4
+        processor._request_embeddings = lambda batch: [_fake_embedding(text) for text in batch]
+        (processor.documents_dir / "resume.txt").write_text(
+            " ".join(f"Led project {i} from design to launch." for i in range(60))
+        )
+
+        adds, writes = [], []
+        vector_index, bm25_index = processor.vector_index, processor.bm25_index
+        add, vector_save, bm25_save = vector_index.add, vector_index._save, bm25_index._save
+        vector_index.add = lambda ids, *args, **kwargs: (adds.append(len(ids)), add(ids, *args, **kwargs))
+        vector_index._save = lambda matrix: (writes.append('vectors'), vector_save(matrix))
+        bm25_index._save = lambda: (writes.append('bm25'), bm25_save())
+        try:
+            stats = processor.process_all_documents()
+        finally:
+            del vector_index.add, vector_index._save, bm25_index._save
+
+        assert stats['total_chunks'] > 3 * processor.STORE_BATCH_CHUNKS
+        assert sum(adds) == stats['total_chunks'] and max(adds) == processor.STORE_BATCH_CHUNKS
+        assert sorted(writes) == ['bm25', 'vectors'], writes
+        assert len(bm25_index) == vector_index.count() == stats['total_chunks']
+        assert len(processor.manifest.get("resume.txt")['chunk_ids']) == stats['total_chunks']
+    print(f"   ✓ {stats['total_chunks']} chunks added in batches of 4, each index written once")
+    return True
+
+
+def test_chunk_unit_fallback():
+    """Without a tokenizer, words are recorded and passed to extraction."""
+    print("\nTesting chunk unit fallback...")
+    units = []
+    spool_chunks = document_processor._spool_chunks
+    document_processor._spool_chunks = lambda *args: (units.append(args[5]), spool_chunks(*args))[1]
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            processor = _processor(tmp, chunk_unit='tokens', extract_workers=1)
+            processor._request_embeddings = lambda batch: [_fake_embedding(text) for text in batch]
+            (processor.documents_dir / "notes.txt").write_text("Prefers async code reviews.")
+
+            text_chunker._shared['nomic-embed-text'] = None  # tokenizer failed to load
+            assert 'chunk_unit' not in processor._index_params()
+            processor.process_all_documents()
+
+            text_chunker._shared['nomic-embed-text'] = lambda word: 2
+            assert processor._index_params()['chunk_unit'] == 'tokens'
+            processor.process_all_documents()
+    finally:
+        document_processor._spool_chunks = spool_chunks
+        text_chunker._shared.pop('nomic-embed-text', None)
+
+    # The tokenizer change re-indexed the file
+    assert units == ['words', 'tokens'], units
+    print("   ✓ Fallback to words recorded in the manifest and passed to workers")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Document Processor Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Embedding Batches", test_embedding_batches),
+        ("Embedding Retry And Cancel", test_embedding_retry_and_cancel),
+        ("Extract Workers Same Stats", test_extract_workers_same_stats),
+        ("Streaming Chunks", test_streaming_chunks),
+        ("Indexes Written Once", test_indexes_written_once_per_document),
+        ("Chunk Unit Fallback", test_chunk_unit_fallback)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
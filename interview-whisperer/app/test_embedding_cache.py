@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Embedding Cache
+
+Tests the two tiers with a counting embedding function:
+- Keys include the model, and embeddings survive a restart via SQLite
+- The memory tier evicts least recently used entries over its byte budget
+- Access times reach disk in batches, not on every hit
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from embedding_cache import EmbeddingCache
+
+
+def _counting_embed(calls):
+    """Embedding function that records its inputs."""
+    def embed(text):
+        calls.append(text)
+        return [float(len(text)), 1.0, 0.5, 0.25]
+    return embed
+
+
+def test_model_keys_and_persistence():
+    """Whitespace is normalized but case and model are part of the key; a new instance reads from disk."""
+    print("Testing keys and persistence...")
+    calls = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "embedding_cache.sqlite3"
+        cache = EmbeddingCache(path)
+        first = cache.get_or_compute("nomic-embed-text", "Tell me about yourself", _counting_embed(calls))
+        cache.get_or_compute("nomic-embed-text", " Tell me  about\nyourself ", _counting_embed(calls))
+        cache.get_or_compute("nomic-embed-text", "tell me about yourself", _counting_embed(calls))
+        cache.get_or_compute("mxbai-embed-large", "Tell me about yourself", _counting_embed(calls))
+        assert len(calls) == 3, calls
+        cache.close()
+
+        reopened = EmbeddingCache(path)
+        assert reopened.get("nomic-embed-text", "Tell me about yourself") == first
+        stats = reopened.get_stats()
+        assert stats['disk_hits'] == 1 and stats['disk_entries'] == 3, stats
+        reopened.close()
+    print("   ✓ Case- and model-specific keys, restored after restart")
+    return True
+
+
+def test_memory_budget_evicts_lru():
+    """Entries beyond the byte budget are evicted oldest-first from memory only."""
+    print("\nTesting memory budget...")
+    with tempfile.TemporaryDirectory() as tmp:
+        # Each 4-float entry costs 16 bytes plus 200 bytes of overhead
+        cache = EmbeddingCache(Path(tmp) / "cache.sqlite3", memory_budget_bytes=500)
+        for text in ("a", "b", "c"):
+            cache.put("m", text, [1.0, 2.0, 3.0, 4.0])
+
+        stats = cache.get_stats()
+        assert stats['memory_entries'] == 2 and stats['evictions'] == 1, stats
+        assert cache.get("m", "a") is not None          # still on disk
+        assert cache.get_stats()['disk_hits'] == 1
+        cache.close()
+    print("   ✓ LRU eviction within budget, disk tier intact")
+    return True
+
+
+def test_access_times_batched():
+    """Hits buffer their access time; it is written on close (or in batches)."""
+    print("\nTesting access time batching...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cache.sqlite3"
+        cache = EmbeddingCache(path)
+        cache.put("m", "a", [1.0, 2.0])
+        cache.close()
+
+        def last_used():
+            with sqlite3.connect(str(path)) as db:
+                return db.execute("SELECT last_used FROM embeddings").fetchone()[0]
+
+        stored = last_used()
+        cache = EmbeddingCache(path)
+        for _ in range(5):
+            assert cache.get("m", "a") == [1.0, 2.0]
+        assert last_used() == stored        # nothing written per hit
+        cache.close()
+        assert last_used() > stored
+    print("   ✓ Access time written once, on close")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Embedding Cache Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Keys and Persistence", test_model_keys_and_persistence),
+        ("Memory Budget", test_memory_budget_evicts_lru),
+        ("Access Times Batched", test_access_times_batched)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Index Manifest
+
+Tests change detection for incremental re-indexing:
+- Unchanged, touched, modified files and changed indexing parameters
+- Removing documents and the chunk IDs they leave behind
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from index_manifest import IndexManifest, file_sha256
+
+PARAMS = {'embed_model': 'nomic-embed-text', 'chunk_size': 500, 'chunk_overlap': 50}
+
+
+def _stat(path):
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime
+
+
+def test_change_detection():
+    """Only new, modified or re-parameterized files need indexing."""
+    print("Testing change detection...")
+    with tempfile.TemporaryDirectory() as tmp:
+        doc = Path(tmp) / "resume.txt"
+        doc.write_text("Led the Kubernetes migration.")
+        manifest = IndexManifest(Path(tmp) / "index_manifest.json")
+
+        unchanged, content_hash = manifest.check("resume.txt", doc, *_stat(doc), PARAMS)
+        assert not unchanged and content_hash == file_sha256(doc)
+        manifest.put("resume.txt", *_stat(doc), content_hash, PARAMS, ["a_chunk_0"])
+        manifest.save()
+
+        # Reloaded from disk: skipped on size and mtime without hashing
+        manifest = IndexManifest(Path(tmp) / "index_manifest.json")
+        assert manifest.check("resume.txt", doc, *_stat(doc), PARAMS) == (True, None)
+
+        # Touched but identical: unchanged (hashed once)
+        size, mtime = _stat(doc)
+        os.utime(doc, (mtime + 10, mtime + 10))
+        assert manifest.check("resume.txt", doc, *_stat(doc), PARAMS) == (True, content_hash)
+        assert manifest.check("resume.txt", doc, *_stat(doc), PARAMS) == (True, None)
+
+        doc.write_text("Led the Kubernetes migration and the on-call rotation.")
+        assert not manifest.check("resume.txt", doc, *_stat(doc), PARAMS)[0]
+
+        other_params = dict(PARAMS, chunk_size=300)
+        assert not manifest.check("resume.txt", doc, *_stat(doc), other_params)[0]
+    print("   ✓ Unchanged skipped, touched skipped, modified and re-parameterized re-indexed")
+    return True
+
+
+def test_remove_and_chunk_ids():
+    """Removed documents return their chunk IDs; unreadable manifests are ignored."""
+    print("\nTesting removal...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "index_manifest.json"
+        manifest = IndexManifest(path)
+        manifest.put("a.txt", 10, 1.0, "h1", PARAMS, ["a_chunk_0", "a_chunk_1"])
+        manifest.put("b.txt", 20, 2.0, "h2", PARAMS, ["b_chunk_0"])
+        assert manifest.chunk_ids() == {"a_chunk_0", "a_chunk_1", "b_chunk_0"}
+
+        assert manifest.remove("a.txt") == ["a_chunk_0", "a_chunk_1"]
+        assert manifest.remove("a.txt") == []
+        manifest.save()
+        assert IndexManifest(path).keys() == ["b.txt"]
+
+        path.write_text("{not json")
+        assert len(IndexManifest(path)) == 0
+    print("   ✓ Chunk IDs returned, corrupt manifest means re-index everything")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Index Manifest Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Change Detection", test_change_detection),
+        ("Removal and Chunk IDs", test_remove_and_chunk_ids)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
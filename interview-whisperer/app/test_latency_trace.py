@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Latency Tracing
+
+Tests per-question traces and rolling percentiles:
+- Hops are measured from the closest earlier marked stage
+- Percentiles and SLO misses are summarized per stage
+"""
+
+import sys
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from latency_trace import LatencyStats, LatencyTrace
+
+
+def test_trace_durations_skip_missing_stages():
+    """Unmarked stages are skipped; hops span the gap."""
+    print("Testing trace durations...")
+    trace = LatencyTrace()
+    trace.mark('audio_captured', 100.0)
+    trace.mark('whisper_end', 100.8)
+    trace.mark('question_detected', 100.9)
+    trace.mark('last_token', 102.4)
+
+    hops = trace.durations()
+    assert set(hops) == {'whisper_end', 'question_detected', 'last_token'}, hops
+    assert abs(hops['whisper_end'] - 0.8) < 1e-9
+    assert abs(trace.total - 2.4) < 1e-9
+
+    try:
+        trace.mark('not_a_stage')
+        raise AssertionError("expected ValueError")
+    except ValueError:
+        pass
+    print(f"   ✓ {len(hops)} hops, total {trace.total:.1f}s")
+    return True
+
+
+def test_stats_percentiles_and_slo():
+    """Percentiles are reported per stage and slow traces count as SLO misses."""
+    print("\nTesting latency statistics...")
+    stats = LatencyStats(slo_seconds=3.0)
+    for i in range(100):
+        trace = LatencyTrace()
+        trace.mark('question_detected', 0.0)
+        trace.mark('overlay_rendered', 0.05 * (i + 1))  # 0.05s .. 5.0s
+        stats.add(trace)
+
+    summary = stats.summary()
+    assert summary['count'] == 100
+    assert summary['slo_misses'] == 40, summary['slo_misses']
+    assert abs(summary['total']['p50'] - 2.525) < 0.01, summary['total']
+    assert summary['overlay_rendered']['p99'] <= 5.0
+    assert 'first_token' not in summary
+    print(f"   ✓ p50/p95/p99 = {summary['total']}")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Latency Trace Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Trace Durations", test_trace_durations_skip_missing_stages),
+        ("Stats Percentiles", test_stats_percentiles_and_slo)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ Tests the LLM Engine functionality including:
 - Context retrieval
 - Answer generation
 - Confidence scoring
+- Fusion of vector and keyword scores
 """
 
 import sys
@@ -61,6 +62,12 @@ def test_class_structure():
             'retrieve_context',
             'generate_answer',
             'stream_answer',
+            'aretrieve_context',
+            'agenerate_answer',
+            'astream_answer',
+            'acascade_answer',
+            'submit_answer',
+            'cancel_in_flight',
             'get_confidence_score',
             'clear_cache',
             'get_stats'
@@ -107,6 +114,37 @@ def test_confidence_scoring_logic():
         print(f"   ✗ Unexpected error: {e}")
         return False
 
+def test_fused_scores():
+    """Keyword coverage is kept out of the similarity score and confidence."""
+    print("\nTesting fused retrieval scores...")
+    try:
+        from llm_engine import LLMEngine
+
+        engine = LLMEngine.__new__(LLMEngine)
+        dense = [{'id': 'a', 'text': 'A', 'metadata': {'source': 'resume.pdf'}, 'score': 0.4}]
+        keyword = [
+            {'id': 'b', 'text': 'B', 'metadata': {'source': 'notes.md'}, 'coverage': 1.0, 'bm25': 3.2},
+            {'id': 'a', 'text': 'A', 'metadata': {'source': 'resume.pdf'}, 'coverage': 0.5, 'bm25': 1.1}
+        ]
+        chunks = {c['text']: c for c in engine._fuse_rankings(dense, keyword, 2)}
+        assert (chunks['A']['score'], chunks['A']['coverage']) == (0.4, 0.5)
+        assert (chunks['B']['score'], chunks['B']['coverage']) == (0.0, 1.0)
+
+        # A one-term keyword match does not make an answer look well grounded
+        answer = "I led the migration to the new billing platform and cut costs in half over two quarters."
+        keyword_only = engine._fuse_rankings([], keyword, 2)
+        assert engine.get_confidence_score("billing?", answer, keyword_only) == 0.25
+        assert engine.get_confidence_score("billing?", answer, list(chunks.values())) == 0.45
+        print("   ✓ Similarity and coverage reported separately")
+
+        return True
+    except AssertionError as e:
+        print(f"   ✗ {e}")
+        return False
+    except Exception as e:
+        print(f"   ✗ Unexpected error: {e}")
+        return False
+
 def test_context_formatting():
     """Test that context formatting works correctly."""
     print("\nTesting context formatting...")
@@ -122,6 +160,45 @@ def test_context_formatting():
         print(f"   ✗ Error: {e}")
         return False
 
+def test_generation_handle_cancel():
+    """Test that cancelling a handle stops its coroutine on the event loop."""
+    print("\nTesting generation cancel handles...")
+    try:
+        import asyncio
+        import threading
+        from concurrent.futures import CancelledError
+        from llm_engine import GenerationHandle
+
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        stopped = threading.Event()
+
+        async def generate():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                stopped.set()
+
+        handle = GenerationHandle(asyncio.run_coroutine_threadsafe(generate(), loop), "question")
+        assert not handle.done()
+        assert handle.cancel()
+        assert stopped.wait(1.0), "coroutine kept running after cancel"
+        try:
+            handle.result(timeout=1.0)
+            raise AssertionError("result() should raise CancelledError")
+        except CancelledError:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        print("   ✓ Cancelled coroutine stopped at its next await")
+
+        return True
+    except AssertionError as e:
+        print(f"   ✗ {e}")
+        return False
+    except Exception as e:
+        print(f"   ✗ Unexpected error: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -133,7 +210,9 @@ def main():
         ("Prompt Templates", test_prompt_templates),
         ("Class Structure", test_class_structure),
         ("Confidence Scoring", test_confidence_scoring_logic),
-        ("Context Formatting", test_context_formatting)
+        ("Fused Scores", test_fused_scores),
+        ("Context Formatting", test_context_formatting),
+        ("Generation Cancel Handles", test_generation_handle_cancel)
     ]
 
     results = []
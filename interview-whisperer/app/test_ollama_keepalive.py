@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Ollama Keep-Alive
+
+Tests the session lifecycle against a fake Ollama client:
+- Warm-up loads both models, heartbeats refresh them, stop unloads them
+- A failed warm-up is reported without stopping the heartbeats
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from ollama_keepalive import OllamaKeepAlive
+
+
+class FakeOllama:
+    """Records (call, model, keep_alive) for generate/embeddings."""
+
+    def __init__(self, fail_first=0):
+        self.calls = []
+        self.fail_first = fail_first
+        self._lock = threading.Lock()
+
+    def _record(self, kind, model, keep_alive):
+        with self._lock:
+            self.calls.append((kind, model, keep_alive))
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise ConnectionError("ollama not running")
+
+    def generate(self, model, prompt, options=None, keep_alive=None):
+        self._record('generate', model, keep_alive)
+        return {'response': ''}
+
+    def embeddings(self, model, prompt, keep_alive=None):
+        self._record('embeddings', model, keep_alive)
+        return {'embedding': [0.0]}
+
+
+def test_warm_up_heartbeat_and_release():
+    """Both models load at start, stay alive, and are unloaded with keep_alive=0."""
+    print("Testing warm-up, heartbeats and release...")
+    client = FakeOllama()
+    keepalive = OllamaKeepAlive("llm", "embed", keep_alive="10m", heartbeat_interval=0.05, client=client)
+
+    keepalive.start()
+    assert keepalive.wait_until_warm(timeout=2.0)
+    time.sleep(0.2)
+    keepalive.stop()
+
+    assert client.calls[:2] == [('generate', 'llm', '10m'), ('embeddings', 'embed', '10m')], client.calls
+    assert client.calls[-2:] == [('generate', 'llm', 0), ('embeddings', 'embed', 0)], client.calls
+
+    stats = keepalive.get_stats()
+    assert stats['heartbeats'] >= 1 and not stats['running'] and not stats['warm'], stats
+    assert set(stats['warm_up_seconds']) == {'llm', 'embed'}
+    print(f"   ✓ Warmed, {stats['heartbeats']} heartbeats, released")
+    return True
+
+
+def test_failed_warm_up_recovers():
+    """Warm-up errors are recorded; the next successful heartbeat marks the models warm."""
+    print("\nTesting failed warm-up...")
+    client = FakeOllama(fail_first=1)
+    keepalive = OllamaKeepAlive("llm", "embed", heartbeat_interval=0.05, client=client)
+
+    keepalive.start()
+    assert keepalive.wait_until_warm(timeout=2.0)
+    keepalive.stop(release=False)
+
+    stats = keepalive.get_stats()
+    assert stats['warm_up_error'] == "ollama not running", stats
+    assert stats['warm_up_seconds'] == {} and stats['warm'], stats
+    assert all(keep_alive != 0 for _, _, keep_alive in client.calls)
+    print("   ✓ Error reported, recovered by heartbeat, not released")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Ollama Keep-Alive Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Warm-up, Heartbeats and Release", test_warm_up_heartbeat_and_release),
+        ("Failed Warm-up", test_failed_warm_up_recovers)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
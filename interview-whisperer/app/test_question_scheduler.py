@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Question Scheduler
+
+Tests latest-question-wins scheduling with a controllable fake handler:
+- A newer question preempts the running one and its cancel callbacks run
+- Questions waiting behind a running one are dropped when replaced
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from question_scheduler import QuestionScheduler
+
+
+class BlockingHandler:
+    """Handler that records jobs and blocks until released or cancelled."""
+
+    def __init__(self):
+        self.started = []
+        self.finished = []
+        self.release = threading.Event()
+        self.running = threading.Semaphore(0)
+        self.done = threading.Semaphore(0)
+
+    def __call__(self, job):
+        self.started.append(job.question)
+        self.running.release()
+        while not job.is_cancelled and not self.release.wait(0.01):
+            pass
+        if not job.is_cancelled:
+            self.finished.append(job.question)
+            self.done.release()
+
+
+def test_newer_question_preempts_running():
+    """The running question is cancelled, its callback fires, the new one completes."""
+    print("Testing preemption...")
+    handler = BlockingHandler()
+    scheduler = QuestionScheduler(handler)
+    stopped = []
+
+    first = scheduler.submit("Tell me about yourself?")
+    assert handler.running.acquire(timeout=2.0)
+    first.add_cancel_callback(lambda: stopped.append("first"))
+
+    scheduler.submit("Why do you want this job?")
+    assert first.is_cancelled and stopped == ["first"]
+    assert handler.running.acquire(timeout=2.0)
+    handler.release.set()
+    assert handler.done.acquire(timeout=2.0)
+    scheduler.shutdown()
+
+    assert handler.finished == ["Why do you want this job?"], handler.finished
+    stats = scheduler.get_stats()
+    assert stats['preempted'] == 1 and stats['dropped'] == 0 and stats['completed'] == 1, stats
+    print("   ✓ Older question cancelled, only the newest answered")
+    return True
+
+
+def test_waiting_questions_are_dropped():
+    """Only the latest of several queued questions runs."""
+    print("\nTesting dropped questions...")
+    handler = BlockingHandler()
+    scheduler = QuestionScheduler(handler)
+
+    scheduler.submit("First question?")
+    assert handler.running.acquire(timeout=2.0)
+    second = scheduler.submit("Second question?")
+    scheduler.submit("Third question?")
+    assert second.is_cancelled
+
+    assert handler.running.acquire(timeout=2.0)
+    handler.release.set()
+    assert handler.done.acquire(timeout=2.0)
+    scheduler.shutdown()
+
+    assert handler.started == ["First question?", "Third question?"], handler.started
+    stats = scheduler.get_stats()
+    assert stats['dropped'] == 1 and stats['preempted'] == 1 and stats['submitted'] == 3, stats
+    print("   ✓ Replaced question never started")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Question Scheduler Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Preemption", test_newer_question_preempts_running),
+        ("Dropped Questions", test_waiting_questions_are_dropped)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Speculative Retrieval
+
+Tests the prefetch cache with a fake retrieval function:
+- A confirmed question reuses context prefetched from a near-identical partial
+- Unrelated questions miss, and short spans are not prefetched
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from speculative_retrieval import SpeculativeRetriever
+
+
+def _fake_retrieve(calls):
+    """Retrieval function that records its inputs."""
+    def retrieve(text):
+        calls.append(text)
+        return [{'text': f"context for {text}", 'source': 'resume.pdf', 'score': 0.9}]
+    return retrieve
+
+
+def test_partial_prefetch_is_reused():
+    """The final question hits the span prefetched from its partial."""
+    print("Testing prefetch reuse...")
+    calls = []
+    retriever = SpeculativeRetriever(_fake_retrieve(calls))
+
+    assert retriever.prefetch("Tell me about a time you led a team")
+    context = retriever.get("Tell me about a time you led the team?", timeout=2.0)
+
+    assert context is not None and context[0]['source'] == 'resume.pdf'
+    assert calls == ["tell me about a time you led a team"], calls
+    assert retriever.get_stats()['hits'] == 1
+    retriever.shutdown()
+    print("   ✓ Context reused without a second retrieval")
+    return True
+
+
+def test_misses_and_short_spans():
+    """Unrelated questions miss; spans under min_words are ignored."""
+    print("\nTesting misses...")
+    calls = []
+    retriever = SpeculativeRetriever(_fake_retrieve(calls))
+
+    assert not retriever.prefetch("so")
+    retriever.prefetch("what are your salary expectations")
+    assert retriever.get("why do you want to work here", timeout=2.0) is None
+    assert retriever.get_stats()['misses'] == 1
+    retriever.shutdown()
+    print("   ✓ Unrelated question missed")
+    return True
+
+
+def test_newer_partial_supersedes_pending():
+    """A prefetch still waiting for the worker is cancelled by a newer one."""
+    print("\nTesting supersession...")
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_retrieve(text):
+        started.set()
+        release.wait(2.0)
+        calls.append(text)
+        return []
+
+    retriever = SpeculativeRetriever(slow_retrieve)
+    retriever.prefetch("what is your greatest")           # running
+    started.wait(2.0)
+    retriever.prefetch("what is your greatest strength")  # pending
+    retriever.prefetch("what is your greatest strength and weakness")
+    release.set()
+
+    assert retriever.get("what is your greatest strength and weakness", timeout=2.0) == []
+    assert retriever.superseded == 1, retriever.superseded
+    assert "what is your greatest strength" not in calls
+    retriever.shutdown()
+    print("   ✓ Stale partial skipped")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Speculative Retrieval Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Prefetch Reuse", test_partial_prefetch_is_reused),
+        ("Misses", test_misses_and_short_spans),
+        ("Supersession", test_newer_partial_supersedes_pending)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
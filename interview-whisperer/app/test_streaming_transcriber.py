@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Streaming Transcriber
+
+Tests the local-agreement commit logic with a fake decoder:
+- Words are committed only after two hypotheses agree
+- No words are duplicated or lost across window trims
+- Flush commits pending words
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from streaming_transcriber import StreamingTranscriber
+
+SAMPLE_RATE = 100  # Low rate keeps the fake audio tiny
+
+
+def _make_streamer(words, word_duration=0.5, window_duration=5.0):
+    """
+    Build a streamer over a fake decoder that "hears" ``words`` spoken back
+    to back and garbles the last word before the end of the window.
+    """
+    def fake_transcribe(audio, prompt):
+        base = streamer._offset
+        end_of_audio = base + len(audio) / SAMPLE_RATE
+        result = []
+        for i, word in enumerate(words):
+            start, end = i * word_duration, i * word_duration + 0.4
+            if start >= base - 0.01 and end <= end_of_audio:
+                text = word if end <= end_of_audio - 0.6 else word + "_"
+                result.append((start - base, end - base, text))
+        return result
+
+    streamer = StreamingTranscriber(fake_transcribe, SAMPLE_RATE, window_duration)
+    return streamer
+
+
+def test_agreement_commits_prefix():
+    """A word is committed only once two consecutive decodes agree on it."""
+    print("Testing agreement commit...")
+    streamer = _make_streamer(["tell", "me", "about", "yourself"])
+
+    committed, tentative = streamer.push(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    assert committed == [], committed
+    assert tentative, "expected a tentative hypothesis"
+
+    committed, _ = streamer.push(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    assert committed == ["tell"], committed
+    print("   ✓ First word committed on second agreeing decode")
+    return True
+
+
+def test_no_duplicates_or_losses():
+    """Words survive window trimming exactly once and in order."""
+    print("\nTesting long stream with window trimming...")
+    words = [f"word{i}" for i in range(60)]
+    streamer = _make_streamer(words, window_duration=5.0)
+
+    output = []
+    for _ in range(31):
+        committed, _ = streamer.push(np.zeros(SAMPLE_RATE, dtype=np.float32))
+        output.extend(committed)
+    output.extend(streamer.flush())
+
+    assert [w.rstrip("_") for w in output] == words, output
+    assert streamer.window_seconds <= 5.0
+    print(f"   ✓ {len(output)} words, no duplicates or gaps")
+    return True
+
+
+def test_flush_commits_pending():
+    """Flush returns the tentative tail and leaves nothing pending."""
+    print("\nTesting flush...")
+    streamer = _make_streamer(["why", "this", "role"])
+    streamer.push(np.zeros(SAMPLE_RATE, dtype=np.float32))
+
+    flushed = streamer.flush()
+    assert flushed, "expected pending words to be flushed"
+    assert not streamer.has_pending
+    print(f"   ✓ Flushed {flushed}")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Streaming Transcriber Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Agreement Commit", test_agreement_commits_prefix),
+        ("No Duplicates Or Losses", test_no_duplicates_or_losses),
+        ("Flush", test_flush_commits_pending)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Text Chunker
+
+Tests sentence chunking with overlap:
+- Word-sized chunks, overlap and sentence boundaries
+- Token-sized chunks under a hard size limit (context window)
+"""
+
+import sys
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from text_chunker import TextChunker, embed_context_tokens
+
+SENTENCES = [
+    "Led the Kubernetes migration for three regions.",
+    "Cut p99 latency by forty percent.",
+    "Ran the on-call rotation.",
+    "Mentored two engineers through their first launches.",
+    "Presented the roadmap to stakeholders every quarter."
+]
+
+
+def test_word_chunks():
+    """Chunks end on sentences and repeat the last `overlap` words."""
+    print("Testing word-sized chunks...")
+    chunks = list(TextChunker(chunk_size=13, overlap=3).chunk_sentences(SENTENCES))
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.endswith('.')
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.split()[:3] == previous.split()[-3:]
+    assert chunks[0] == ' '.join(SENTENCES[:2])
+
+    # No overlap: every word exactly once
+    chunks = list(TextChunker(chunk_size=12, overlap=0).chunk_sentences(SENTENCES))
+    assert ' '.join(chunks).split() == ' '.join(SENTENCES).split()
+
+    # One sentence longer than chunk_size is kept whole without a hard limit
+    long_sentence = ' '.join(['word'] * 30) + '.'
+    assert list(TextChunker(chunk_size=10, overlap=2).chunk_sentences([long_sentence])) == [long_sentence]
+    assert list(TextChunker(chunk_size=10, overlap=2).chunk_sentences([])) == []
+    print("   ✓ Sentence boundaries, word overlap, no duplication without overlap")
+    return True
+
+
+def test_token_sizing():
+    """Token-sized chunks never exceed max_size; long sentences are cut at words."""
+    print("\nTesting token-sized chunks...")
+
+    def count_tokens(word):
+        # Stand-in tokenizer: one token per 4 characters
+        return len(word) // 4 + 1
+
+    chunker = TextChunker(chunk_size=40, overlap=8, count_tokens=count_tokens, max_size=30)
+    assert chunker.chunk_size == 30 and chunker.unit == 'tokens'
+
+    sentences = SENTENCES + [' '.join(f"service{i}" for i in range(40)) + '.']
+    chunks = list(chunker.chunk_sentences(sentences))
+    assert all(chunker.size(chunk) <= 30 for chunk in chunks)
+    assert all(f"service{i}" in ' '.join(chunks) for i in range(40))
+
+    # Overlap is measured in tokens and taken in whole words
+    for previous, chunk in zip(chunks, chunks[1:]):
+        words, previous_words = chunk.split(), previous.split()
+        shared = max(k for k in range(len(words) + 1) if k == 0 or previous_words[-k:] == words[:k])
+        assert chunker.size(' '.join(words[:shared])) <= 8
+
+    assert embed_context_tokens("nomic-embed-text:latest") == embed_context_tokens("nomic-embed-text")
+    assert embed_context_tokens("unknown-model") is None
+    print("   ✓ Capped at max_size, long sentences split, token overlap")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Text Chunker Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Word Chunks", test_word_chunks),
+        ("Token Sizing", test_token_sizing)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Transcription Pool
+
+Tests the reorder stage that keeps parallel results in capture order,
+and submission through a stub executor (no worker processes).
+"""
+
+import random
+import sys
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from transcription_pool import ReorderBuffer, TranscriptionPool
+
+
+class StubExecutor:
+    """Hands out futures the test completes; raises once broken."""
+
+    def __init__(self):
+        self.futures = []
+        self.broken = False
+
+    def submit(self, fn, *args):
+        if self.broken:
+            raise BrokenProcessPool("A child process terminated abruptly")
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _stub_pool(released):
+    """TranscriptionPool whose worker processes are replaced by a StubExecutor."""
+    pool = TranscriptionPool("tiny", on_result=lambda chunk, text, busy: released.append(text),
+                             workers=2, max_in_flight=4)
+    pool._executor.shutdown(wait=False)
+    pool._executor = StubExecutor()
+    return pool
+
+
+def _chunk():
+    return SimpleNamespace(audio=np.zeros(16000, dtype=np.float32))
+
+
+def test_out_of_order_results_released_in_order():
+    """Results finishing in any order are emitted in sequence order."""
+    print("Testing reorder buffer...")
+    released = []
+    reorder = ReorderBuffer(released.append)
+
+    sequences = [reorder.next_sequence() for _ in range(50)]
+    shuffled = sequences[:]
+    random.Random(7).shuffle(shuffled)
+
+    for seq in shuffled:
+        reorder.put(seq, f"chunk{seq}")
+        # Everything released so far is a gap-free prefix
+        assert released == [f"chunk{i}" for i in range(len(released))], released
+
+    assert released == [f"chunk{i}" for i in sequences]
+    assert reorder.waiting == 0
+    print(f"   ✓ {len(released)} results released in capture order")
+    return True
+
+
+def test_holds_results_behind_gap():
+    """A missing earlier result holds back everything after it."""
+    print("\nTesting gap handling...")
+    released = []
+    reorder = ReorderBuffer(released.append)
+    first, second, third = (reorder.next_sequence() for _ in range(3))
+
+    reorder.put(third, "c")
+    reorder.put(second, "b")
+    assert released == [] and reorder.waiting == 2
+
+    reorder.put(first, "a")
+    assert released == ["a", "b", "c"]
+    print("   ✓ Results held until the gap was filled")
+    return True
+
+
+def test_submit_delivers_in_order():
+    """Worker results finishing out of order reach on_result in submission order."""
+    print("\nTesting submit through a stub executor...")
+    released = []
+    pool = _stub_pool(released)
+    executor = pool._executor
+
+    for _ in range(4):
+        assert pool.submit(_chunk(), timeout=0.1)
+    # Every in-flight slot is taken: submit pushes back
+    assert not pool.submit(_chunk(), timeout=0.05)
+
+    executor.futures[2].set_result(("third", 101, 0.2))
+    executor.futures[1].set_exception(RuntimeError("decode failed"))
+    assert released == []
+    executor.futures[0].set_result(("first", 100, 0.2))
+    assert released == ["first", "", "third"]
+    executor.futures[3].set_result(("fourth", 100, 0.2))
+
+    assert pool.wait_until_drained(timeout=1.0)
+    assert released == ["first", "", "third", "fourth"]
+    stats = pool.get_stats()
+    assert stats['failures'] == 1 and stats['per_worker'][100]['chunks'] == 2
+    print("   ✓ Results in order, failed chunk released empty, back-pressure applied")
+    return True
+
+
+def test_broken_pool_raises_without_stalling():
+    """A broken executor raises from submit but never blocks later results."""
+    print("\nTesting broken pool...")
+    released = []
+    pool = _stub_pool(released)
+    executor = pool._executor
+
+    assert pool.submit(_chunk(), timeout=0.1)
+    executor.broken = True
+    try:
+        pool.submit(_chunk(), timeout=0.1)
+        raise AssertionError("submit should raise on a broken pool")
+    except BrokenProcessPool:
+        pass
+
+    # The in-flight slot came back and the failed chunk holds nothing up
+    executor.futures[0].set_exception(BrokenProcessPool("worker died"))
+    assert pool.wait_until_drained(timeout=1.0)
+    assert released == ["", ""]
+    assert pool._in_flight.acquire(timeout=0.1)
+    print("   ✓ BrokenProcessPool surfaced, results drained")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Transcription Pool Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Out Of Order Release", test_out_of_order_results_released_in_order),
+        ("Gap Handling", test_holds_results_behind_gap),
+        ("Submit Order", test_submit_delivers_in_order),
+        ("Broken Pool", test_broken_pool_raises_without_stalling)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
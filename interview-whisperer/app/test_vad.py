@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the VAD segmenter
+
+Tests voice activity detection on synthetic audio:
+- Tones are speech, broadband noise and near-silence are not
+- One utterance is emitted per pause, with short gaps bridged
+- Utterances force-cut at the maximum length are not endpoints
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from vad import VADSegmenter
+
+SAMPLE_RATE = 16000
+RNG = np.random.default_rng(0)
+
+
+def _voiced(seconds):
+    """Harmonic tone standing in for voiced speech."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.1 * np.sin(2 * np.pi * 150 * t) + 0.05 * np.sin(2 * np.pi * 300 * t)).astype(np.float32)
+
+
+def _noise(seconds, level):
+    """White noise at the given amplitude."""
+    return (level * RNG.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+def test_speech_detection():
+    """Voiced audio is speech; hiss and room tone are not."""
+    print("Testing frame classification...")
+    vad = VADSegmenter(SAMPLE_RATE)
+
+    assert vad.contains_speech(_voiced(1.0))
+    assert not vad.contains_speech(_noise(1.0, 0.05))
+    assert not vad.contains_speech(_noise(1.0, 0.001))
+    print("   ✓ Speech, noise and silence classified")
+    return True
+
+
+def test_endpointing():
+    """Short pauses stay inside an utterance; long pauses end it."""
+    print("\nTesting endpointing...")
+    vad = VADSegmenter(SAMPLE_RATE, silence_duration=1.5)
+    signal = np.concatenate([
+        _noise(1.0, 0.001),
+        _voiced(2.0), _noise(0.5, 0.001), _voiced(1.0),  # one utterance
+        _noise(2.0, 0.001),
+        _noise(2.0, 0.05),                                # hiss only
+        _noise(2.0, 0.001),
+        _voiced(1.5),                                     # second utterance
+        _noise(2.0, 0.001)
+    ])
+
+    utterances = []
+    for start in range(0, len(signal), 1600):
+        utterances.extend(vad.process(signal[start:start + 1600]))
+    utterances.extend(vad.flush())
+
+    durations = [len(u) / SAMPLE_RATE for u, _ in utterances]
+    assert len(durations) == 2, durations
+    assert 3.5 <= durations[0] <= 4.5, durations
+    assert 1.5 <= durations[1] <= 2.5, durations
+    assert all(endpointed for _, endpointed in utterances)
+    print(f"   ✓ Utterances: {[round(d, 2) for d in durations]}s")
+    return True
+
+
+def test_forced_cut():
+    """Speech longer than the maximum is cut, and the cut is not an endpoint."""
+    print("\nTesting forced cuts...")
+    vad = VADSegmenter(SAMPLE_RATE, silence_duration=1.0, max_utterance_duration=4.0)
+    signal = np.concatenate([_voiced(6.0), _noise(1.5, 0.001)])
+
+    utterances = []
+    for start in range(0, len(signal), 1600):
+        utterances.extend(vad.process(signal[start:start + 1600]))
+    utterances.extend(vad.flush())
+
+    assert [endpointed for _, endpointed in utterances] == [False, True], utterances
+    assert vad.forced_cuts == 1
+    assert len(utterances[0][0]) / SAMPLE_RATE == 4.0
+    print("   ✓ Cut at 4.0s marked as not endpointed, the rest ends on silence")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("VAD Segmenter Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Speech Detection", test_speech_detection),
+        ("Endpointing", test_endpointing),
+        ("Forced Cut", test_forced_cut)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
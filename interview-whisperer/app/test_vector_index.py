@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Vector Index
+
+Tests the memory-mapped NumPy index on small random embeddings:
+- Queries return the nearest chunks in order; upserts and deletes apply
+- The index persists, reloads after another instance writes, and float16 matches float32
+- Batches added with save=False are written once, on flush()
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from vector_index import NumpyVectorIndex
+
+
+def _embeddings(count, dim=32, seed=0):
+    return np.random.default_rng(seed).standard_normal((count, dim)).astype(np.float32)
+
+
+def test_query_upsert_and_delete():
+    """Nearest chunk ranks first; replaced and deleted chunks are reflected."""
+    print("Testing query, upsert and delete...")
+    vectors = _embeddings(50)
+    ids = [f"doc_{i}" for i in range(50)]
+    with tempfile.TemporaryDirectory() as tmp:
+        index = NumpyVectorIndex(Path(tmp) / "vector_index")
+        index.add(ids, vectors, [f"text {i}" for i in range(50)], [{'chunk_index': i} for i in range(50)])
+
+        results = index.query(vectors[7] * 3.0, n_results=3)
+        assert [r['id'] for r in results][0] == 'doc_7', results
+        assert abs(results[0]['score'] - 1.0) < 1e-5
+        assert results[0]['score'] >= results[1]['score'] >= results[2]['score']
+
+        index.add(['doc_7'], [vectors[8]], ["replaced"])
+        assert index.count() == 50
+        top = index.query(vectors[8], n_results=2)
+        assert {r['id'] for r in top} == {'doc_7', 'doc_8'}, top
+
+        index.delete(['doc_7', 'missing'])
+        assert index.count() == 49
+        assert all(r['id'] != 'doc_7' for r in index.query(vectors[8], n_results=5))
+    print("   ✓ Top-k ordered, upsert and delete applied")
+    return True
+
+
+def test_persistence_and_float16():
+    """A second instance sees writes; float16 storage halves memory, same ranking."""
+    print("\nTesting persistence and float16...")
+    vectors = _embeddings(20, seed=1)
+    ids = [f"doc_{i}" for i in range(20)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "vector_index"
+        writer = NumpyVectorIndex(path)
+        reader = NumpyVectorIndex(path)
+        writer.add(ids, vectors, [""] * 20)
+        assert reader.query(vectors[3], n_results=1)[0]['id'] == 'doc_3'
+
+        half = NumpyVectorIndex(Path(tmp) / "half", dtype="float16")
+        half.add(ids, vectors, [""] * 20)
+        assert half.get_stats()['matrix_bytes'] * 2 == writer.get_stats()['matrix_bytes']
+        for i in range(20):
+            assert half.query(vectors[i], n_results=1)[0]['id'] == f"doc_{i}"
+
+        writer.clear()
+        assert NumpyVectorIndex(path).count() == 0
+    print("   ✓ Reloaded across instances, float16 ranking matches")
+    return True
+
+
+def test_staged_adds_flush_once():
+    """Staged batches are invisible until flush(), which applies them in order."""
+    print("\nTesting staged adds...")
+    vectors = _embeddings(12, seed=2)
+    ids = [f"doc_{i}" for i in range(12)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "vector_index"
+        index = NumpyVectorIndex(path)
+        index.add(ids[:4], vectors[:4], ["old"] * 4)
+        for start in range(0, 12, 4):
+            index.add(ids[start:start + 4], vectors[start:start + 4], [f"new {start}"] * 4, save=False)
+        index.add(['doc_5'], [vectors[0]], ["last"], save=False)
+        index.delete(['doc_11'])
+        assert index.count() == 4                     # nothing staged is visible yet
+
+        index.flush()
+        reloaded = NumpyVectorIndex(path)
+        assert reloaded.count() == 11
+        assert reloaded.query(vectors[2], n_results=1)[0]['text'] == "new 0"
+        assert {r['id'] for r in reloaded.query(vectors[0], n_results=2)} == {'doc_0', 'doc_5'}
+    print("   ✓ One write on flush, later batches win, staged deletes applied")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Vector Index Unit Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Query, Upsert and Delete", test_query_upsert_and_delete),
+        ("Persistence and Float16", test_persistence_and_float16),
+        ("Staged Adds", test_staged_adds_flush_once)
+    ]
+
+    results = []
+    for name, test_func in tests:
+        try:
+            passed = test_func()
+            results.append((name, passed))
+        except Exception as e:
+            print(f"\n✗ Test '{name}' crashed: {e}")
+            results.append((name, False))
+
+    # Summary
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,308 @@
+"""
+Text Chunker for Interview Whisperer
+
+Groups sentences into overlapping chunks for embedding. Sizes are counted
+in words by default, or in tokens of the embedding model's own tokenizer
+(optional `tokenizers` package), so a chunk is measured the way the model
+sees it and can be kept inside its context window.
+
+Chunking is a single pass: the sentences of the current chunk are kept with
+their sizes in a deque, and the overlap for the next chunk is what is left
+after dropping whole sentences, then leading words, from the front. Only
+the one sentence the overlap starts in is ever split again. Chunks always end on a sentence
+boundary unless one sentence alone exceeds the hard size limit.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+UNITS = ('words', 'tokens')
+
+# Context window (tokens) of common Ollama embedding models
+EMBED_CONTEXT_TOKENS = {
+    'nomic-embed-text': 2048,
+    'mxbai-embed-large': 512,
+    'all-minilm': 256,
+    'snowflake-arctic-embed': 512,
+    'bge-m3': 8192,
+}
+
+# Hugging Face tokenizer of each model (same vocabulary Ollama runs)
+EMBED_TOKENIZERS = {
+    'nomic-embed-text': 'nomic-ai/nomic-embed-text-v1.5',
+    'mxbai-embed-large': 'mixedbread-ai/mxbai-embed-large-v1',
+    'all-minilm': 'sentence-transformers/all-MiniLM-L6-v2',
+    'snowflake-arctic-embed': 'Snowflake/snowflake-arctic-embed-l',
+    'bge-m3': 'BAAI/bge-m3',
+}
+
+# Tokens kept free of text for special tokens ([CLS], [SEP], task prefixes)
+CONTEXT_RESERVED_TOKENS = 16
+
+
+def _base_model(model: str) -> str:
+    """'nomic-embed-text:latest' -> 'nomic-embed-text'"""
+    return model.split(':', 1)[0]
+
+
+def embed_context_tokens(model: str) -> Optional[int]:
+    """Context window of an embedding model in tokens, or None if unknown."""
+    return EMBED_CONTEXT_TOKENS.get(_base_model(model))
+
+
+class TextChunker:
+    """
+    Sentence-respecting chunker with overlap.
+
+    Usage:
+        chunker = TextChunker(chunk_size=500, overlap=50)
+        chunks = list(chunker.chunk_sentences(sentences))
+
+        # Token-sized, never longer than the model's context
+        chunker = TextChunker.for_model("nomic-embed-text", chunk_size=400, overlap=40)
+
+    A chunk is emitted when the next sentence would take it past chunk_size;
+    the next chunk starts with the last `overlap` units of the previous one.
+    A sentence longer than max_size is cut at word boundaries.
+    """
+
+    def __init__(self, chunk_size: int = 500, overlap: int = 50,
+                 count_tokens: Optional[Callable[[str], int]] = None,
+                 max_size: Optional[int] = None):
+        """
+        Initialize the chunker.
+
+        Args:
+            chunk_size: Target chunk size (words, or tokens with count_tokens)
+            overlap: Units repeated from the end of the previous chunk (0 for none)
+            count_tokens: Token count of a single word; None sizes in words
+            max_size: Hard limit on a chunk's size (default: none, a long
+                sentence becomes one oversized chunk)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if max_size is not None:
+            chunk_size = min(chunk_size, max_size)
+        self.chunk_size = chunk_size
+        self.overlap = max(0, min(overlap, chunk_size - 1))
+        self.max_size = max_size
+        self.unit = 'tokens' if count_tokens else 'words'
+
+        # Vocabulary repeats, so each distinct word is tokenized once
+        self._count_tokens = count_tokens
+        self._word_sizes: Dict[str, int] = {}
+
+    @classmethod
+    def for_model(cls, model: str, chunk_size: int = 500, overlap: int = 50,
+                  unit: str = 'tokens') -> 'TextChunker':
+        """
+        Chunker sized for an Ollama embedding model.
+
+        With unit='tokens', sizes are counted with the model's tokenizer and
+        chunks are capped at its context window. Falls back to words (with a
+        warning) if the tokenizer cannot be loaded.
+
+        Args:
+            model: Ollama embedding model name
+            chunk_size: Target chunk size in `unit`
+            overlap: Overlap in `unit`
+            unit: 'words' or 'tokens'
+
+        Raises:
+            ValueError: If unit is not 'words' or 'tokens'
+        """
+        if unit not in UNITS:
+            raise ValueError(f"Unknown chunk unit: {unit} (expected one of {UNITS})")
+        if unit == 'words':
+            return cls(chunk_size, overlap)
+
+        count_tokens = shared_token_counter(model)
+        if count_tokens is None:
+            return cls(chunk_size, overlap)
+
+        context = embed_context_tokens(model)
+        max_size = context - CONTEXT_RESERVED_TOKENS if context else None
+        if max_size and chunk_size > max_size:
+            logger.warning(f"Chunk size {chunk_size} exceeds {model}'s context; using {max_size} tokens")
+        return cls(chunk_size, overlap, count_tokens=count_tokens, max_size=max_size)
+
+    def size(self, text: str) -> int:
+        """Size of a text in this chunker's unit."""
+        words = text.split()
+        return sum(self._sizes(words)) if self._count_tokens else len(words)
+
+    def split(self, text: str, max_size: int) -> List[str]:
+        """
+        Cut a text at word boundaries into pieces of at most max_size units.
+
+        Args:
+            text: Whitespace-normalized text
+            max_size: Largest piece, in this chunker's unit
+
+        Returns:
+            The pieces in order (the text itself if it fits)
+        """
+        return [piece for piece, _, _ in self._pieces(text, max_size)]
+
+    def chunk_sentences(self, sentences: Iterable[str]) -> Iterator[str]:
+        """
+        Group sentences into chunks.
+
+        Args:
+            sentences: Sentences in order, whitespace-normalized (as
+                DocumentProcessor's sentence splitter produces them)
+
+        Yields:
+            Chunk texts, sentences joined by single spaces
+        """
+        parts: deque = deque()  # (text, size, per-word sizes or None) of the current chunk
+        total = 0
+
+        for sentence in sentences:
+            for part in self._pieces(sentence):
+                size = part[1]
+                if total + size > self.chunk_size and parts:
+                    yield ' '.join(text for text, _, _ in parts)
+                    # Keep the last `overlap` units, and no more than fit next to this piece
+                    keep = self.overlap
+                    if self.max_size is not None:
+                        keep = max(0, min(keep, self.max_size - size))
+                    total = self._trim_front(parts, total, keep)
+
+                parts.append(part)
+                total += size
+
+        if parts:
+            yield ' '.join(text for text, _, _ in parts)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _sizes(self, words: List[str]) -> List[int]:
+        """Token count of each word."""
+        cache = self._word_sizes
+        sizes = []
+        for word in words:
+            size = cache.get(word)
+            if size is None:
+                size = cache[word] = max(1, self._count_tokens(word))
+            sizes.append(size)
+        return sizes
+
+    def _pieces(self, sentence: str, limit: Optional[int] = None) -> List[Tuple[str, int, Optional[List[int]]]]:
+        """
+        A sentence as (text, size, per-word sizes), cut at word boundaries
+        into pieces of at most limit (default: max_size) if it is longer.
+        """
+        if limit is None:
+            limit = self.max_size
+        if self._count_tokens is None:
+            words = sentence.split()
+            if not words:
+                return []
+            if limit is None or len(words) <= limit:
+                return [(sentence, len(words), None)]
+            step = limit
+            return [(' '.join(words[i:i + step]), len(words[i:i + step]), None)
+                    for i in range(0, len(words), step)]
+
+        words = sentence.split()
+        sizes = self._sizes(words)
+        total = sum(sizes)
+        if not words:
+            return []
+        if limit is None or total <= limit:
+            return [(sentence, total, sizes)]
+
+        pieces = []
+        start, piece_total = 0, 0
+        for i, size in enumerate(sizes):
+            if piece_total + size > limit and i > start:
+                pieces.append((' '.join(words[start:i]), piece_total, sizes[start:i]))
+                start, piece_total = i, 0
+            piece_total += size
+        pieces.append((' '.join(words[start:]), piece_total, sizes[start:]))
+        return pieces
+
+    @staticmethod
+    def _trim_front(parts: deque, total: int, keep: int) -> int:
+        """
+        Drop whole sentences, then leading words of the first remaining one,
+        until at most `keep` units are left.
+
+        Returns:
+            Size of what is left
+        """
+        while parts and total - parts[0][1] >= keep:
+            total -= parts.popleft()[1]
+        if not parts or total <= keep:
+            return total
+
+        text, size, sizes = parts[0]
+        words = text.split()
+        if sizes is None:
+            cut = total - keep
+            parts[0] = (' '.join(words[cut:]), size - cut, None)
+            return keep
+
+        # Drop whole words until no more than `keep` tokens are left
+        cut = 0
+        while total > keep:
+            total -= sizes[cut]
+            cut += 1
+        parts[0] = (' '.join(words[cut:]), sum(sizes[cut:]), sizes[cut:])
+        return total
+
+
+# Process-wide token counters, one per model (None when unavailable)
+_shared: Dict[str, Optional[Callable[[str], int]]] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_token_counter(model: str) -> Optional[Callable[[str], int]]:
+    """
+    Get a word -> token count function for an embedding model, loading its
+    tokenizer on first use.
+
+    Needs the `tokenizers` package and the tokenizer files (downloaded from
+    Hugging Face once, then cached).
+
+    Args:
+        model: Ollama embedding model name
+
+    Returns:
+        The counter, or None if the tokenizer is unknown or cannot be loaded
+    """
+    key = _base_model(model)
+    with _shared_lock:
+        if key not in _shared:
+            _shared[key] = _load_token_counter(key)
+        return _shared[key]
+
+
+def _load_token_counter(model: str) -> Optional[Callable[[str], int]]:
+    name = EMBED_TOKENIZERS.get(model)
+    if name is None:
+        logger.warning(f"No known tokenizer for {model}; sizing chunks in words")
+        return None
+    try:
+        from tokenizers import Tokenizer
+    except ImportError:
+        logger.warning("Token-sized chunks need the tokenizers package (pip install tokenizers); "
+                       "sizing chunks in words")
+        return None
+    try:
+        tokenizer = Tokenizer.from_pretrained(name)
+    except Exception as e:
+        logger.warning(f"Failed to load tokenizer {name}: {e}; sizing chunks in words")
+        return None
+
+    def count_tokens(word: str) -> int:
+        return len(tokenizer.encode(word, add_special_tokens=False).ids)
+
+    return count_tokens
@@ -0,0 +1,342 @@
+"""
+Transcription Pool for Interview Whisperer
+
+Parallel Whisper transcription across worker processes. Each worker loads
+its own copy of the model (processes sidestep the GIL that Whisper's
+Python-side decode loop holds), chunks are tagged with sequence numbers,
+and a reorder stage releases results strictly in capture order.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# WORKER PROCESS
+# =============================================================================
+
+# Model loaded once per worker process by _init_worker
+_worker_model = None
+_worker_options: Dict[str, Any] = {}
+
+
+def _init_worker(model_name: str, device: Optional[str], language: str, fp16: bool, threads: int) -> None:
+    """Load the Whisper model in a worker process."""
+    global _worker_model, _worker_options
+
+    import torch
+    import whisper
+
+    # Split the CPU between workers instead of oversubscribing it
+    torch.set_num_threads(threads)
+
+    _worker_model = whisper.load_model(model_name, device=device)
+    _worker_options = {'language': language, 'fp16': fp16, 'verbose': False}
+
+
+def _warm_up() -> int:
+    """No-op task that forces a worker to start and load its model."""
+    return os.getpid()
+
+
+def _transcribe(audio: np.ndarray) -> Tuple[str, int, float]:
+    """
+    Transcribe one chunk in a worker process.
+
+    Returns:
+        Tuple of (text, worker pid, seconds spent decoding)
+    """
+    start = time.perf_counter()
+    result = _worker_model.transcribe(audio, **_worker_options)
+    return result['text'].strip(), os.getpid(), time.perf_counter() - start
+
+
+# =============================================================================
+# REORDER STAGE
+# =============================================================================
+
+class ReorderBuffer:
+    """
+    Releases sequence-numbered results in order.
+
+    Results may arrive in any order; each is held until every earlier
+    sequence number has been released.
+    """
+
+    def __init__(self, emit: Callable[[Any], None]):
+        """
+        Initialize the reorder buffer.
+
+        Args:
+            emit: Called with each result, in sequence order
+        """
+        self._emit = emit
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._next_assigned = 0
+        self._next_released = 0
+        self._pending: Dict[int, Any] = {}
+
+    def next_sequence(self) -> int:
+        """Allocate the next sequence number."""
+        with self._lock:
+            seq = self._next_assigned
+            self._next_assigned += 1
+            return seq
+
+    def put(self, seq: int, result: Any) -> None:
+        """
+        Add a result and release every result that is now in order.
+
+        Args:
+            seq: Sequence number from next_sequence()
+            result: Result to emit
+        """
+        with self._lock:
+            self._pending[seq] = result
+            while self._next_released in self._pending:
+                self._emit(self._pending.pop(self._next_released))
+                self._next_released += 1
+            self._released.notify_all()
+
+    def wait_until_drained(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every allocated sequence number has been released.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if drained, False on timeout
+        """
+        with self._lock:
+            return self._released.wait_for(
+                lambda: self._next_released == self._next_assigned, timeout=timeout
+            )
+
+    @property
+    def waiting(self) -> int:
+        """Number of results held back for an earlier sequence number."""
+        return len(self._pending)
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+class TranscriptionPool:
+    """
+    Pool of Whisper worker processes with in-order result delivery.
+
+    Usage:
+        pool = TranscriptionPool("small", workers=2, on_result=handle)
+        pool.submit(chunk)          # returns immediately (bounded in-flight)
+        # handle(chunk, text, decode_seconds) is called in submission order
+        pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        on_result: Callable[[Any, str, float], None],
+        workers: int = 2,
+        language: str = "en",
+        device: Optional[str] = None,
+        precision: str = "fp32",
+        sample_rate: int = 16000,
+        max_in_flight: Optional[int] = None
+    ):
+        """
+        Initialize the pool (worker processes start on warm_up or first submit).
+
+        Args:
+            model_name: Whisper model size loaded by every worker
+            on_result: Called with (chunk, text, decode seconds) in submission order
+            workers: Number of worker processes
+            language: Transcription language code
+            device: Torch device for the workers (None lets Whisper choose)
+            precision: "fp32" or "fp16"
+            sample_rate: Sample rate of submitted audio (for throughput stats)
+            max_in_flight: Chunks submitted but not finished before submit()
+                blocks (default: two per worker)
+        """
+        self.model_name = model_name
+        self.workers = workers
+        self.sample_rate = sample_rate
+        self._on_result = on_result
+        self._reorder = ReorderBuffer(self._release)
+        self._in_flight = threading.BoundedSemaphore(max_in_flight or workers * 2)
+
+        # Per-worker throughput (pid -> counters)
+        self._stats_lock = threading.Lock()
+        self._worker_stats: Dict[int, Dict[str, float]] = {}
+        self._failures = 0
+        self._warm_up_futures: List[Future] = []
+
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            # Spawn: forking a process that has torch/threads loaded is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_name, device, language, precision == "fp16", threads)
+        )
+
+    def warm_up(self) -> None:
+        """Start every worker so models load before the first chunk arrives."""
+        self._warm_up_futures = [self._executor.submit(_warm_up) for _ in range(self.workers)]
+
+    def status(self) -> str:
+        """Worker model status: "not_loaded", "loading", "ready" or "failed"."""
+        futures = self._warm_up_futures
+        if not futures:
+            return "not_loaded"
+        if any(f.done() and (f.cancelled() or f.exception() is not None) for f in futures):
+            return "failed"
+        return "ready" if all(f.done() for f in futures) else "loading"
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every worker to load its model (starts them if needed).
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if every worker is ready, False on timeout or load failure
+        """
+        if not self._warm_up_futures:
+            self.warm_up()
+        try:
+            for future in self._warm_up_futures:
+                future.result(timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def submit(self, chunk: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Queue a chunk for transcription.
+
+        Blocks while ``max_in_flight`` chunks are already being decoded, so
+        a slow pool pushes back on the caller instead of buffering forever.
+
+        Args:
+            chunk: AudioChunk (its ``audio`` is sent to a worker)
+            timeout: Maximum seconds to wait for an in-flight slot
+
+        Returns:
+            True if submitted, False on timeout
+
+        Raises:
+            Exception: Whatever the executor raises, e.g. BrokenProcessPool
+                after a worker died or failed to load its model (the chunk
+                is released as an empty result so later ones are not held)
+        """
+        if not self._in_flight.acquire(timeout=timeout):
+            return False
+
+        seq = self._reorder.next_sequence()
+        submitted_at = time.perf_counter()
+        try:
+            future = self._executor.submit(_transcribe, chunk.audio)
+        except Exception:
+            self._in_flight.release()
+            self._reorder.put(seq, (chunk, "", 0.0))
+            raise
+
+        future.add_done_callback(
+            lambda f: self._on_done(f, seq, chunk, submitted_at)
+        )
+        return True
+
+    def _on_done(self, future: Future, seq: int, chunk: Any, submitted_at: float) -> None:
+        """Record stats and hand the result to the reorder stage."""
+        self._in_flight.release()
+
+        text, busy = "", 0.0
+        if future.cancelled():
+            pass
+        elif future.exception() is not None:
+            self._failures += 1
+            logger.error(f"✗ Worker transcription failed: {future.exception()}")
+        else:
+            text, pid, busy = future.result()
+            audio_seconds = len(chunk.audio) / self.sample_rate
+            with self._stats_lock:
+                stats = self._worker_stats.setdefault(
+                    pid, {'chunks': 0, 'audio_seconds': 0.0, 'busy_seconds': 0.0, 'latency_seconds': 0.0}
+                )
+                stats['chunks'] += 1
+                stats['audio_seconds'] += audio_seconds
+                stats['busy_seconds'] += busy
+                stats['latency_seconds'] += time.perf_counter() - submitted_at
+
+        self._reorder.put(seq, (chunk, text, busy))
+
+    def wait_until_drained(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted chunk's result has been delivered.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if drained, False on timeout
+        """
+        return self._reorder.wait_until_drained(timeout)
+
+    def _release(self, item: Tuple[Any, str, float]) -> None:
+        """Deliver an in-order result to the caller."""
+        chunk, text, busy = item
+        try:
+            self._on_result(chunk, text, busy)
+        except Exception as e:
+            logger.error(f"✗ Transcription result handler failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with worker count, reorder backlog, failures and
+            per-worker throughput (chunks, audio seconds, real-time factor)
+        """
+        with self._stats_lock:
+            per_worker = {
+                pid: {
+                    'chunks': int(s['chunks']),
+                    'audio_seconds': round(s['audio_seconds'], 2),
+                    'busy_seconds': round(s['busy_seconds'], 2),
+                    # < 1.0 means the worker decodes faster than real time
+                    'realtime_factor': round(s['busy_seconds'] / s['audio_seconds'], 3) if s['audio_seconds'] else None,
+                    'avg_latency': round(s['latency_seconds'] / s['chunks'], 3) if s['chunks'] else None
+                }
+                for pid, s in self._worker_stats.items()
+            }
+
+        return {
+            'workers': self.workers,
+            'model': self.model_name,
+            'reorder_waiting': self._reorder.waiting,
+            'failures': self._failures,
+            'per_worker': per_worker
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop the worker processes.
+
+        Args:
+            wait: Wait for in-flight chunks to finish first
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -0,0 +1,236 @@
+"""
+Voice Activity Detection for Interview Whisperer
+
+Frame-level speech detection and utterance endpointing. Features are
+computed for all frames of a block at once (no per-sample Python loops):
+
+- Energy: RMS per frame, compared against the silence threshold
+- Zero-crossing rate: fraction of sign changes per frame
+- Spectral flatness: geometric / arithmetic mean of the power spectrum
+  (close to 1 for broadband noise, close to 0 for voiced speech)
+
+A frame is speech when it is loud enough and not noise-like. Noise-like
+means flat spectrum *and* high zero-crossing rate, so unvoiced consonants
+(flat but short) are bridged by the trailing-silence hangover.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class VADSegmenter:
+    """
+    Endpointing segmenter that turns a sample stream into utterances.
+
+    An utterance starts at the first speech frame (plus a short pre-roll)
+    and ends once ``silence_duration`` seconds of non-speech follow it.
+    Utterances are copied out of a preallocated buffer, so ``process`` can
+    be fed zero-copy views of the capture ring buffer.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        silence_threshold: float = 0.01,
+        silence_duration: float = 1.5,
+        frame_duration: float = 0.02,
+        max_flatness: float = 0.4,
+        max_zcr: float = 0.35,
+        min_speech_duration: float = 0.25,
+        pre_roll: float = 0.3,
+        max_utterance_duration: float = 30.0
+    ):
+        """
+        Initialize the segmenter.
+
+        Args:
+            sample_rate: Audio sample rate in Hz
+            silence_threshold: Minimum frame RMS for speech
+            silence_duration: Seconds of trailing silence that end an utterance
+            frame_duration: Analysis frame length in seconds
+            max_flatness: Spectral flatness above which a frame may be noise
+            max_zcr: Zero-crossing rate above which a flat frame is noise
+            min_speech_duration: Utterances with less speech are discarded
+            pre_roll: Seconds of audio kept before the first speech frame
+            max_utterance_duration: Utterances are force-cut at this length
+                (Whisper decodes at most 30 seconds at a time)
+        """
+        self.sample_rate = sample_rate
+        self.silence_threshold = silence_threshold
+        self.max_flatness = max_flatness
+        self.max_zcr = max_zcr
+
+        self.frame_length = int(sample_rate * frame_duration)
+        self.silence_frames = max(1, int(round(silence_duration / frame_duration)))
+        self.min_speech_frames = max(1, int(round(min_speech_duration / frame_duration)))
+        self.pre_roll_frames = int(round(pre_roll / frame_duration))
+        self.max_frames = int(max_utterance_duration / frame_duration)
+
+        # Preallocated utterance buffer, plus the Hann window for the FFT
+        self._utterance = np.zeros(self.max_frames * self.frame_length, dtype=np.float32)
+        self._window = np.hanning(self.frame_length).astype(np.float32)
+
+        self.utterances_emitted = 0
+        self.forced_cuts = 0
+        self.reset()
+
+    @property
+    def in_speech(self) -> bool:
+        """True while an utterance is open."""
+        return self._speech_frames > 0
+
+    def reset(self) -> None:
+        """Drop any partially collected utterance and buffered samples."""
+        self._reset_utterance()
+        self._remainder = np.zeros(0, dtype=np.float32)
+
+    def _reset_utterance(self) -> None:
+        """Start collecting a new utterance (pre-roll included)."""
+        self._length = 0  # Frames in the utterance buffer
+        self._speech_frames = 0
+        self._trailing_silence = 0
+
+    def speech_mask(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Classify whole frames of ``audio`` as speech or non-speech.
+
+        Args:
+            audio: 1-D float32 samples (trailing partial frame is ignored)
+
+        Returns:
+            Boolean array with one entry per frame
+        """
+        n_frames = len(audio) // self.frame_length
+        if n_frames == 0:
+            return np.zeros(0, dtype=bool)
+
+        frames = audio[:n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+
+        # Energy
+        rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / self.frame_length)
+
+        # Zero-crossing rate
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (self.frame_length - 1)
+
+        # Spectral flatness
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2 + 1e-12
+        flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+
+        noise_like = (flatness > self.max_flatness) & (zcr > self.max_zcr)
+        return (rms > self.silence_threshold) & ~noise_like
+
+    def contains_speech(self, audio: np.ndarray) -> bool:
+        """
+        Check whether a block holds at least ``min_speech_duration`` of speech.
+
+        Args:
+            audio: 1-D float32 samples
+
+        Returns:
+            True if enough speech frames are present
+        """
+        return int(np.count_nonzero(self.speech_mask(audio))) >= self.min_speech_frames
+
+    def process(self, audio: np.ndarray) -> List[Tuple[np.ndarray, bool]]:
+        """
+        Feed samples and collect finished utterances.
+
+        Args:
+            audio: 1-D float32 samples (may be a view; it is copied here)
+
+        Returns:
+            List of (utterance, endpointed) pairs, usually empty or one.
+            endpointed is False for an utterance force-cut at
+            ``max_utterance_duration`` while the speaker was still talking.
+        """
+        if len(self._remainder):
+            audio = np.concatenate((self._remainder, audio))
+
+        n_frames = len(audio) // self.frame_length
+        self._remainder = audio[n_frames * self.frame_length:].copy()
+        if n_frames == 0:
+            return []
+
+        mask = self.speech_mask(audio)
+        frames = audio[:n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+
+        utterances = []
+        for frame, is_speech in zip(frames, mask):
+            finished = self._push_frame(frame, bool(is_speech))
+            if finished is not None:
+                utterances.append(finished)
+        return utterances
+
+    def flush(self) -> List[Tuple[np.ndarray, bool]]:
+        """
+        Emit the open utterance, if any (end of stream).
+
+        Returns:
+            List with zero or one (utterance, endpointed) pair; the end of
+            the stream ends the utterance, so it counts as endpointed
+        """
+        utterances = []
+        if self._speech_frames >= self.min_speech_frames:
+            utterances.append((self._emit(), True))
+        self.reset()
+        return utterances
+
+    def _push_frame(self, frame: np.ndarray, is_speech: bool) -> Optional[Tuple[np.ndarray, bool]]:
+        """
+        Advance the endpointing state machine by one frame.
+
+        Returns:
+            A finished (utterance, endpointed) pair, or None
+        """
+        self._append(frame)
+
+        if not self.in_speech and not is_speech:
+            # Keep a short pre-roll so word onsets are not clipped
+            if self._length > self.pre_roll_frames:
+                self._drop_front(self._length - self.pre_roll_frames)
+            return None
+
+        if is_speech:
+            self._speech_frames += 1
+            self._trailing_silence = 0
+        else:
+            self._trailing_silence += 1
+
+        if self._trailing_silence >= self.silence_frames:
+            if self._speech_frames >= self.min_speech_frames:
+                return self._emit(), True
+            # Too little speech (click, cough): discard it
+            self._reset_utterance()
+            return None
+
+        if self._length >= self.max_frames:
+            # The speaker is still talking: the utterance continues in the next one
+            self.forced_cuts += 1
+            return self._emit(), False
+
+        return None
+
+    def _append(self, frame: np.ndarray) -> None:
+        """Copy one frame into the utterance buffer."""
+        start = self._length * self.frame_length
+        self._utterance[start:start + self.frame_length] = frame
+        self._length += 1
+
+    def _drop_front(self, n: int) -> None:
+        """Drop the first ``n`` frames of the (pre-roll) buffer."""
+        keep = (self._length - n) * self.frame_length
+        start = n * self.frame_length
+        self._utterance[:keep] = self._utterance[start:start + keep]
+        self._length -= n
+
+    def _emit(self) -> np.ndarray:
+        """Copy out the current utterance, keeping a little trailing silence."""
+        keep_silence = min(self._trailing_silence, self.pre_roll_frames)
+        frames = self._length - self._trailing_silence + keep_silence
+        utterance = self._utterance[:frames * self.frame_length].copy()
+
+        self.utterances_emitted += 1
+        self._reset_utterance()
+        return utterance
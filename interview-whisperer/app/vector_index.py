@@ -0,0 +1,328 @@
+"""
+Vector Index for Interview Whisperer
+
+Brute-force nearest-neighbour search over a memory-mapped NumPy matrix.
+A single user's documents are hundreds to a few thousand chunks, where
+one matrix-vector product beats a ChromaDB query (no client round trip,
+no HNSW graph, no SQLite reads) and the OS page cache keeps the matrix
+resident across restarts.
+
+Files (in one directory, next to the Chroma database):
+- vectors.npy: normalized embeddings, one row per chunk (float32 or float16)
+- chunks.json: IDs, texts, metadata and the dtype, in row order
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DTYPES = ('float32', 'float16')
+
+
+class NumpyVectorIndex:
+    """
+    Cosine-similarity index over a memory-mapped embedding matrix.
+
+    Usage:
+        index = shared_vector_index(DATA_DIR / "vector_index")
+        index.add(ids, embeddings, documents, metadatas)     # at ingest time
+        index.query(question_embedding, n_results=3)
+
+    Writes rewrite both files atomically; readers keep their mapping of
+    the previous file until they notice the change (modification time)
+    on their next query. add(save=False) stages chunks for one rewrite on
+    flush(), so a document added in batches costs a single matrix copy.
+    """
+
+    # Rows upcast at once when scoring a float16 matrix
+    SCORE_BLOCK_ROWS = 4096
+
+    def __init__(self, path: Union[str, Path], dtype: str = "float32"):
+        """
+        Initialize the index and map it from disk if present.
+
+        Args:
+            path: Directory for vectors.npy and chunks.json
+            dtype: Storage type for new writes ("float32", or "float16" to
+                halve memory at a small precision and speed cost)
+
+        Raises:
+            ValueError: If the dtype is not supported
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported vector dtype: {dtype}")
+
+        self.path = Path(path)
+        self.dtype = dtype
+
+        self._lock = threading.RLock()
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=dtype)
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._mtime = 0.0
+        # Batches from add(save=False): (ids, normalized vectors, documents, metadatas)
+        self._staged: List[Tuple[List[str], np.ndarray, List[str], List[Dict[str, Any]]]] = []
+
+        self._load()
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.path / "vectors.npy"
+
+    @property
+    def _chunks_path(self) -> Path:
+        return self.path / "chunks.json"
+
+    def count(self) -> int:
+        """Number of indexed chunks."""
+        return len(self._ids)
+
+    def add(self, ids: Sequence[str], embeddings: Sequence[Sequence[float]],
+            documents: Sequence[str], metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+            save: bool = True) -> None:
+        """
+        Add or replace chunks.
+
+        Args:
+            ids: Chunk IDs (the same IDs stored in ChromaDB)
+            embeddings: One embedding per chunk
+            documents: Chunk texts
+            metadatas: Optional metadata per chunk
+            save: Write the files now; False stages the chunks (as float32
+                rows, not yet queryable) until flush()
+        """
+        if len(ids):
+            vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+            metadatas = metadatas or [{} for _ in ids]
+            with self._lock:
+                self._staged.append((list(ids), vectors, list(documents), [dict(m or {}) for m in metadatas]))
+        if save:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write staged chunks: one matrix copy and one rewrite of both files."""
+        with self._lock:
+            if not self._staged:
+                return
+            staged, self._staged = self._staged, []
+            ids = [doc_id for batch in staged for doc_id in batch[0]]
+            vectors = np.vstack([batch[1] for batch in staged])
+            documents = [text for batch in staged for text in batch[2]]
+            metadatas = [metadata for batch in staged for metadata in batch[3]]
+
+            # An ID staged twice keeps its last version
+            last = {doc_id: row for row, doc_id in enumerate(ids)}
+            if len(last) != len(ids):
+                rows = sorted(last.values())
+                ids = [ids[i] for i in rows]
+                vectors = vectors[rows]
+                documents = [documents[i] for i in rows]
+                metadatas = [metadatas[i] for i in rows]
+
+            self.reload_if_changed()
+            keep = self._rows_without(set(ids))
+            matrix = np.asarray(self._matrix, dtype=np.float32)[keep] if len(self._ids) else None
+            if matrix is not None and matrix.shape[1] != vectors.shape[1]:
+                logger.warning("Embedding dimension changed; rebuilding vector index")
+                keep, matrix = [], None
+
+            self._ids = [self._ids[i] for i in keep] + ids
+            self._documents = [self._documents[i] for i in keep] + documents
+            self._metadatas = [self._metadatas[i] for i in keep] + metadatas
+            self._save(vectors if matrix is None else np.vstack([matrix, vectors]))
+
+    def delete(self, ids: Sequence[str]) -> None:
+        """
+        Remove chunks (unknown IDs are ignored).
+
+        Args:
+            ids: Chunk IDs
+        """
+        ids = set(ids)
+        with self._lock:
+            self._staged = [self._staged_without(batch, ids) for batch in self._staged]
+            self.reload_if_changed()
+            keep = self._rows_without(ids)
+            if len(keep) == len(self._ids):
+                return
+            matrix = np.asarray(self._matrix, dtype=np.float32)[keep]
+            self._ids = [self._ids[i] for i in keep]
+            self._documents = [self._documents[i] for i in keep]
+            self._metadatas = [self._metadatas[i] for i in keep]
+            self._save(matrix)
+
+    def clear(self) -> None:
+        """Remove every chunk."""
+        with self._lock:
+            self._staged = []
+            self._ids, self._documents, self._metadatas = [], [], []
+            self._save(np.zeros((0, 0), dtype=np.float32))
+
+    def query(self, embedding: Sequence[float], n_results: int = 3) -> List[Dict[str, Any]]:
+        """
+        Find the most similar chunks.
+
+        Args:
+            embedding: Query embedding
+            n_results: Number of results
+
+        Returns:
+            List of dictionaries, most similar first, with keys id, text,
+            metadata and score (cosine similarity clipped to 0-1)
+        """
+        self.reload_if_changed()
+        with self._lock:
+            matrix, ids = self._matrix, self._ids
+            documents, metadatas = self._documents, self._metadatas
+
+        if not ids:
+            return []
+        query = _normalize_rows(np.asarray(embedding, dtype=np.float32)[None, :])[0]
+        if query.shape[0] != matrix.shape[1]:
+            logger.warning("Query embedding dimension does not match the vector index")
+            return []
+
+        if matrix.dtype == np.float32:
+            scores = matrix @ query
+        else:
+            # NumPy has no BLAS path for float16; upcast a block at a time
+            scores = np.concatenate([
+                np.asarray(matrix[start:start + self.SCORE_BLOCK_ROWS], dtype=np.float32) @ query
+                for start in range(0, len(ids), self.SCORE_BLOCK_ROWS)
+            ])
+        k = min(n_results, len(ids))
+        # Top k in O(n), then sort only those k
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            {
+                'id': ids[i],
+                'text': documents[i],
+                'metadata': metadatas[i],
+                'score': float(max(0.0, min(1.0, scores[i])))
+            }
+            for i in top
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with chunk count, dimension, dtype and matrix bytes
+        """
+        with self._lock:
+            return {
+                'chunks': len(self._ids),
+                'dimension': int(self._matrix.shape[1]) if len(self._ids) else 0,
+                'dtype': str(self._matrix.dtype),
+                'matrix_bytes': int(self._matrix.nbytes)
+            }
+
+    def reload_if_changed(self) -> None:
+        """Remap the files if another process (or instance) rewrote them."""
+        try:
+            mtime = os.stat(self._chunks_path).st_mtime
+        except OSError:
+            return
+        if mtime != self._mtime:
+            with self._lock:
+                self._load()
+
+    # -------------------------------------------------------------------------
+    # Internals (lock held)
+    # -------------------------------------------------------------------------
+
+    def _rows_without(self, ids: set) -> List[int]:
+        return [i for i, doc_id in enumerate(self._ids) if doc_id not in ids]
+
+    @staticmethod
+    def _staged_without(batch: Tuple[List[str], np.ndarray, List[str], List[Dict[str, Any]]],
+                        ids: set) -> Tuple[List[str], np.ndarray, List[str], List[Dict[str, Any]]]:
+        batch_ids, vectors, documents, metadatas = batch
+        rows = [i for i, doc_id in enumerate(batch_ids) if doc_id not in ids]
+        if len(rows) == len(batch_ids):
+            return batch
+        return [batch_ids[i] for i in rows], vectors[rows], [documents[i] for i in rows], [metadatas[i] for i in rows]
+
+    def _load(self) -> None:
+        """Map the matrix and read the sidecar (missing or corrupt files start empty)."""
+        if not self._chunks_path.exists() or not self._vectors_path.exists():
+            return
+        try:
+            mtime = os.stat(self._chunks_path).st_mtime
+            with open(self._chunks_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+            ids = sidecar['ids']
+            matrix = np.load(self._vectors_path, mmap_mode='r') if ids else np.zeros((0, 0), dtype=self.dtype)
+            if len(ids) != len(matrix):
+                raise ValueError("chunk and vector counts differ")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable vector index {self.path}: {e}")
+            return
+
+        self._matrix = matrix
+        self._ids = ids
+        self._documents = sidecar['documents']
+        self._metadatas = sidecar['metadatas']
+        self._mtime = mtime
+
+    def _save(self, matrix: np.ndarray) -> None:
+        """Write both files atomically (temp file + rename), then remap."""
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            vectors_tmp = self.path / "vectors.npy.tmp"
+            with open(vectors_tmp, 'wb') as f:
+                np.save(f, matrix.astype(self.dtype, copy=False))
+            chunks_tmp = self.path / "chunks.json.tmp"
+            with open(chunks_tmp, 'w', encoding='utf-8') as f:
+                json.dump({'dtype': self.dtype, 'ids': self._ids, 'documents': self._documents,
+                           'metadatas': self._metadatas}, f)
+            os.replace(vectors_tmp, self._vectors_path)
+            os.replace(chunks_tmp, self._chunks_path)
+        except OSError as e:
+            logger.error(f"Failed to write vector index: {e}")
+            self._matrix = matrix.astype(self.dtype, copy=False)
+            return
+        self._load()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length, so a dot product is the cosine similarity."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+# Process-wide indexes, one per directory
+_shared: Dict[str, NumpyVectorIndex] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_vector_index(path: Union[str, Path], dtype: str = "float32") -> NumpyVectorIndex:
+    """
+    Get the process-wide index for a directory, mapping it on first use.
+
+    Args:
+        path: Index directory
+        dtype: Storage type (used only when the index is created)
+
+    Returns:
+        The shared NumpyVectorIndex
+    """
+    key = str(Path(path).resolve())
+    with _shared_lock:
+        index = _shared.get(key)
+        if index is None:
+            index = NumpyVectorIndex(path, dtype=dtype)
+            _shared[key] = index
+        return index